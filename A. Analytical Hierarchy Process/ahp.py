@@ -1,48 +1,22 @@
 import sys
-import json
+import time
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QTableWidget, QTableWidgetItem, QPushButton, 
+                             QLabel, QPushButton, 
                              QFileDialog, QMessageBox, QTabWidget, QLineEdit, 
                              QComboBox, QSpinBox, QTextEdit)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
-class AHPCalculator:
-    @staticmethod
-    def calculate_ahp(criteria_matrix, alternative_matrices):
-        # Hitung bobot kriteria
-        criteria_weights = AHPCalculator.calculate_weights(criteria_matrix)
-        
-        # Hitung bobot untuk setiap alternatif pada setiap kriteria
-        alternative_weights = []
-        for matrix in alternative_matrices:
-            weights = AHPCalculator.calculate_weights(matrix)
-            alternative_weights.append(weights)
-        
-        # Hitung skor akhir
-        final_scores = np.zeros(len(alternative_weights[0]))
-        for i, crit_weight in enumerate(criteria_weights):
-            for j, alt_weight in enumerate(alternative_weights[i]):
-                final_scores[j] += crit_weight * alt_weight
-        
-        return criteria_weights, alternative_weights, final_scores
-    
-    @staticmethod
-    def calculate_weights(matrix):
-        # Normalisasi matriks
-        normalized = matrix / matrix.sum(axis=0)
-        
-        # Hitung rata-rata setiap baris
-        weights = normalized.mean(axis=1)
-        
-        # Hitung consistency ratio
-        n = matrix.shape[0]
-        lambda_max = (matrix @ weights / weights).mean()
-        ci = (lambda_max - n) / (n - 1)
-        ri = {1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49}
-        cr = ci / ri.get(n, 1.49)
-        
-        return weights, cr
+from ahp_engine import MAX_MATRIX_SIZE, resize_matrix
+from ahp_incremental import IncrementalAHP, WeightCache
+from pairwise_grid import PairwiseGrid
+from ahp_project import AHPProject, BINARY_EXTENSION, read_project, write_project
+
+# Filter dialog file proyek: JSON lama dan format biner .ahpb
+PROJECT_FILTER = "JSON Files (*.json);;Proyek AHP Biner (*.ahpb);;All Files (*)"
+
+# Jeda (ms) sebelum perubahan jumlah kriteria/alternatif diterapkan
+COUNT_DEBOUNCE_MS = 300
 
 class CriteriaTab(QWidget):
     def __init__(self, parent=None):
@@ -52,12 +26,20 @@ class CriteriaTab(QWidget):
         
         self.criteria_count = 0
         self.alternative_count = 0
-        
-        # Input jumlah kriteria dan alternatif
+        # Matriks kriteria terbesar yang pernah diisi
+        self.stored_matrix = np.ones((0, 0))
+        
+        # Input jumlah kriteria dan alternatif; perubahan spin box ditunda sampai
+        # pengguna berhenti mengubah nilai
+        self.count_timer = QTimer(self)
+        self.count_timer.setSingleShot(True)
+        self.count_timer.setInterval(COUNT_DEBOUNCE_MS)
+        self.count_timer.timeout.connect(self.apply_counts)
         self.setup_input_section()
         
         # Tabel perbandingan kriteria
-        self.criteria_table = QTableWidget()
+        self.criteria_table = PairwiseGrid("Kriteria")
+        self.criteria_table.pairwise_model.comparisonChanged.connect(self.comparison_changed)
         self.layout.addWidget(self.criteria_table)
         
         # Tombol hitung
@@ -79,8 +61,8 @@ class CriteriaTab(QWidget):
         criteria_layout.addWidget(QLabel("Jumlah Kriteria:"))
         self.criteria_spin = QSpinBox()
         self.criteria_spin.setMinimum(2)
-        self.criteria_spin.setMaximum(10)
-        self.criteria_spin.valueChanged.connect(self.update_criteria_count)
+        self.criteria_spin.setMaximum(MAX_MATRIX_SIZE)
+        self.criteria_spin.valueChanged.connect(lambda _: self.count_timer.start())
         criteria_layout.addWidget(self.criteria_spin)
         input_layout.addLayout(criteria_layout)
         
@@ -89,76 +71,73 @@ class CriteriaTab(QWidget):
         alternative_layout.addWidget(QLabel("Jumlah Alternatif:"))
         self.alternative_spin = QSpinBox()
         self.alternative_spin.setMinimum(2)
-        self.alternative_spin.setMaximum(10)
-        self.alternative_spin.valueChanged.connect(self.update_alternative_count)
+        self.alternative_spin.setMaximum(MAX_MATRIX_SIZE)
+        self.alternative_spin.valueChanged.connect(lambda _: self.count_timer.start())
         alternative_layout.addWidget(self.alternative_spin)
         input_layout.addLayout(alternative_layout)
         
+        # Pilihan metode prioritas
+        method_layout = QVBoxLayout()
+        method_layout.addWidget(QLabel("Metode Prioritas:"))
+        self.method_combo = QComboBox()
+        self.method_combo.addItem("Normalisasi (Aproksimasi)", "approximate")
+        self.method_combo.addItem("Eigenvector Utama", "eigenvector")
+        self.method_combo.addItem("Rata-rata Geometrik", "geometric")
+        self.method_combo.currentIndexChanged.connect(self.update_method)
+        method_layout.addWidget(self.method_combo)
+        input_layout.addLayout(method_layout)
+        
         self.layout.addLayout(input_layout)
     
-    def update_criteria_count(self):
-        self.criteria_count = self.criteria_spin.value()
+    def apply_counts(self):
+        # Terapkan nilai spin box terakhir (juga dipanggil langsung untuk melewati jeda)
+        self.count_timer.stop()
+        criteria_count = self.criteria_spin.value()
+        alternative_count = self.alternative_spin.value()
+        if (criteria_count, alternative_count) == (self.criteria_count, self.alternative_count):
+            return
+        self.criteria_count = criteria_count
+        self.alternative_count = alternative_count
         self.setup_criteria_table()
         self.parent.update_tabs()
     
-    def update_alternative_count(self):
-        self.alternative_count = self.alternative_spin.value()
-        self.parent.update_tabs()
+    def set_counts(self, criteria_count, alternative_count):
+        self.criteria_spin.setValue(criteria_count)
+        self.alternative_spin.setValue(alternative_count)
+        self.apply_counts()
+    
+    def update_method(self):
+        if self.parent.hierarchy is not None:
+            self.parent.hierarchy.set_method(self.method_combo.currentData())
+            self.parent.update_cache_status()
     
     def setup_criteria_table(self):
-        self.criteria_table.clear()
-        self.criteria_table.setRowCount(self.criteria_count)
-        self.criteria_table.setColumnCount(self.criteria_count + 1)
-        
-        # Set header
-        headers = ["Kriteria"] + [f"Kriteria {i+1}" for i in range(self.criteria_count)]
-        self.criteria_table.setHorizontalHeaderLabels(headers)
-        
-        # Set kriteria names
-        for i in range(self.criteria_count):
-            item = QTableWidgetItem(f"Kriteria {i+1}")
-            self.criteria_table.setItem(i, 0, item)
-            
-            # Set diagonal to 1
-            diag_item = QTableWidgetItem("1")
-            diag_item.setFlags(Qt.ItemIsEnabled)
-            self.criteria_table.setItem(i, i+1, diag_item)
-            
-            # Setup other cells
-            for j in range(self.criteria_count):
-                if i != j:
-                    combo = QComboBox()
-                    values = ["1/9", "1/8", "1/7", "1/6", "1/5", "1/4", "1/3", "1/2", "1", 
-                             "2", "3", "4", "5", "6", "7", "8", "9"]
-                    combo.addItems(values)
-                    combo.setCurrentIndex(8)  # Default to 1
-                    self.criteria_table.setCellWidget(i, j+1, combo)
+        # Perbandingan yang sudah diisi dipertahankan saat ukuran berubah; perbandingan
+        # kriteria yang dihapus disimpan di stored_matrix dan kembali utuh jika jumlah
+        # kriteria dinaikkan lagi
+        model = self.criteria_table.pairwise_model
+        n = len(model.matrix)
+        if n >= len(self.stored_matrix):
+            self.stored_matrix = model.matrix.copy()
+        else:
+            self.stored_matrix[:n, :n] = model.matrix
+        model.set_matrix(resize_matrix(self.stored_matrix, self.criteria_count))
+    
+    def read_matrix(self):
+        return self.criteria_table.pairwise_model.matrix.copy()
+    
+    def comparison_changed(self, i, j, value):
+        # Perbarui bobot secara inkremental untuk satu pasangan a_ij / a_ji
+        if self.parent.hierarchy is not None:
+            self.parent.hierarchy.set_criteria_comparison(i, j, value)
     
     def calculate_criteria_weights(self):
         try:
-            # Build matrix
-            matrix = np.ones((self.criteria_count, self.criteria_count))
-            
-            for i in range(self.criteria_count):
-                for j in range(self.criteria_count):
-                    if i == j:
-                        continue
-                    elif i < j:
-                        # Get value from combo box
-                        combo = self.criteria_table.cellWidget(i, j+1)
-                        value_str = combo.currentText()
-                        
-                        if '/' in value_str:
-                            num, denom = map(float, value_str.split('/'))
-                            value = num / denom
-                        else:
-                            value = float(value_str)
-                            
-                        matrix[i, j] = value
-                        matrix[j, i] = 1 / value
-            
-            # Calculate weights
-            weights, cr = AHPCalculator.calculate_weights(matrix)
+            # Ambil bobot dari state inkremental
+            criteria = self.parent.hierarchy.criteria
+            matrix = criteria.matrix.copy()
+            weights = criteria.weights.copy()
+            cr = criteria.cr
             
             # Display results
             result_text = "Bobot Kriteria:\n"
@@ -190,7 +169,8 @@ class AlternativeTab(QWidget):
         self.label = QLabel(f"Perbandingan Alternatif untuk Kriteria {crit_index+1}")
         self.layout.addWidget(self.label)
         
-        self.alternative_table = QTableWidget()
+        self.alternative_table = PairwiseGrid("Alternatif")
+        self.alternative_table.pairwise_model.comparisonChanged.connect(self.comparison_changed)
         self.setup_alternative_table()
         self.layout.addWidget(self.alternative_table)
         
@@ -206,62 +186,24 @@ class AlternativeTab(QWidget):
         self.setLayout(self.layout)
     
     def setup_alternative_table(self):
-        alt_count = self.parent.criteria_tab.alternative_count
-        self.alternative_table.clear()
-        self.alternative_table.setRowCount(alt_count)
-        self.alternative_table.setColumnCount(alt_count + 1)
-        
-        # Set header
-        headers = ["Alternatif"] + [f"Alt {i+1}" for i in range(alt_count)]
-        self.alternative_table.setHorizontalHeaderLabels(headers)
-        
-        # Set alternatif names
-        for i in range(alt_count):
-            item = QTableWidgetItem(f"Alternatif {i+1}")
-            self.alternative_table.setItem(i, 0, item)
-            
-            # Set diagonal to 1
-            diag_item = QTableWidgetItem("1")
-            diag_item.setFlags(Qt.ItemIsEnabled)
-            self.alternative_table.setItem(i, i+1, diag_item)
-            
-            # Setup other cells
-            for j in range(alt_count):
-                if i != j:
-                    combo = QComboBox()
-                    values = ["1/9", "1/8", "1/7", "1/6", "1/5", "1/4", "1/3", "1/2", "1", 
-                             "2", "3", "4", "5", "6", "7", "8", "9"]
-                    combo.addItems(values)
-                    combo.setCurrentIndex(8)  # Default to 1
-                    self.alternative_table.setCellWidget(i, j+1, combo)
+        # Isi tabel dari state hierarki (sumber data untuk tab yang belum pernah dibuka)
+        matrix = self.parent.hierarchy.alternatives[self.crit_index].matrix
+        self.alternative_table.pairwise_model.set_matrix(matrix)
+    
+    def read_matrix(self):
+        return self.alternative_table.pairwise_model.matrix.copy()
+    
+    def comparison_changed(self, i, j, value):
+        # Perbarui bobot dan skor akhir secara inkremental untuk satu pasangan a_ij / a_ji
+        self.parent.hierarchy.set_alternative_comparison(self.crit_index, i, j, value)
     
     def calculate_alternative_weights(self):
         try:
-            alt_count = self.parent.criteria_tab.alternative_count
-            
-            # Build matrix
-            matrix = np.ones((alt_count, alt_count))
-            
-            for i in range(alt_count):
-                for j in range(alt_count):
-                    if i == j:
-                        continue
-                    elif i < j:
-                        # Get value from combo box
-                        combo = self.alternative_table.cellWidget(i, j+1)
-                        value_str = combo.currentText()
-                        
-                        if '/' in value_str:
-                            num, denom = map(float, value_str.split('/'))
-                            value = num / denom
-                        else:
-                            value = float(value_str)
-                            
-                        matrix[i, j] = value
-                        matrix[j, i] = 1 / value
-            
-            # Calculate weights
-            weights, cr = AHPCalculator.calculate_weights(matrix)
+            # Ambil bobot dari state inkremental
+            alternative = self.parent.hierarchy.alternatives[self.crit_index]
+            matrix = alternative.matrix.copy()
+            weights = alternative.weights.copy()
+            cr = alternative.cr
             
             # Display results
             result_text = f"Bobot Alternatif untuk Kriteria {self.crit_index+1}:\n"
@@ -276,14 +218,6 @@ class AlternativeTab(QWidget):
             
             self.results_label.setText(result_text)
             
-            # Save to parent
-            if not hasattr(self.parent, 'alternative_matrices'):
-                self.parent.alternative_matrices = []
-            if len(self.parent.alternative_matrices) <= self.crit_index:
-                self.parent.alternative_matrices.append(matrix)
-            else:
-                self.parent.alternative_matrices[self.crit_index] = matrix
-            
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Terjadi kesalahan dalam perhitungan: {str(e)}")
 
@@ -310,32 +244,16 @@ class ResultsTab(QWidget):
     
     def calculate_final_scores(self):
         try:
-            if not hasattr(self.parent, 'criteria_weights') or not hasattr(self.parent, 'alternative_matrices'):
+            hierarchy = self.parent.hierarchy
+            if hierarchy is None:
                 QMessageBox.warning(self, "Peringatan", "Harap hitung bobot kriteria dan alternatif terlebih dahulu!")
                 return
             
-            # Get all alternative matrices
-            alternative_matrices = []
-            for i in range(len(self.parent.alternative_matrices)):
-                if i < len(self.parent.alternative_matrices):
-                    alternative_matrices.append(self.parent.alternative_matrices[i])
-                else:
-                    # If not calculated, create identity matrix
-                    alt_count = self.parent.criteria_tab.alternative_count
-                    alternative_matrices.append(np.ones((alt_count, alt_count)))
-            
-            # Calculate final scores
-            criteria_weights = self.parent.criteria_weights
-            alternative_weights = []
-            for matrix in alternative_matrices:
-                weights, _ = AHPCalculator.calculate_weights(matrix)
-                alternative_weights.append(weights)
-            
-            final_scores = np.zeros(len(alternative_weights[0]))
-            for i, crit_weight in enumerate(criteria_weights):
-                for j, alt_weight in enumerate(alternative_weights[i]):
-                    final_scores[j] += crit_weight * alt_weight
-            
+            # Skor akhir sudah diperbarui setiap kali perbandingan berubah
+            criteria_weights = hierarchy.criteria_weights
+            alternative_weights = hierarchy.alternative_weights
+            final_scores = hierarchy.final_scores
+
             # Display results
             result_text = "HASIL AKHIR PERHITUNGAN AHP\n\n"
             result_text += "Bobot Kriteria:\n"
@@ -372,6 +290,12 @@ class AHPMainWindow(QMainWindow):
         self.criteria_matrix = None
         self.criteria_weights = None
         self.alternative_matrices = []
+        self.hierarchy = None
+        self.weight_cache = WeightCache()
+        
+        # Tab alternatif dibangun saat pertama dibuka lalu disimpan per indeks kriteria
+        self.alternative_tab_cache = {}
+        self.tab_build_times = []
         
         # Setup UI
         self.init_ui()
@@ -391,15 +315,20 @@ class AHPMainWindow(QMainWindow):
         
         # Create tab widget
         self.tab_widget = QTabWidget()
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
         main_layout.addWidget(self.tab_widget)
         
         # Add criteria tab
         self.criteria_tab = CriteriaTab(self)
         self.tab_widget.addTab(self.criteria_tab, "Kriteria")
         
+        self.results_tab = ResultsTab(self)
+        
         # Status bar
         self.status_bar = self.statusBar()
         self.status_bar.showMessage("Siap")
+        self.cache_label = QLabel("")
+        self.status_bar.addPermanentWidget(self.cache_label)
     
     def create_menu_bar(self):
         menu_bar = self.menuBar()
@@ -429,64 +358,107 @@ class AHPMainWindow(QMainWindow):
         guide_action.triggered.connect(self.show_guide)
     
     def update_tabs(self):
-        # Remove all tabs except criteria tab
-        while self.tab_widget.count() > 1:
-            self.tab_widget.removeTab(1)
+        start = time.perf_counter()
+        built_before = len(self.tab_build_times)
+        crit_count = self.criteria_tab.criteria_count
+        self.rebuild_hierarchy()
+        
+        # Lepas tab hasil dan tab alternatif yang kriterianya sudah tidak ada;
+        # objek tab tetap disimpan di alternative_tab_cache
+        self.tab_widget.blockSignals(True)
+        results_index = self.tab_widget.indexOf(self.results_tab)
+        if results_index >= 0:
+            self.tab_widget.removeTab(results_index)
+        while self.tab_widget.count() > crit_count + 1:
+            self.tab_widget.removeTab(self.tab_widget.count() - 1)
+        
+        # Tab yang sudah ada diperbarui ukurannya, tab baru hanya berupa placeholder
+        for i in range(self.tab_widget.count() - 1):
+            tab = self.alternative_tab_cache.get(i)
+            if tab is not None:
+                tab.setup_alternative_table()
+        for i in range(self.tab_widget.count() - 1, crit_count):
+            tab = self.alternative_tab_cache.get(i)
+            if tab is not None:
+                tab.setup_alternative_table()
+            else:
+                tab = QWidget()
+            self.tab_widget.addTab(tab, f"Alternatif Kriteria {i+1}")
+        
+        self.tab_widget.addTab(self.results_tab, "Hasil")
+        self.tab_widget.blockSignals(False)
+        self.ensure_tab_built(self.tab_widget.currentIndex())
         
-        # Add alternative tabs
+        elapsed = (time.perf_counter() - start) * 1000
+        built = len(self.tab_build_times) - built_before
+        self.status_bar.showMessage(f"Struktur diperbarui dalam {elapsed:.1f} ms ({built} tab dibangun)")
+    
+    def ensure_tab_built(self, index):
+        # Bangun AlternativeTab saat tab placeholder pertama kali dibuka
+        crit_index = index - 1
+        if not 0 <= crit_index < self.criteria_tab.criteria_count:
+            return
+        if crit_index in self.alternative_tab_cache:
+            return
+        start = time.perf_counter()
+        tab = AlternativeTab(crit_index, self)
+        self.alternative_tab_cache[crit_index] = tab
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, tab, f"Alternatif Kriteria {crit_index+1}")
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        elapsed = time.perf_counter() - start
+        self.tab_build_times.append((crit_index, elapsed))
+        self.status_bar.showMessage(
+            f"Tab Alternatif Kriteria {crit_index+1} dibangun dalam {elapsed * 1000:.1f} ms")
+    
+    def alternative_tabs(self):
+        # Hanya tab alternatif yang sudah dibangun
+        return [self.alternative_tab_cache[i] for i in sorted(self.alternative_tab_cache)
+                if i < self.criteria_tab.criteria_count]
+    
+    def rebuild_hierarchy(self):
+        # State inkremental baru; matriks yang tidak berubah diambil dari cache.
+        # Matriks kriteria yang dihapus tetap disimpan di alternative_matrices
+        # sehingga kembali utuh jika jumlah kriteria dinaikkan lagi.
         crit_count = self.criteria_tab.criteria_count
+        alt_count = self.criteria_tab.alternative_count
+        if self.hierarchy is not None:
+            for i, state in enumerate(self.hierarchy.alternatives):
+                self.alternative_matrices[i] = state.matrix
+        while len(self.alternative_matrices) < crit_count:
+            self.alternative_matrices.append(np.ones((alt_count, alt_count)))
         for i in range(crit_count):
-            alt_tab = AlternativeTab(i, self)
-            self.tab_widget.addTab(alt_tab, f"Alternatif Kriteria {i+1}")
+            self.alternative_matrices[i] = resize_matrix(self.alternative_matrices[i], alt_count)
         
-        # Add results tab
-        results_tab = ResultsTab(self)
-        self.tab_widget.addTab(results_tab, "Hasil")
+        method = self.criteria_tab.method_combo.currentData()
+        self.hierarchy = IncrementalAHP(self.criteria_tab.read_matrix(),
+                                        self.alternative_matrices[:crit_count],
+                                        method, self.weight_cache)
+        self.update_cache_status()
+    
+    def update_cache_status(self):
+        cache = self.weight_cache
+        self.cache_label.setText(f"Cache bobot: {cache.hits} hit / {cache.misses} miss")
     
     def upload_data(self):
         options = QFileDialog.Options()
         file_name, _ = QFileDialog.getOpenFileName(self, "Upload Data AHP", "", 
-                                                  "JSON Files (*.json);;All Files (*)", 
+                                                  PROJECT_FILTER, 
                                                   options=options)
         if file_name:
             try:
-                with open(file_name, 'r') as f:
-                    data = json.load(f)
-                
-                # Set criteria count
-                self.criteria_tab.criteria_spin.setValue(data['criteria_count'])
-                self.criteria_tab.alternative_spin.setValue(data['alternative_count'])
+                project = read_project(file_name)
                 
-                # Set criteria matrix
-                for i in range(data['criteria_count']):
-                    for j in range(data['criteria_count']):
-                        if i != j and i < j:
-                            combo = self.criteria_tab.criteria_table.cellWidget(i, j+1)
-                            value = data['criteria_matrix'][i][j]
-                            if value < 1:
-                                text = f"1/{int(1/value)}"
-                            else:
-                                text = str(int(value))
-                            index = combo.findText(text)
-                            if index >= 0:
-                                combo.setCurrentIndex(index)
-                
-                # Set alternative matrices
-                for crit_idx, matrix_data in enumerate(data['alternative_matrices']):
-                    if crit_idx < self.tab_widget.count() - 2:  # -2 for criteria and results tabs
-                        alt_tab = self.tab_widget.widget(crit_idx + 1)  # +1 for criteria tab
-                        for i in range(data['alternative_count']):
-                            for j in range(data['alternative_count']):
-                                if i != j and i < j:
-                                    combo = alt_tab.alternative_table.cellWidget(i, j+1)
-                                    value = matrix_data[i][j]
-                                    if value < 1:
-                                        text = f"1/{int(1/value)}"
-                                    else:
-                                        text = str(int(value))
-                                    index = combo.findText(text)
-                                    if index >= 0:
-                                        combo.setCurrentIndex(index)
+                # Matriks dari file menggantikan seluruh state; tab alternatif
+                # membaca isinya dari hierarki ketika dibuka
+                self.criteria_tab.criteria_table.pairwise_model.set_matrix(project.criteria_matrix())
+                self.alternative_matrices = list(project.alternative_matrices())
+                self.hierarchy = None
+                self.criteria_tab.criteria_count = 0
+                self.criteria_tab.stored_matrix = np.ones((0, 0))
+                self.criteria_tab.set_counts(project.criteria_count, project.alternative_count)
                 
                 self.current_file = file_name
                 self.status_bar.showMessage(f"Data berhasil diupload dari {file_name}")
@@ -502,76 +474,24 @@ class AHPMainWindow(QMainWindow):
     
     def save_as_data(self):
         options = QFileDialog.Options()
-        file_name, _ = QFileDialog.getSaveFileName(self, "Simpan Data AHP", "", 
-                                                  "JSON Files (*.json);;All Files (*)", 
+        file_name, selected_filter = QFileDialog.getSaveFileName(self, "Simpan Data AHP", "", 
+                                                  PROJECT_FILTER, 
                                                   options=options)
         if file_name:
-            if not file_name.endswith('.json'):
-                file_name += '.json'
+            if not file_name.endswith(('.json', BINARY_EXTENSION)):
+                file_name += BINARY_EXTENSION if BINARY_EXTENSION in selected_filter else '.json'
             self._save_to_file(file_name)
             self.current_file = file_name
     
     def _save_to_file(self, file_name):
         try:
-            # Prepare criteria matrix
-            crit_count = self.criteria_tab.criteria_count
+            # Format ditentukan dari ekstensi: .ahpb biner, selain itu JSON
             alt_count = self.criteria_tab.alternative_count
-            criteria_matrix = np.ones((crit_count, crit_count))
-            
-            for i in range(crit_count):
-                for j in range(crit_count):
-                    if i == j:
-                        continue
-                    elif i < j:
-                        combo = self.criteria_tab.criteria_table.cellWidget(i, j+1)
-                        value_str = combo.currentText()
-                        
-                        if '/' in value_str:
-                            num, denom = map(float, value_str.split('/'))
-                            value = num / denom
-                        else:
-                            value = float(value_str)
-                            
-                        criteria_matrix[i, j] = value
-                        criteria_matrix[j, i] = 1 / value
-            
-            # Prepare alternative matrices
-            alternative_matrices = []
-            for crit_idx in range(crit_count):
-                if crit_idx < self.tab_widget.count() - 2:  # -2 for criteria and results tabs
-                    alt_tab = self.tab_widget.widget(crit_idx + 1)  # +1 for criteria tab
-                    matrix = np.ones((alt_count, alt_count))
-                    
-                    for i in range(alt_count):
-                        for j in range(alt_count):
-                            if i == j:
-                                continue
-                            elif i < j:
-                                combo = alt_tab.alternative_table.cellWidget(i, j+1)
-                                value_str = combo.currentText()
-                                
-                                if '/' in value_str:
-                                    num, denom = map(float, value_str.split('/'))
-                                    value = num / denom
-                                else:
-                                    value = float(value_str)
-                                    
-                                matrix[i, j] = value
-                                matrix[j, i] = 1 / value
-                    
-                    alternative_matrices.append(matrix.tolist())
-            
-            # Create data dictionary
-            data = {
-                'criteria_count': crit_count,
-                'alternative_count': alt_count,
-                'criteria_matrix': criteria_matrix.tolist(),
-                'alternative_matrices': alternative_matrices
-            }
-            
-            # Save to file
-            with open(file_name, 'w') as f:
-                json.dump(data, f, indent=4)
+            alternatives = self.hierarchy.alternatives if self.hierarchy is not None else []
+            alternative_matrices = [alt.matrix for alt in alternatives]
+            project = AHPProject.from_matrices(self.criteria_tab.read_matrix(),
+                                               alternative_matrices or np.empty((0, alt_count, alt_count)))
+            write_project(file_name, project)
             
             self.status_bar.showMessage(f"Data berhasil disimpan ke {file_name}")
             
@@ -0,0 +1,151 @@
+import numpy as np
+
+# Nilai Random Index (RI) Saaty untuk ukuran matriks 1-10; ukuran lebih besar
+# diambil dari tabel Monte-Carlo di random_index.json
+RANDOM_INDEX = {1: 0, 2: 0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49}
+
+# Ukuran matriks perbandingan terbesar yang didukung GUI
+MAX_MATRIX_SIZE = 500
+
+# Metode prioritas: normalisasi kolom, eigenvector utama, rata-rata geometrik
+PRIORITY_METHODS = ("approximate", "eigenvector", "geometric")
+
+# Batas ukuran matriks yang power iteration-nya dipercepat dengan pengkuadratan
+SQUARING_MAX_N = 16
+
+# Kelas GUI yang berada di ahp.py dan hanya dimuat saat benar-benar diminta
+_GUI_NAMES = ("CriteriaTab", "AlternativeTab", "ResultsTab", "AHPMainWindow")
+
+class AHPCalculator:
+    @staticmethod
+    def calculate_ahp(criteria_matrix, alternative_matrices, method="approximate"):
+        # Hitung bobot kriteria
+        criteria_weights, _ = AHPCalculator.calculate_weights(criteria_matrix, method)
+
+        # Hitung bobot alternatif untuk semua kriteria sekaligus
+        alternative_weights, _ = AHPCalculator.calculate_weights_batch(alternative_matrices, method)
+
+        # Skor akhir = sintesis bobot alternatif dengan bobot kriteria
+        final_scores = criteria_weights @ alternative_weights
+
+        return criteria_weights, list(alternative_weights), final_scores
+
+    @staticmethod
+    def calculate_ahp_batch(criteria_matrices, alternative_matrices, method="approximate"):
+        # criteria_matrices: (batch, k, k), alternative_matrices: (batch, k, m, m)
+        criteria_matrices = np.asarray(criteria_matrices, dtype=float)
+        alternative_matrices = np.asarray(alternative_matrices, dtype=float)
+        batch, k, m, _ = alternative_matrices.shape
+
+        criteria_weights, criteria_cr = AHPCalculator.calculate_weights_batch(criteria_matrices, method)
+        alt_weights, alt_cr = AHPCalculator.calculate_weights_batch(
+            alternative_matrices.reshape(batch * k, m, m), method)
+        alt_weights = alt_weights.reshape(batch, k, m)
+
+        # (batch, 1, k) @ (batch, k, m) -> (batch, m)
+        final_scores = (criteria_weights[:, None, :] @ alt_weights)[:, 0, :]
+
+        return criteria_weights, alt_weights, final_scores, criteria_cr, alt_cr.reshape(batch, k)
+
+    @staticmethod
+    def calculate_weights(matrix, method="approximate"):
+        weights, cr = AHPCalculator.calculate_weights_batch(np.asarray(matrix, dtype=float)[None], method)
+        return weights[0], cr[0]
+
+    @staticmethod
+    def calculate_weights_batch(matrices, method="approximate", initial_weights=None,
+                                tol=1e-12, max_iter=1000):
+        # matrices: (batch, n, n) -> bobot (batch, n) dan CR (batch,)
+        matrices = np.asarray(matrices, dtype=float)
+        if matrices.ndim != 3 or matrices.shape[1] != matrices.shape[2]:
+            raise ValueError("Matriks harus berbentuk (batch, n, n)")
+        if method not in PRIORITY_METHODS:
+            raise ValueError(f"Metode prioritas tidak dikenal: {method}")
+
+        if method == "geometric":
+            # Rata-rata geometrik setiap baris
+            weights = np.exp(np.log(matrices).mean(axis=2))
+            weights /= weights.sum(axis=1, keepdims=True)
+        elif method == "eigenvector" and initial_weights is not None:
+            weights = np.asarray(initial_weights, dtype=float).reshape(matrices.shape[:2])
+        else:
+            # Normalisasi setiap kolom lalu rata-rata setiap baris
+            normalized = matrices / matrices.sum(axis=1, keepdims=True)
+            weights = normalized.mean(axis=2)
+
+        n = matrices.shape[1]
+        if method == "eigenvector":
+            # Bobot awal (warm start) menjadi titik mulai power iteration
+            weights, lambda_max = AHPCalculator.power_iteration(matrices, weights, tol, max_iter)
+        elif n > 2:
+            lambda_max = (np.einsum('bij,bj->bi', matrices, weights) / weights).mean(axis=1)
+
+        # Hitung consistency ratio
+        if n <= 2:
+            return weights, np.zeros(matrices.shape[0])
+        ci = (lambda_max - n) / (n - 1)
+        cr = ci / get_random_index(n)
+
+        return weights, cr
+
+    @staticmethod
+    def power_iteration(matrices, weights, tol=1e-12, max_iter=1000):
+        # Eigenvector utama untuk setiap matriks; matriks yang perubahannya < tol
+        # dikeluarkan dari iterasi berikutnya
+        weights = weights / weights.sum(axis=1, keepdims=True)
+        active = np.arange(matrices.shape[0])
+        current = matrices
+        square = matrices.shape[1] <= SQUARING_MAX_N
+        for _ in range(max_iter):
+            product = (current @ weights[active, :, None])[:, :, 0]
+            product /= product.sum(axis=1, keepdims=True)
+            done = np.abs(product - weights[active]).max(axis=1) < tol
+            weights[active] = product
+            if done.all():
+                break
+            if done.any():
+                active = active[~done]
+                current = current[~done]
+            if square:
+                # Matriks kecil dikuadratkan agar laju konvergensi berlipat setiap langkah
+                current = current @ current
+                current /= current.sum(axis=(1, 2), keepdims=True)
+
+        # Karena jumlah bobot = 1, lambda_max = jumlah elemen A @ w
+        lambda_max = (matrices @ weights[:, :, None])[:, :, 0].sum(axis=1)
+        return weights, lambda_max
+
+def get_random_index(n):
+    if n in RANDOM_INDEX:
+        return RANDOM_INDEX[n]
+    from random_index import random_index
+    return random_index(n)
+
+def resize_matrix(matrix, size):
+    # Ubah ukuran matriks perbandingan: blok kiri atas dipertahankan, baris dan
+    # kolom baru diisi 1 (sama penting)
+    matrix = np.asarray(matrix, dtype=float)
+    resized = np.ones((size, size))
+    keep = min(size, matrix.shape[0])
+    resized[:keep, :keep] = matrix[:keep, :keep]
+    return resized
+
+def calculate_weights(matrix, method="approximate"):
+    return AHPCalculator.calculate_weights(matrix, method)
+
+def calculate_weights_batch(matrices, method="approximate", initial_weights=None,
+                            tol=1e-12, max_iter=1000):
+    return AHPCalculator.calculate_weights_batch(matrices, method, initial_weights, tol, max_iter)
+
+def calculate_ahp(criteria_matrix, alternative_matrices, method="approximate"):
+    return AHPCalculator.calculate_ahp(criteria_matrix, alternative_matrices, method)
+
+def calculate_ahp_batch(criteria_matrices, alternative_matrices, method="approximate"):
+    return AHPCalculator.calculate_ahp_batch(criteria_matrices, alternative_matrices, method)
+
+def __getattr__(name):
+    # Impor PyQt5 ditunda sampai kelas GUI diakses
+    if name in _GUI_NAMES:
+        import ahp
+        return getattr(ahp, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,265 @@
+import copy
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from ahp_engine import AHPCalculator, PRIORITY_METHODS, get_random_index
+
+# Jumlah perubahan sebelum state dihitung ulang penuh untuk membuang galat pembulatan
+RESYNC_EVERY = 1000
+
+# Batas total memori (byte array NumPy) state matriks yang disimpan WeightCache;
+# satu state 500 x 500 metode approximate memakai sekitar 4 MB
+CACHE_BYTES = 64 * 2**20
+
+class IncrementalAHPMatrix:
+    # Matriks perbandingan berpasangan yang bobot dan CR-nya diperbarui secara
+    # inkremental ketika satu pasangan a_ij / a_ji berubah.
+    #
+    # State yang disimpan untuk metode "approximate" (w = A d / n, d = 1 / jumlah kolom):
+    #   col_sums = jumlah setiap kolom A
+    #   square   = A @ A, sehingga A @ w = (A @ A) @ d / n
+    #   aw       = A @ w
+    # Untuk metode "geometric" disimpan jumlah log setiap baris dan A @ u dengan
+    # u bobot yang belum dinormalisasi. Metode "eigenvector" memakai power iteration
+    # yang dimulai dari bobot sebelumnya.
+    def __init__(self, matrix, method="approximate"):
+        if method not in PRIORITY_METHODS:
+            raise ValueError(f"Metode prioritas tidak dikenal: {method}")
+        self.method = method
+        self.matrix = np.array(matrix, dtype=float)
+        self.n = self.matrix.shape[0]
+        self.refresh()
+
+    def refresh(self):
+        # Hitung ulang seluruh state dari matriks, O(n^3) untuk metode approximate
+        a = self.matrix
+        self.col_sums = a.sum(axis=0)
+        self.edits = 0
+        if self.method == "approximate":
+            self.square = a @ a
+            inv_sums = 1 / self.col_sums
+            self.weights = a @ inv_sums / self.n
+            self.aw = self.square @ inv_sums / self.n
+        elif self.method == "geometric":
+            self.log_row_sums = np.log(a).sum(axis=1)
+            self.unnormalized = np.exp(self.log_row_sums / self.n)
+            self.total = self.unnormalized.sum()
+            self.au = a @ self.unnormalized
+            self.weights = self.unnormalized / self.total
+        else:
+            self.weights, _ = AHPCalculator.calculate_weights(a, "eigenvector")
+        self._update_consistency()
+
+    def copy(self):
+        clone = copy.copy(self)
+        for name, value in vars(self).items():
+            if isinstance(value, np.ndarray):
+                setattr(clone, name, value.copy())
+        return clone
+
+    @property
+    def nbytes(self):
+        return sum(value.nbytes for value in vars(self).values() if isinstance(value, np.ndarray))
+
+    def set_comparison(self, i, j, value):
+        # Ubah a_ij = value dan a_ji = 1 / value lalu perbarui state
+        if i == j:
+            return
+        a = self.matrix
+        delta_ij = value - a[i, j]
+        delta_ji = 1 / value - a[j, i]
+        if delta_ij == 0 and delta_ji == 0:
+            return
+
+        if self.method == "approximate":
+            self._update_approximate(i, j, delta_ij, delta_ji)
+        elif self.method == "geometric":
+            self._update_geometric(i, j, delta_ij, delta_ji)
+        else:
+            a[i, j] += delta_ij
+            a[j, i] += delta_ji
+            self.col_sums[j] += delta_ij
+            self.col_sums[i] += delta_ji
+            self.weights, _ = AHPCalculator.power_iteration(a[None], self.weights[None])
+            self.weights = self.weights[0]
+
+        self.edits += 1
+        if self.edits >= RESYNC_EVERY:
+            self.refresh()
+        else:
+            self._update_consistency()
+
+    def _update_approximate(self, i, j, delta_ij, delta_ji):
+        a = self.matrix
+        old_col_i = a[:, i].copy()
+        old_col_j = a[:, j].copy()
+        old_inv = 1 / self.col_sums
+        a[i, j] += delta_ij
+        a[j, i] += delta_ji
+        self.col_sums[j] += delta_ij
+        self.col_sums[i] += delta_ji
+        new_inv = 1 / self.col_sums
+        d_inv_i = new_inv[i] - old_inv[i]
+        d_inv_j = new_inv[j] - old_inv[j]
+
+        # A @ A berubah hanya pada dua kolom dan dua baris
+        square = self.square
+        square[:, j] += delta_ij * old_col_i
+        square[:, i] += delta_ji * old_col_j
+        square[i, :] += delta_ij * a[j, :]
+        square[j, :] += delta_ji * a[i, :]
+
+        # (A @ A) @ d diperbarui dari selisih A @ A dan selisih d
+        change = delta_ij * old_inv[j] * old_col_i + delta_ji * old_inv[i] * old_col_j
+        change[i] += delta_ij * (a[j, :] @ old_inv)
+        change[j] += delta_ji * (a[i, :] @ old_inv)
+        change += square[:, i] * d_inv_i + square[:, j] * d_inv_j
+        self.aw += change / self.n
+
+        # w = A @ d / n berubah karena dua kolom A dan dua elemen d
+        change = a[:, i] * d_inv_i + a[:, j] * d_inv_j
+        change[i] += delta_ij * old_inv[j]
+        change[j] += delta_ji * old_inv[i]
+        self.weights += change / self.n
+
+    def _update_geometric(self, i, j, delta_ij, delta_ji):
+        a = self.matrix
+        self.log_row_sums[i] += np.log(a[i, j] + delta_ij) - np.log(a[i, j])
+        self.log_row_sums[j] += np.log(a[j, i] + delta_ji) - np.log(a[j, i])
+        old_u = self.unnormalized
+        new_u_i = np.exp(self.log_row_sums[i] / self.n)
+        new_u_j = np.exp(self.log_row_sums[j] / self.n)
+        d_u_i = new_u_i - old_u[i]
+        d_u_j = new_u_j - old_u[j]
+
+        # A @ u: selisih dari dua elemen A dan dua elemen u
+        self.au[i] += delta_ij * old_u[j]
+        self.au[j] += delta_ji * old_u[i]
+        a[i, j] += delta_ij
+        a[j, i] += delta_ji
+        self.au += a[:, i] * d_u_i + a[:, j] * d_u_j
+        self.col_sums[j] += delta_ij
+        self.col_sums[i] += delta_ji
+
+        old_u[i] = new_u_i
+        old_u[j] = new_u_j
+        self.total += d_u_i + d_u_j
+        self.weights = old_u / self.total
+
+    def _update_consistency(self):
+        n = self.n
+        if n <= 2:
+            self.lambda_max = float(n)
+            self.cr = 0.0
+            return
+        if self.method == "approximate":
+            self.lambda_max = (self.aw / self.weights).mean()
+        elif self.method == "geometric":
+            self.lambda_max = (self.au / self.unnormalized).mean()
+        else:
+            # Bobot eigenvector berjumlah 1 sehingga lambda_max = jumlah kolom . w
+            self.lambda_max = self.col_sums @ self.weights
+        ci = (self.lambda_max - n) / (n - 1)
+        self.cr = ci / get_random_index(n)
+
+class WeightCache:
+    # Cache LRU state IncrementalAHPMatrix dengan kunci (metode, hash isi matriks),
+    # sehingga matriks yang tidak berubah tidak pernah dihitung ulang. Dibatasi total
+    # byte state, bukan jumlah entri, karena ukuran state tumbuh O(n^2).
+    def __init__(self, max_bytes=CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(matrix, method):
+        matrix = np.ascontiguousarray(matrix, dtype=float)
+        digest = hashlib.blake2b(matrix.tobytes(), digest_size=16).hexdigest()
+        return method, matrix.shape, digest
+
+    def get(self, matrix, method):
+        key = self.key(matrix, method)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = IncrementalAHPMatrix(matrix, method)
+            self._store(key, entry.copy())
+            return entry
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry.copy()
+
+    def put(self, state):
+        # Simpan salinan state terkini agar dapat dipakai lagi tanpa perhitungan ulang
+        self._store(self.key(state.matrix, state.method), state.copy())
+
+    def _store(self, key, state):
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key).nbytes
+        if state.nbytes > self.max_bytes:
+            return
+        self.entries[key] = state
+        self.nbytes += state.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+class IncrementalAHP:
+    # Hierarki AHP lengkap (satu matriks kriteria, satu matriks alternatif per
+    # kriteria) dengan skor akhir yang diperbarui dari selisih bobot
+    def __init__(self, criteria_matrix, alternative_matrices, method="approximate", cache=None):
+        self.method = method
+        self.cache = cache
+        self.criteria = self._state(criteria_matrix)
+        self.alternatives = [self._state(matrix) for matrix in alternative_matrices]
+        self._synthesize()
+
+    @classmethod
+    def uniform(cls, criteria_count, alternative_count, method="approximate", cache=None):
+        # Hierarki baru dengan semua perbandingan bernilai 1
+        return cls(np.ones((criteria_count, criteria_count)),
+                   np.ones((criteria_count, alternative_count, alternative_count)), method, cache)
+
+    def _state(self, matrix):
+        if self.cache is None:
+            return IncrementalAHPMatrix(matrix, self.method)
+        return self.cache.get(matrix, self.method)
+
+    def _synthesize(self):
+        self.alternative_weights = np.array([alt.weights for alt in self.alternatives])
+        self.final_scores = self.criteria.weights @ self.alternative_weights
+
+    def set_method(self, method):
+        if self.cache is not None:
+            for state in [self.criteria] + self.alternatives:
+                self.cache.put(state)
+        self.method = method
+        self.criteria = self._state(self.criteria.matrix)
+        self.alternatives = [self._state(alt.matrix) for alt in self.alternatives]
+        self._synthesize()
+
+    def set_criteria_comparison(self, i, j, value):
+        old = self.criteria.weights.copy()
+        self.criteria.set_comparison(i, j, value)
+        self.final_scores += (self.criteria.weights - old) @ self.alternative_weights
+
+    def set_alternative_comparison(self, crit_index, i, j, value):
+        alt = self.alternatives[crit_index]
+        old = self.alternative_weights[crit_index].copy()
+        alt.set_comparison(i, j, value)
+        self.alternative_weights[crit_index] = alt.weights
+        self.final_scores += self.criteria.weights[crit_index] * (alt.weights - old)
+
+    @property
+    def criteria_weights(self):
+        return self.criteria.weights
@@ -0,0 +1,142 @@
+import json
+import struct
+
+import numpy as np
+
+# Format biner proyek AHP (.ahpb):
+#   header 32 byte little-endian: magic "AHPB", versi (u2), cadangan (u2),
+#   jumlah kriteria (u4), jumlah alternatif (u4), sisanya nol
+#   data float64: segitiga atas matriks kriteria (baris demi baris), lalu
+#   segitiga atas setiap matriks alternatif secara berurutan
+# Segitiga bawah tidak disimpan karena selalu resiprokal segitiga atas.
+MAGIC = b"AHPB"
+VERSION = 1
+HEADER_FORMAT = "<4sHHII"
+HEADER_SIZE = 32
+BINARY_EXTENSION = ".ahpb"
+
+def triangle_size(n):
+    return n * (n - 1) // 2
+
+def upper_triangle(matrices):
+    # Segitiga atas (tanpa diagonal) dari satu matriks atau tumpukan matriks
+    matrices = np.asarray(matrices, dtype=float)
+    n = matrices.shape[-1]
+    rows, cols = np.triu_indices(n, 1)
+    return matrices[..., rows, cols]
+
+def from_upper(upper, n):
+    # Kebalikan upper_triangle: bangun matriks resiprokal penuh
+    upper = np.asarray(upper, dtype=float)
+    rows, cols = np.triu_indices(n, 1)
+    matrices = np.ones(upper.shape[:-1] + (n, n))
+    matrices[..., rows, cols] = upper
+    matrices[..., cols, rows] = 1 / upper
+    return matrices
+
+class AHPProject:
+    # Proyek AHP yang dibuka dengan np.memmap: membuka file hanya membaca header,
+    # data matriks dibaca dari disk ketika diakses
+    def __init__(self, criteria_count, alternative_count, criteria_upper, alternative_upper):
+        self.criteria_count = criteria_count
+        self.alternative_count = alternative_count
+        self.criteria_upper = criteria_upper
+        self.alternative_upper = alternative_upper
+
+    @classmethod
+    def from_matrices(cls, criteria_matrix, alternative_matrices):
+        criteria_matrix = np.asarray(criteria_matrix, dtype=float)
+        alternative_matrices = np.asarray(alternative_matrices, dtype=float)
+        criteria_count = criteria_matrix.shape[0]
+        if len(alternative_matrices) != criteria_count:
+            raise ValueError("Jumlah matriks alternatif harus sama dengan jumlah kriteria")
+        alternative_count = alternative_matrices.shape[-1] if alternative_matrices.ndim == 3 else 0
+        alternative_upper = upper_triangle(alternative_matrices).reshape(
+            criteria_count, triangle_size(alternative_count))
+        return cls(criteria_count, alternative_count, upper_triangle(criteria_matrix), alternative_upper)
+
+    @classmethod
+    def from_json(cls, data):
+        # data: dict dengan kunci yang ditulis AHPMainWindow._save_to_file
+        criteria_count = data['criteria_count']
+        alternative_count = data['alternative_count']
+        alternative_matrices = data['alternative_matrices'] or np.empty((0, alternative_count, alternative_count))
+        project = cls.from_matrices(data['criteria_matrix'], alternative_matrices)
+        if (project.criteria_count, project.alternative_count) != (criteria_count, alternative_count):
+            raise ValueError("Ukuran matriks tidak sesuai dengan jumlah kriteria/alternatif")
+        return project
+
+    def criteria_matrix(self):
+        return from_upper(self.criteria_upper, self.criteria_count)
+
+    def alternative_matrix(self, crit_index):
+        return from_upper(self.alternative_upper[crit_index], self.alternative_count)
+
+    def alternative_matrices(self):
+        return from_upper(self.alternative_upper, self.alternative_count)
+
+    def to_json(self):
+        return {
+            'criteria_count': self.criteria_count,
+            'alternative_count': self.alternative_count,
+            'criteria_matrix': self.criteria_matrix().tolist(),
+            'alternative_matrices': self.alternative_matrices().tolist()
+        }
+
+    def save(self, file_name):
+        header = struct.pack(HEADER_FORMAT, MAGIC, VERSION, 0, self.criteria_count, self.alternative_count)
+        with open(file_name, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            f.write(np.ascontiguousarray(self.criteria_upper, dtype='<f8').tobytes())
+            f.write(np.ascontiguousarray(self.alternative_upper, dtype='<f8').tobytes())
+
+def load_project(file_name, mode='r'):
+    # mode 'r' hanya baca, 'r+' agar perubahan pada array langsung ditulis ke file
+    with open(file_name, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError("File proyek AHP terpotong")
+    magic, version, _, criteria_count, alternative_count = struct.unpack_from(HEADER_FORMAT, header)
+    if magic != MAGIC:
+        raise ValueError("Bukan file proyek AHP biner")
+    if version != VERSION:
+        raise ValueError(f"Versi file proyek AHP tidak didukung: {version}")
+
+    criteria_size = triangle_size(criteria_count)
+    alternative_size = criteria_count * triangle_size(alternative_count)
+    total = criteria_size + alternative_size
+    if total == 0:
+        data = np.empty(0, dtype='<f8')
+    else:
+        data = np.memmap(file_name, dtype='<f8', mode=mode, offset=HEADER_SIZE, shape=(total,))
+    criteria_upper = data[:criteria_size]
+    alternative_upper = data[criteria_size:].reshape(criteria_count, triangle_size(alternative_count))
+    return AHPProject(criteria_count, alternative_count, criteria_upper, alternative_upper)
+
+def save_project(file_name, criteria_matrix, alternative_matrices):
+    AHPProject.from_matrices(criteria_matrix, alternative_matrices).save(file_name)
+
+def read_project(file_name):
+    # Buka proyek dalam format JSON lama maupun biner berdasarkan ekstensinya
+    if file_name.endswith(BINARY_EXTENSION):
+        return load_project(file_name)
+    with open(file_name, 'r') as f:
+        return AHPProject.from_json(json.load(f))
+
+def write_project(file_name, project):
+    if file_name.endswith(BINARY_EXTENSION):
+        project.save(file_name)
+    else:
+        with open(file_name, 'w') as f:
+            json.dump(project.to_json(), f, indent=4)
+
+def convert_project(source, target):
+    # Konversi JSON <-> biner tanpa kehilangan nilai (float64 ditulis apa adanya)
+    write_project(target, read_project(source))
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 3:
+        print("Penggunaan: python ahp_project.py <sumber.json|.ahpb> <tujuan.json|.ahpb>")
+        sys.exit(1)
+    convert_project(sys.argv[1], sys.argv[2])
@@ -0,0 +1,65 @@
+import time
+
+import numpy as np
+
+from ahp_engine import AHPCalculator, get_random_index
+from random_index import SAATY_SCALE
+
+# Benchmark perhitungan AHP per-matriks (loop Python) vs batch tervektorisasi
+
+def random_pairwise(rng, batch, n):
+    # Matriks resiprokal acak dengan nilai skala Saaty
+    upper = rng.choice(SAATY_SCALE, size=(batch, n, n))
+    matrices = np.ones((batch, n, n))
+    iu = np.triu_indices(n, 1)
+    matrices[:, iu[0], iu[1]] = upper[:, iu[0], iu[1]]
+    matrices[:, iu[1], iu[0]] = 1 / upper[:, iu[0], iu[1]]
+    return matrices
+
+def loop_weights(matrix):
+    # Implementasi lama: satu matriks per panggilan
+    normalized = matrix / matrix.sum(axis=0)
+    weights = normalized.mean(axis=1)
+    n = matrix.shape[0]
+    lambda_max = (matrix @ weights / weights).mean()
+    ci = (lambda_max - n) / (n - 1)
+    return weights, ci / get_random_index(n)
+
+def loop_ahp(criteria_matrix, alternative_matrices):
+    criteria_weights, _ = loop_weights(criteria_matrix)
+    alternative_weights = [loop_weights(matrix)[0] for matrix in alternative_matrices]
+    final_scores = np.zeros(len(alternative_weights[0]))
+    for i, crit_weight in enumerate(criteria_weights):
+        for j, alt_weight in enumerate(alternative_weights[i]):
+            final_scores[j] += crit_weight * alt_weight
+    return final_scores
+
+def timeit(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+
+    print("calculate_weights: loop vs batch")
+    for batch, n in [(1000, 5), (10000, 5), (10000, 9), (1000, 30)]:
+        matrices = random_pairwise(rng, batch, n)
+        t_loop, (w_loop, cr_loop) = timeit(lambda: tuple(map(np.array, zip(*[loop_weights(m) for m in matrices]))))
+        t_batch, (w_batch, cr_batch) = timeit(lambda: AHPCalculator.calculate_weights_batch(matrices))
+        assert np.allclose(w_loop, w_batch) and np.allclose(cr_loop, cr_batch)
+        print(f"  batch={batch:6d} n={n:3d}  loop {t_loop * 1000:9.2f} ms  "
+              f"batch {t_batch * 1000:8.2f} ms  x{t_loop / t_batch:6.1f}")
+
+    print("calculate_ahp: loop vs batch (k kriteria, m alternatif)")
+    for batch, k, m in [(1000, 5, 5), (5000, 7, 9), (500, 9, 30)]:
+        criteria = random_pairwise(rng, batch, k)
+        alternatives = random_pairwise(rng, batch * k, m).reshape(batch, k, m, m)
+        t_loop, scores_loop = timeit(lambda: np.array([loop_ahp(c, a) for c, a in zip(criteria, alternatives)]))
+        t_batch, result = timeit(lambda: AHPCalculator.calculate_ahp_batch(criteria, alternatives))
+        assert np.allclose(scores_loop, result[2])
+        print(f"  batch={batch:6d} k={k} m={m:3d}  loop {t_loop * 1000:9.2f} ms  "
+              f"batch {t_batch * 1000:8.2f} ms  x{t_loop / t_batch:6.1f}")
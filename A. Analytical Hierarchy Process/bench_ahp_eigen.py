@@ -0,0 +1,45 @@
+import numpy as np
+
+from ahp_engine import AHPCalculator
+from bench_ahp_batch import random_pairwise, timeit
+
+# Benchmark eigenvector utama: power iteration vs np.linalg.eig penuh
+TOLERANCE = 1e-9
+
+def eig_weights(matrices):
+    # Cara lama (pemilihan_alat_mesin_produksi.py), diterapkan pada tumpukan matriks
+    eig_values, eig_vectors = np.linalg.eig(matrices)
+    max_idx = np.argmax(eig_values.real, axis=1)
+    vectors = np.take_along_axis(eig_vectors, max_idx[:, None, None], axis=2)[:, :, 0].real
+    return vectors / vectors.sum(axis=1, keepdims=True)
+
+def power_weights(matrices):
+    weights, _ = AHPCalculator.calculate_weights_batch(matrices, method="eigenvector")
+    return weights
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+
+    print("Eigenvector utama: np.linalg.eig vs power iteration")
+    for batch, n in [(1, 100), (1, 200), (1, 500), (10000, 5), (10000, 9), (500, 50)]:
+        matrices = random_pairwise(rng, batch, n)
+        t_eig, w_eig = timeit(lambda: eig_weights(matrices))
+        t_power, w_power = timeit(lambda: power_weights(matrices))
+        error = np.abs(w_eig - w_power).max()
+        assert error < TOLERANCE, f"selisih {error:.2e} melebihi {TOLERANCE:.0e}"
+        print(f"  batch={batch:6d} n={n:4d}  eig {t_eig * 1000:9.2f} ms  "
+              f"power {t_power * 1000:8.2f} ms  x{t_eig / t_power:6.1f}  selisih {error:.1e}")
+
+    print("Metode prioritas lain (batch=10000, n=9)")
+    matrices = random_pairwise(rng, 10000, 9)
+    for method in ("approximate", "geometric"):
+        t, _ = timeit(lambda: AHPCalculator.calculate_weights_batch(matrices, method=method))
+        print(f"  {method:12s} {t * 1000:8.2f} ms")
+
+    print("Consistency ratio untuk n besar (biaya tumbuh O(n²), bukan O(n³) seperti eig)")
+    for n in (10, 50, 100, 200, 500):
+        matrix = random_pairwise(rng, 1, n)[0]
+        for method in ("approximate", "eigenvector"):
+            t, (_, cr) = timeit(lambda: AHPCalculator.calculate_weights(matrix, method))
+            print(f"  n={n:4d} {method:12s} {t * 1000:8.3f} ms  "
+                  f"{t / (n * n) * 1e9:7.2f} ns/elemen  CR={cr:.3f}")
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+# Benchmark waktu startup: impor engine AHP tidak boleh memuat modul Qt
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPEAT = 5
+
+PROBE = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+qt = sorted(m for m in sys.modules if m.startswith(("PyQt5", "PyQt6", "sip")))
+print(elapsed, len(qt))
+"""
+
+def measure(module):
+    # Setiap percobaan dijalankan di interpreter baru agar cache impor tidak berpengaruh
+    times = []
+    qt_modules = 0
+    for _ in range(REPEAT):
+        out = subprocess.run([sys.executable, "-c", PROBE.format(module=module)],
+                             cwd=HERE, capture_output=True, text=True, check=True)
+        elapsed, count = out.stdout.split()
+        times.append(float(elapsed))
+        qt_modules = max(qt_modules, int(count))
+    return min(times), qt_modules
+
+if __name__ == "__main__":
+    engine_time, engine_qt = measure("ahp_engine")
+    print(f"ahp_engine : {engine_time * 1000:8.2f} ms, modul Qt dimuat: {engine_qt}")
+
+    try:
+        gui_time, gui_qt = measure("ahp")
+        print(f"ahp (GUI)  : {gui_time * 1000:8.2f} ms, modul Qt dimuat: {gui_qt}")
+    except subprocess.CalledProcessError:
+        print("ahp (GUI)  : PyQt5 tidak tersedia, dilewati")
+
+    if engine_qt:
+        sys.exit("GAGAL: impor ahp_engine memuat modul Qt")
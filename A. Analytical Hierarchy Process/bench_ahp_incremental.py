@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+
+from ahp_engine import AHPCalculator
+from ahp_incremental import IncrementalAHP, IncrementalAHPMatrix
+from bench_ahp_batch import random_pairwise
+from random_index import SAATY_SCALE
+
+# Benchmark latensi per perubahan satu perbandingan: inkremental vs hitung ulang penuh
+EDITS = 500
+
+def random_edits(rng, n, count):
+    pairs = [rng.choice(n, 2, replace=False) for _ in range(count)]
+    return [(i, j, v) for (i, j), v in zip(pairs, rng.choice(SAATY_SCALE, count))]
+
+def per_edit(func, edits):
+    t0 = time.perf_counter()
+    for edit in edits:
+        func(*edit)
+    return (time.perf_counter() - t0) / len(edits)
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+
+    print("Satu matriks: waktu per perubahan (mikrodetik)")
+    for method in ("approximate", "geometric", "eigenvector"):
+        for n in (10, 50, 100, 200, 500):
+            matrix = random_pairwise(rng, 1, n)[0]
+            edits = random_edits(rng, n, EDITS)
+            incremental = IncrementalAHPMatrix(matrix, method)
+            full = matrix.copy()
+
+            def full_update(i, j, value):
+                full[i, j] = value
+                full[j, i] = 1 / value
+                return AHPCalculator.calculate_weights(full, method)
+
+            t_inc = per_edit(incremental.set_comparison, edits)
+            t_full = per_edit(full_update, edits[:50])
+            weights, cr = AHPCalculator.calculate_weights(incremental.matrix, method)
+            assert np.allclose(weights, incremental.weights) and np.isclose(cr, incremental.cr)
+            print(f"  {method:12s} n={n:4d}  inkremental {t_inc * 1e6:9.1f} us  "
+                  f"penuh {t_full * 1e6:10.1f} us  x{t_full / t_inc:7.1f}")
+
+    print("Hierarki (k kriteria, m alternatif): perubahan pada matriks alternatif")
+    for k, m in [(5, 10), (10, 100), (20, 300)]:
+        hierarchy = IncrementalAHP(random_pairwise(rng, 1, k)[0], random_pairwise(rng, k, m))
+        edits = [(rng.integers(k), i, j, v) for i, j, v in random_edits(rng, m, EDITS)]
+        t_inc = per_edit(hierarchy.set_alternative_comparison, edits)
+        expected = AHPCalculator.calculate_ahp(hierarchy.criteria.matrix,
+                                               [alt.matrix for alt in hierarchy.alternatives])[2]
+        assert np.allclose(expected, hierarchy.final_scores)
+        print(f"  k={k:3d} m={m:4d}  {t_inc * 1e6:9.1f} us per perubahan")
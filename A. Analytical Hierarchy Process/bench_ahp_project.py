@@ -0,0 +1,40 @@
+import os
+import tempfile
+
+import numpy as np
+
+from ahp_project import AHPProject, load_project, read_project, write_project
+from bench_ahp_batch import random_pairwise, timeit
+
+# Benchmark file proyek: JSON lama (matriks penuh, indent=4) vs format biner .ahpb
+# (segitiga atas float64, dibuka dengan np.memmap)
+SIZES = [(10, 100), (20, 300), (30, 500)]
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    directory = tempfile.mkdtemp()
+    json_file = os.path.join(directory, "proyek.json")
+    binary_file = os.path.join(directory, "proyek.ahpb")
+
+    print("Proyek k kriteria x m alternatif: waktu simpan/buka dan ukuran file")
+    for k, m in SIZES:
+        project = AHPProject.from_matrices(random_pairwise(rng, 1, k)[0], random_pairwise(rng, k, m))
+        t_json_save, _ = timeit(lambda: write_project(json_file, project), repeat=1)
+        t_json_load, loaded = timeit(lambda: read_project(json_file), repeat=1)
+        t_bin_save, _ = timeit(lambda: write_project(binary_file, project))
+        t_bin_open, opened = timeit(lambda: load_project(binary_file))
+        t_bin_full, matrices = timeit(lambda: load_project(binary_file).alternative_matrices())
+        assert np.array_equal(matrices, loaded.alternative_matrices())
+        assert np.array_equal(np.asarray(opened.alternative_upper), project.alternative_upper)
+
+        json_size = os.path.getsize(json_file) / 2**20
+        binary_size = os.path.getsize(binary_file) / 2**20
+        print(f"  k={k:3d} m={m:4d}")
+        print(f"    JSON   simpan {t_json_save * 1000:9.1f} ms  buka {t_json_load * 1000:9.1f} ms  "
+              f"ukuran {json_size:8.2f} MB")
+        print(f"    .ahpb  simpan {t_bin_save * 1000:9.1f} ms  buka {t_bin_open * 1000:9.3f} ms  "
+              f"(+ matriks penuh {t_bin_full * 1000:7.1f} ms)  ukuran {binary_size:8.2f} MB")
+
+    os.remove(json_file)
+    os.remove(binary_file)
+    os.rmdir(directory)
@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from excel_cache import read_excel_cached
+
+# Benchmark unggah katalog mesin: pd.read_excel setiap kali vs read_excel_cached.
+# Dingin = baca workbook + tulis cache; hangat = mmap dari cache (dan dengan seluruh
+# kolom angka disentuh, agar biaya membaca halaman dari disk ikut terhitung).
+SIZES = [10_000, 100_000]
+KRITERIA = ["Harga", "Kapasitas", "Daya", "Efisiensi", "Perawatan", "Umur", "Garansi"]
+
+def catalog(m):
+    rng = np.random.default_rng(0)
+    data = {"Mesin": [f"Mesin {i}" for i in range(m)]}
+    for kriteria in KRITERIA:
+        data[kriteria] = rng.random(m) * 100
+    data["Merek"] = rng.choice(["Alfa", "Beta", "Gama", "Delta"], m)
+    return pd.DataFrame(data)
+
+def timed(function, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"Unggah katalog Excel ({len(KRITERIA) + 2} kolom)")
+    with tempfile.TemporaryDirectory() as folder:
+        cache_dir = os.path.join(folder, "cache")
+        for m in sizes:
+            path = os.path.join(folder, f"katalog_{m}.xlsx")
+            catalog(m).to_excel(path, index=False)
+            expected, t_read = timed(pd.read_excel, path)
+            _, t_cold = timed(read_excel_cached, path, cache_dir=cache_dir)
+            warm, t_warm = timed(read_excel_cached, path, cache_dir=cache_dir)
+            _, t_touch = timed(lambda: read_excel_cached(path, cache_dir=cache_dir)[KRITERIA].to_numpy().sum())
+
+            assert list(warm.columns) == list(expected.columns)
+            assert np.array_equal(warm[KRITERIA].to_numpy(), expected[KRITERIA].to_numpy())
+            for column in ("Mesin", "Merek"):
+                assert (warm[column].astype(str).to_numpy() == expected[column].to_numpy()).all()
+
+            cached = sum(os.path.getsize(os.path.join(root, name))
+                         for root, _, names in os.walk(cache_dir) for name in names)
+            print(f"  m={m:8,d}  read_excel {t_read:6.2f} s   dingin {t_cold:6.2f} s"
+                  f"   hangat {t_warm * 1e3:6.1f} ms   hangat + sentuh kolom {t_touch * 1e3:6.1f} ms"
+                  f"   x{t_read / t_warm:6.0f}")
+            print(f"  {'':10}  file {os.path.getsize(path) / 2**20:5.1f} MB   cache {cached / 2**20:5.1f} MB")
+
+            # Mengubah file membuat entri baru (kunci path + mtime + ukuran)
+            os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+            _, t_changed = timed(read_excel_cached, path, cache_dir=cache_dir)
+            assert t_changed > 10 * t_warm
@@ -0,0 +1,83 @@
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QLabel, QPushButton, QTabWidget,
+                             QTableWidget, QTableWidgetItem, QComboBox)
+from PyQt5.QtCore import Qt
+
+from ahp import AHPMainWindow, ResultsTab
+from pairwise_grid import SAATY_VALUES
+
+# Benchmark perubahan jumlah kriteria 9 -> 10. Cara lama = update_tabs versi awal:
+# semua tab dihapus lalu setiap AlternativeTab dibangun ulang dengan satu QComboBox
+# per sel. Cara baru hanya menambah satu placeholder dan membangun tab saat dibuka.
+# Cara lama dengan m besar membuat puluhan ribu widget, jadi dibatasi LEGACY_LIMIT.
+ALTERNATIVE_COUNTS = [10, 50, 100]
+LEGACY_LIMIT = 50
+
+class LegacyAlternativeTab(QWidget):
+    # Salinan AlternativeTab versi awal (QTableWidget + QComboBox per sel)
+    def __init__(self, crit_index, alt_count):
+        super().__init__()
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel(f"Perbandingan Alternatif untuk Kriteria {crit_index+1}"))
+        table = QTableWidget()
+        table.setRowCount(alt_count)
+        table.setColumnCount(alt_count + 1)
+        table.setHorizontalHeaderLabels(["Alternatif"] + [f"Alt {i+1}" for i in range(alt_count)])
+        for i in range(alt_count):
+            table.setItem(i, 0, QTableWidgetItem(f"Alternatif {i+1}"))
+            diag_item = QTableWidgetItem("1")
+            diag_item.setFlags(Qt.ItemIsEnabled)
+            table.setItem(i, i+1, diag_item)
+            for j in range(alt_count):
+                if i != j:
+                    combo = QComboBox()
+                    combo.addItems(SAATY_VALUES)
+                    combo.setCurrentIndex(8)
+                    table.setCellWidget(i, j+1, combo)
+        layout.addWidget(table)
+        layout.addWidget(QPushButton(f"Hitung Bobot Alternatif untuk Kriteria {crit_index+1}"))
+        layout.addWidget(QLabel(""))
+        self.setLayout(layout)
+
+def legacy_update_tabs(tab_widget, window, crit_count, alt_count):
+    # Salinan update_tabs versi awal
+    start = time.perf_counter()
+    while tab_widget.count() > 1:
+        tab_widget.removeTab(1)
+    for i in range(crit_count):
+        tab_widget.addTab(LegacyAlternativeTab(i, alt_count), f"Alternatif Kriteria {i+1}")
+    tab_widget.addTab(ResultsTab(window), "Hasil")
+    return time.perf_counter() - start, crit_count
+
+def lazy_grow(window, alt_count):
+    built_before = len(window.tab_build_times)
+    start = time.perf_counter()
+    window.criteria_tab.set_counts(10, alt_count)
+    window.tab_widget.setCurrentIndex(10)
+    return time.perf_counter() - start, len(window.tab_build_times) - built_before
+
+if __name__ == "__main__":
+    app = QApplication([])
+    print("Jumlah kriteria 9 -> 10, lalu tab kriteria baru dibuka")
+    for alt_count in ALTERNATIVE_COUNTS:
+        window = AHPMainWindow()
+        window.criteria_tab.set_counts(9, alt_count)
+        for i in range(1, 10):
+            window.tab_widget.setCurrentIndex(i)
+        t_lazy, built_lazy = lazy_grow(window, alt_count)
+        per_tab = sum(t for _, t in window.tab_build_times) / len(window.tab_build_times)
+        line = (f"  m={alt_count:4d}  baru {t_lazy * 1000:7.1f} ms ({built_lazy} tab)   "
+                f"rata-rata bangun satu tab {per_tab * 1000:6.1f} ms")
+        if alt_count <= LEGACY_LIMIT:
+            legacy = QTabWidget()
+            legacy.addTab(QWidget(), "Kriteria")
+            legacy_update_tabs(legacy, window, 9, alt_count)
+            t_legacy, built_legacy = legacy_update_tabs(legacy, window, 10, alt_count)
+            line += f"   lama {t_legacy * 1000:8.1f} ms ({built_legacy} tab)   x{t_legacy / t_lazy:6.0f}"
+            legacy.deleteLater()
+        print(line)
+        window.close()
+        app.processEvents()
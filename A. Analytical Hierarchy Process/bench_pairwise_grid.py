@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+# Benchmark waktu bangun dan memori tabel perbandingan: QTableWidget dengan satu
+# QComboBox per sel (cara lama) vs PairwiseGrid berbasis QAbstractTableModel.
+# Setiap ukuran diukur di proses terpisah agar angka RSS tidak saling mempengaruhi.
+HERE = os.path.dirname(os.path.abspath(__file__))
+SIZES = [20, 50, 100, 200]
+
+PROBE = """
+import os, sys, time
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtWidgets import QApplication, QTableWidget, QTableWidgetItem, QComboBox
+from PyQt5.QtCore import Qt
+from pairwise_grid import PairwiseGrid, SAATY_VALUES
+
+def rss_kb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+
+def build_widgets(n):
+    # Salinan setup_criteria_table versi lama
+    table = QTableWidget()
+    table.setRowCount(n)
+    table.setColumnCount(n + 1)
+    for i in range(n):
+        table.setItem(i, 0, QTableWidgetItem(f"Kriteria {{i+1}}"))
+        diag_item = QTableWidgetItem("1")
+        diag_item.setFlags(Qt.ItemIsEnabled)
+        table.setItem(i, i+1, diag_item)
+        for j in range(n):
+            if i != j:
+                combo = QComboBox()
+                combo.addItems(SAATY_VALUES)
+                combo.setCurrentIndex(8)
+                table.setCellWidget(i, j+1, combo)
+    return table
+
+def build_grid(n):
+    grid = PairwiseGrid("Kriteria")
+    grid.pairwise_model.resize(n)
+    return grid
+
+app = QApplication([])
+builder = build_widgets if sys.argv[1] == "widget" else build_grid
+base = rss_kb()
+t0 = time.perf_counter()
+table = builder(int(sys.argv[2]))
+table.resize(800, 600)
+table.show()
+app.processEvents()
+elapsed = time.perf_counter() - t0
+print(elapsed, rss_kb() - base)
+"""
+
+def measure(kind, n):
+    out = subprocess.run([sys.executable, "-c", PROBE, kind, str(n)],
+                         cwd=HERE, capture_output=True, text=True, check=True)
+    elapsed, rss = out.stdout.split()
+    return float(elapsed), int(rss)
+
+if __name__ == "__main__":
+    print("Tabel perbandingan n x n: waktu tampil pertama dan tambahan RSS")
+    for n in SIZES:
+        t_widget, rss_widget = measure("widget", n)
+        t_grid, rss_grid = measure("grid", n)
+        print(f"  n={n:4d}  QComboBox per sel {t_widget * 1000:9.1f} ms {rss_widget / 1024:8.1f} MB   "
+              f"PairwiseGrid {t_grid * 1000:7.1f} ms {rss_grid / 1024:6.1f} MB")
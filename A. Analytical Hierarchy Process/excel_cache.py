@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# Cache kolumnar untuk workbook Excel yang sudah pernah dibaca. Setiap entri adalah satu
+# folder berisi meta.json dan satu .npy per kolom: kolom angka/tanggal/boolean disimpan
+# apa adanya, kolom teks sebagai kode int32 + tabel nilai unik. Pembacaan berikutnya
+# memetakan .npy ke memori (mmap) tanpa mem-parsing ulang XML workbook. Kolom campuran
+# (mis. angka dan teks, atau boolean dengan sel kosong) disimpan sebagai kode + nilai
+# unik di meta.json agar tipe setiap nilai tetap sama dengan hasil pd.read_excel.
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "dss_excel_cache")
+# Batas ukuran folder cache; entri yang paling lama tidak dipakai dihapus lebih dulu
+MAX_CACHE_BYTES = 512 * 2**20
+# Naikkan bila format entri berubah agar entri lama tidak dibaca
+CACHE_VERSION = 2
+META_FILE = "meta.json"
+STAGING_PREFIX = ".tmp-"
+# Folder staging yang lebih tua dari ini dianggap sisa proses yang gagal dan dihapus
+STAGING_MAX_AGE = 3600
+
+def cache_key(path, sheet_name=0):
+    # Kunci dari path absolut, waktu ubah dan ukuran file: file yang diubah otomatis
+    # mendapat entri baru, entri lamanya habis tergeser aturan LRU
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    text = f"{CACHE_VERSION}|{path}|{stat.st_mtime_ns}|{stat.st_size}|{sheet_name}"
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def entry_size(folder):
+    return sum(entry.stat().st_size for entry in os.scandir(folder) if entry.is_file())
+
+def write_entry(folder, frame, source):
+    columns = []
+    for index, column in enumerate(frame.columns):
+        values = frame[column].to_numpy()
+        name = column if isinstance(column, (str, int)) else str(column)
+        if values.dtype.kind in 'biufmM':
+            np.save(os.path.join(folder, f"{index}.npy"), values)
+            columns.append({"name": name, "kind": "array"})
+        else:
+            codes, uniques = pd.factorize(values)
+            labels = [label.item() if isinstance(label, np.generic) else label for label in uniques.tolist()]
+            np.save(os.path.join(folder, f"{index}.npy"), codes.astype(np.int32))
+            if all(isinstance(label, str) for label in labels):
+                # Teks: kode per baris (-1 = kosong) + nilai unik, dibaca sebagai Categorical
+                np.save(os.path.join(folder, f"{index}.labels.npy"), np.asarray(labels, dtype=str))
+                columns.append({"name": name, "kind": "categorical"})
+            elif all(isinstance(label, (str, int, float, bool)) for label in labels):
+                # Campuran: nilai unik disimpan di JSON yang mempertahankan tipe str/int/float/bool
+                columns.append({"name": name, "kind": "object", "labels": labels})
+            else:
+                raise ValueError(f"Kolom {name} tidak dapat disimpan di cache")
+    meta = {"source": os.path.abspath(source), "rows": len(frame), "columns": columns}
+    with open(os.path.join(folder, META_FILE), 'w', encoding='utf-8') as handle:
+        json.dump(meta, handle)
+
+def read_entry(folder, mmap_mode='r'):
+    with open(os.path.join(folder, META_FILE), encoding='utf-8') as handle:
+        meta = json.load(handle)
+    data = {}
+    for index, column in enumerate(meta["columns"]):
+        values = np.load(os.path.join(folder, f"{index}.npy"), mmap_mode=mmap_mode)
+        if column["kind"] == "categorical":
+            labels = np.load(os.path.join(folder, f"{index}.labels.npy"))
+            values = pd.Categorical.from_codes(values, categories=labels.astype(object))
+        elif column["kind"] == "object":
+            # Kode -1 menunjuk ke NaN di ujung daftar nilai unik
+            labels = np.empty(len(column["labels"]) + 1, dtype=object)
+            labels[:-1] = column["labels"]
+            labels[-1] = np.nan
+            values = labels[values]
+        data[column["name"]] = values
+    # copy=False: kolom angka tetap berupa array mmap, tidak digabung menjadi blok baru
+    return pd.DataFrame(data, copy=False)
+
+def evict(cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, keep=None):
+    # Hapus entri dengan waktu pakai (mtime meta.json) terlama sampai total ukuran
+    # folder cache tidak melebihi max_bytes; entri keep tidak ikut dihapus. Folder
+    # staging lama (tanpa meta.json, sisa proses yang terhenti) ikut dibersihkan.
+    entries = []
+    now = time.time()
+    for entry in os.scandir(cache_dir):
+        if entry.name.startswith(STAGING_PREFIX):
+            if entry.is_dir() and now - entry.stat().st_mtime > STAGING_MAX_AGE:
+                shutil.rmtree(entry.path, ignore_errors=True)
+            continue
+        meta = os.path.join(entry.path, META_FILE)
+        if entry.is_dir() and os.path.exists(meta):
+            entries.append((os.stat(meta).st_mtime_ns, entry.path, entry_size(entry.path)))
+    total = sum(size for _, _, size in entries)
+    for _, folder, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if folder != keep:
+            shutil.rmtree(folder, ignore_errors=True)
+            total -= size
+    return total
+
+def read_excel_cached(path, sheet_name=0, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES):
+    # Pengganti pd.read_excel(path, sheet_name=...) untuk satu lembar
+    folder = os.path.join(cache_dir, cache_key(path, sheet_name))
+    if os.path.exists(os.path.join(folder, META_FILE)):
+        # Tandai entri baru saja dipakai (urutan LRU)
+        os.utime(os.path.join(folder, META_FILE))
+        return read_entry(folder)
+
+    frame = pd.read_excel(path, sheet_name=sheet_name)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Tulis ke folder sementara lalu rename, agar entri setengah jadi tidak pernah terbaca
+    staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=cache_dir)
+    try:
+        write_entry(staging, frame, path)
+        os.replace(staging, folder)
+    except (OSError, ValueError):
+        # Entri sudah dibuat proses lain, cache tidak dapat ditulis, atau ada kolom yang
+        # tidak dapat disimpan tanpa mengubah tipenya: pakai hasil baca tanpa cache
+        shutil.rmtree(staging, ignore_errors=True)
+        return frame
+    evict(cache_dir, max_bytes, keep=folder)
+    return read_entry(folder)
+
+def clear_cache(cache_dir=CACHE_DIR):
+    shutil.rmtree(cache_dir, ignore_errors=True)
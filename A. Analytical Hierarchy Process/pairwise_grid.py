@@ -0,0 +1,124 @@
+import numpy as np
+from PyQt5.QtWidgets import QTableView, QStyledItemDelegate, QComboBox, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+
+# Nilai skala Saaty yang dapat dipilih pada sel perbandingan
+SAATY_VALUES = ["1/9", "1/8", "1/7", "1/6", "1/5", "1/4", "1/3", "1/2", "1",
+                "2", "3", "4", "5", "6", "7", "8", "9"]
+
+def parse_comparison(value_str):
+    # Ubah teks skala Saaty ("3", "1/5") menjadi angka
+    if '/' in value_str:
+        num, denom = map(float, value_str.split('/'))
+        return num / denom
+    return float(value_str)
+
+def format_comparison(value):
+    # Kebalikan parse_comparison; nilai di luar skala ditampilkan apa adanya
+    if value >= 1:
+        return f"{value:g}" if value == round(value) else f"{value:.4g}"
+    inverse = 1 / value
+    if abs(inverse - round(inverse)) < 1e-9:
+        return f"1/{round(inverse)}"
+    return f"{value:.4g}"
+
+class PairwiseModel(QAbstractTableModel):
+    # Model matriks perbandingan berpasangan; data disimpan dalam array NumPy.
+    # Hanya segitiga atas yang dapat diedit, segitiga bawah selalu resiprokalnya.
+    comparisonChanged = pyqtSignal(int, int, float)
+
+    def __init__(self, size=0, label="Item", parent=None):
+        super().__init__(parent)
+        self.label = label
+        self.matrix = np.ones((size, size))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.matrix.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.matrix.shape[1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        i, j = index.row(), index.column()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return format_comparison(self.matrix[i, j])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.BackgroundRole and i >= j:
+            return QColor(235, 235, 235)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return f"{self.label} {section+1}"
+        return None
+
+    def flags(self, index):
+        if index.isValid() and index.row() < index.column():
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        i, j = index.row(), index.column()
+        if i >= j:
+            return False
+        value = parse_comparison(value) if isinstance(value, str) else float(value)
+        self.set_comparison(i, j, value)
+        return True
+
+    def set_comparison(self, i, j, value):
+        if self.matrix[i, j] == value:
+            return
+        self.matrix[i, j] = value
+        self.matrix[j, i] = 1 / value
+        self.dataChanged.emit(self.index(i, j), self.index(i, j))
+        self.dataChanged.emit(self.index(j, i), self.index(j, i))
+        self.comparisonChanged.emit(i, j, value)
+
+    def resize(self, size):
+        # Matriks baru berukuran size x size dengan semua perbandingan bernilai 1
+        self.beginResetModel()
+        self.matrix = np.ones((size, size))
+        self.endResetModel()
+
+    def set_matrix(self, matrix):
+        # Ganti seluruh isi matriks dari segitiga atasnya tanpa memancarkan
+        # comparisonChanged per sel
+        matrix = np.array(matrix, dtype=float)
+        upper = np.triu_indices(matrix.shape[0], 1)
+        self.beginResetModel()
+        self.matrix = np.ones(matrix.shape)
+        self.matrix[upper] = matrix[upper]
+        self.matrix[upper[::-1]] = 1 / matrix[upper]
+        self.endResetModel()
+
+class ComparisonDelegate(QStyledItemDelegate):
+    # Combo box skala Saaty hanya dibuat ketika sebuah sel sedang diedit
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(SAATY_VALUES)
+        combo.activated.connect(lambda _: self.commitData.emit(combo))
+        return combo
+
+    def setEditorData(self, editor, index):
+        text = index.data(Qt.EditRole)
+        position = editor.findText(text)
+        editor.setCurrentIndex(position if position >= 0 else SAATY_VALUES.index("1"))
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+class PairwiseGrid(QTableView):
+    def __init__(self, label="Item", parent=None):
+        super().__init__(parent)
+        self.pairwise_model = PairwiseModel(0, label, self)
+        self.setModel(self.pairwise_model)
+        self.setItemDelegate(ComparisonDelegate(self))
+        self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.SelectedClicked |
+                             QAbstractItemView.EditKeyPressed)
+        self.horizontalHeader().setDefaultSectionSize(60)
@@ -1,9 +1,16 @@
+import os
 import sys
 import numpy as np
 import pandas as pd
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QFileDialog, QLineEdit, QHBoxLayout, QMessageBox
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QFileDialog, QLineEdit, QHBoxLayout, QMessageBox
 from PyQt5.QtCore import Qt
 
+# Tabel hasil virtual (result_view.py) ada di folder induk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from result_view import ResultView
+from ahp_engine import AHPCalculator
+from excel_cache import read_excel_cached
+
 class AHPApp(QWidget):
     def __init__(self):
         super().__init__()
@@ -53,7 +60,7 @@ class AHPApp(QWidget):
         self.label_hasil = QLabel("Hasil Perhitungan AHP:")
         layout.addWidget(self.label_hasil, alignment=Qt.AlignCenter)
         
-        self.table = QTableWidget()
+        self.table = ResultView()
         layout.addWidget(self.table)
         
         self.btn_simpan = QPushButton("Simpan ke Excel")
@@ -66,7 +73,8 @@ class AHPApp(QWidget):
         options = QFileDialog.Options()
         file_name, _ = QFileDialog.getOpenFileName(self, "Pilih File Excel", "", "Excel Files (*.xlsx);;All Files (*)", options=options)
         if file_name:
-            self.df_machines = pd.read_excel(file_name)
+            # Workbook yang sama (path, waktu ubah, ukuran) dibaca dari cache kolumnar
+            self.df_machines = read_excel_cached(file_name)
             self.nama_mesin_input.setText(", ".join(self.df_machines.iloc[:, 0]))
             self.kriteria_input.setText(", ".join(self.df_machines.columns[1:]))
             QMessageBox.information(self, "Sukses", "File Excel berhasil diunggah!")
@@ -91,10 +99,7 @@ class AHPApp(QWidget):
                 matrix[i][j] = round(np.random.uniform(1, 9), 2)
                 matrix[j][i] = round(1 / matrix[i][j], 2)
         
-        eig_values, eig_vectors = np.linalg.eig(matrix)
-        max_idx = np.argmax(eig_values.real)
-        priority_vector = eig_vectors[:, max_idx].real
-        priority_vector = priority_vector / sum(priority_vector)
+        priority_vector, _ = AHPCalculator.calculate_weights(matrix, method="eigenvector")
         
         df = pd.DataFrame({'Mesin': mesin, 'Bobot': priority_vector})
         df = df.sort_values(by='Bobot', ascending=False).reset_index(drop=True)
@@ -104,13 +109,7 @@ class AHPApp(QWidget):
         self.tampilkan_hasil(df)
     
     def tampilkan_hasil(self, df):
-        self.table.setRowCount(len(df))
-        self.table.setColumnCount(len(df.columns))
-        self.table.setHorizontalHeaderLabels(df.columns)
-        
-        for row_idx, row_data in df.iterrows():
-            for col_idx, value in enumerate(row_data):
-                self.table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+        self.table.set_frame(df)
     
     def simpan_excel(self):
         options = QFileDialog.Options()
@@ -125,8 +124,6 @@ class AHPApp(QWidget):
         self.bobot_input.clear()
         self.df_ahp = None
         self.table.clear()
-        self.table.setRowCount(0)
-        self.table.setColumnCount(0)
         QMessageBox.information(self, "Reset", "Form dan hasil telah direset.")
 
 if __name__ == "__main__":
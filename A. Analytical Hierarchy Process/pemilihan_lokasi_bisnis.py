@@ -1,11 +1,15 @@
 import sys
 import json
+from functools import lru_cache
 import numpy as np
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QTableWidget, QTableWidgetItem, QPushButton, 
                              QFileDialog, QTabWidget, QMessageBox, QLineEdit, 
-                             QComboBox, QGroupBox, QScrollArea)
+                             QComboBox, QGroupBox, QScrollArea, QSpinBox, QShortcut)
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QKeySequence
+
+from pairwise_grid import format_comparison
 
 class AHPCalculator:
     @staticmethod
@@ -13,54 +17,148 @@ class AHPCalculator:
         # Hitung bobot kriteria
         criteria_weights = AHPCalculator.calculate_weights(criteria_matrix)
         
-        # Hitung bobot alternatif untuk setiap kriteria
-        alternative_weights = []
-        for matrix in alternative_matrices:
-            alternative_weights.append(AHPCalculator.calculate_weights(matrix))
+        # Hitung bobot alternatif untuk semua kriteria sekaligus
+        alternative_weights = AHPCalculator.calculate_weights(np.asarray(alternative_matrices))
         
         # Hitung skor akhir
-        final_scores = np.zeros(len(alternative_weights[0]))
-        for i, crit_weight in enumerate(criteria_weights):
-            for j, alt_weight in enumerate(alternative_weights[i]):
-                final_scores[j] += crit_weight * alt_weight
+        final_scores = criteria_weights @ alternative_weights
         
         return criteria_weights, alternative_weights, final_scores
     
     @staticmethod
     def calculate_weights(matrix):
-        # Normalisasi matriks
-        normalized_matrix = matrix / matrix.sum(axis=0)
+        # Normalisasi matriks (satu matriks atau tumpukan matriks)
+        normalized_matrix = matrix / matrix.sum(axis=-2, keepdims=True)
         
         # Hitung rata-rata setiap baris
-        weights = normalized_matrix.mean(axis=1)
+        weights = normalized_matrix.mean(axis=-1)
         
         return weights
 
+def parse_fraction(text):
+    # Teks sel ("3", "1/5", "0.25") menjadi angka; sel kosong menjadi NaN.
+    # Penilaian AHP harus positif dan hingga ("0", "-3", "inf" ditolak). Koma desimal
+    # dari spreadsheet ("1,5") dibaca sebagai titik.
+    return _parse_fraction(text.strip().replace(',', '.'))
+
+@lru_cache(maxsize=4096)
+def _parse_fraction(text):
+    if not text:
+        return np.nan
+    if '/' in text:
+        numerator, denominator = text.split('/')
+        value = float(numerator) / float(denominator)
+    else:
+        value = float(text)
+    if not np.isfinite(value) or value <= 0:
+        raise ValueError(f"Nilai perbandingan harus positif: {text}")
+    return value
+
+def parse_cells(texts):
+    # Parse seluruh blok teks sekaligus: setiap teks unik hanya di-parse sekali
+    texts = np.asarray(texts, dtype=str)
+    unique, inverse = np.unique(texts, return_inverse=True)
+    values = np.array([parse_fraction(text) for text in unique.tolist()], dtype=float)
+    return values[inverse].reshape(texts.shape)
+
+def split_block(text, csv=False):
+    # Teks hasil salin dari spreadsheet: baris per baris, sel dipisah tab (koma adalah
+    # desimal). File CSV dipisah titik koma bila ada (CSV berdesimal koma), selain itu koma.
+    if '\t' in text:
+        separator = '\t'
+    elif csv:
+        separator = ';' if ';' in text else ','
+    else:
+        separator = ';'
+    rows = [line.split(separator) for line in text.strip().splitlines() if line.strip()]
+    width = max((len(row) for row in rows), default=0)
+    return [row + [''] * (width - len(row)) for row in rows]
+
+def format_fraction(value):
+    # Sel kosong (NaN) ditampilkan kosong
+    return "" if np.isnan(value) else format_comparison(value)
+
+def fill_diagonal(matrices):
+    # Diagonal yang kosong diisi 1 (in-place)
+    index = np.arange(matrices.shape[-1])
+    diagonal = matrices[..., index, index]
+    matrices[..., index, index] = np.where(np.isnan(diagonal), 1.0, diagonal)
+    return matrices
+
+def complete_matrices(matrices):
+    # Isi sel kosong (NaN): diagonal = 1, sel yang pasangannya terisi = kebalikannya,
+    # selain itu 1. Bekerja untuk satu matriks maupun tumpukan matriks.
+    matrices = fill_diagonal(np.array(matrices, dtype=float))
+    mirror = 1 / np.swapaxes(matrices, -1, -2)
+    matrices = np.where(np.isnan(matrices), mirror, matrices)
+    return np.where(np.isnan(matrices), 1.0, matrices)
+
+def resize_block(matrices, size):
+    # Ubah ukuran dua sumbu terakhir; sel baru kosong (NaN) kecuali diagonal
+    matrices = np.asarray(matrices, dtype=float)
+    resized = np.full(matrices.shape[:-2] + (size, size), np.nan)
+    keep = min(size, matrices.shape[-1])
+    resized[..., :keep, :keep] = matrices[..., :keep, :keep]
+    return fill_diagonal(resized)
+
+def alternative_label(index):
+    return f"Lokasi {chr(65 + index)}" if index < 26 else f"Lokasi {index + 1}"
+
+DEFAULT_CRITERIA = ["Harga", "Aksesibilitas", "Demografi"]
+DEFAULT_CRITERIA_MATRIX = [[1, 3, 5], [1/3, 1, 3], [1/5, 1/3, 1]]
+
 class AHPTab(QWidget):
+    # Matriks NumPy (NaN = sel kosong) adalah sumber data; tabel hanya menampilkannya.
+    # Edit satu sel memperbarui satu elemen array, tempel/impor CSV memperbarui
+    # satu blok sekaligus, dan perhitungan maupun penyimpanan membaca array.
     def __init__(self):
         super().__init__()
+        self.criteria_names = list(DEFAULT_CRITERIA)
+        self.alternative_names = [alternative_label(i) for i in range(3)]
+        self.criteria_matrix = np.array(DEFAULT_CRITERIA_MATRIX, dtype=float)
+        # Matriks kriteria, tumpukan matriks alternatif dan nama kriteria disimpan utuh,
+        # termasuk kriteria yang sedang tidak dipakai, agar perbandingannya kembali saat
+        # jumlah kriteria dinaikkan lagi; criteria_matrix dan alternative_matrices adalah
+        # view untuk kriteria yang aktif
+        self.stored_criteria_names = list(self.criteria_names)
+        self.stored_criteria = self.criteria_matrix
+        self.stored_alternatives = resize_block(np.full((3, 0, 0), np.nan), 3)
+        self.alternative_matrices = self.stored_alternatives
+        self.last_target = None
         self.initUI()
     
     def initUI(self):
         layout = QVBoxLayout()
         
+        # Jumlah kriteria dan alternatif
+        count_layout = QHBoxLayout()
+        count_layout.addWidget(QLabel("Jumlah Kriteria:"))
+        self.criteria_spin = QSpinBox()
+        self.criteria_spin.setRange(2, 100)
+        self.criteria_spin.setValue(len(self.criteria_names))
+        count_layout.addWidget(self.criteria_spin)
+        count_layout.addWidget(QLabel("Jumlah Alternatif:"))
+        self.alternative_spin = QSpinBox()
+        self.alternative_spin.setRange(2, 500)
+        self.alternative_spin.setValue(len(self.alternative_names))
+        count_layout.addWidget(self.alternative_spin)
+        self.criteria_spin.valueChanged.connect(self.update_counts)
+        self.alternative_spin.valueChanged.connect(self.update_counts)
+        
+        self.paste_btn = QPushButton("Tempel dari Clipboard")
+        self.paste_btn.clicked.connect(self.paste_clipboard)
+        count_layout.addWidget(self.paste_btn)
+        self.import_btn = QPushButton("Impor CSV")
+        self.import_btn.clicked.connect(self.import_csv)
+        count_layout.addWidget(self.import_btn)
+        
         # Kriteria
         criteria_group = QGroupBox("Kriteria")
         criteria_layout = QVBoxLayout()
         
         self.criteria_table = QTableWidget()
-        self.criteria_table.setColumnCount(3)
-        self.criteria_table.setHorizontalHeaderLabels(["Kriteria 1", "Kriteria 2", "Kriteria 3"])
-        self.criteria_table.setRowCount(3)
-        self.criteria_table.setItem(0, 0, QTableWidgetItem("1"))
-        self.criteria_table.setItem(0, 1, QTableWidgetItem("3"))
-        self.criteria_table.setItem(0, 2, QTableWidgetItem("5"))
-        self.criteria_table.setItem(1, 0, QTableWidgetItem("1/3"))
-        self.criteria_table.setItem(1, 1, QTableWidgetItem("1"))
-        self.criteria_table.setItem(1, 2, QTableWidgetItem("3"))
-        self.criteria_table.setItem(2, 0, QTableWidgetItem("1/5"))
-        self.criteria_table.setItem(2, 1, QTableWidgetItem("1/3"))
-        self.criteria_table.setItem(2, 2, QTableWidgetItem("1"))
+        self.criteria_table.itemChanged.connect(lambda item: self.cell_changed(None, item))
+        self.add_paste_shortcut(self.criteria_table, None)
         
         criteria_layout.addWidget(self.criteria_table)
         criteria_group.setLayout(criteria_layout)
@@ -70,32 +168,7 @@ class AHPTab(QWidget):
         alternatives_layout = QVBoxLayout()
         
         self.tab_widget = QTabWidget()
-        
-        # Alternatif untuk setiap kriteria
         self.alternative_tables = []
-        criteria_names = ["Harga", "Aksesibilitas", "Demografi"]
-        
-        for i in range(3):
-            tab = QWidget()
-            layout_tab = QVBoxLayout()
-            
-            table = QTableWidget()
-            table.setColumnCount(3)
-            table.setHorizontalHeaderLabels(["Lokasi A", "Lokasi B", "Lokasi C"])
-            table.setRowCount(3)
-            
-            # Isi dengan nilai default
-            for row in range(3):
-                for col in range(3):
-                    if row == col:
-                        table.setItem(row, col, QTableWidgetItem("1"))
-                    else:
-                        table.setItem(row, col, QTableWidgetItem(""))
-            
-            self.alternative_tables.append(table)
-            layout_tab.addWidget(table)
-            tab.setLayout(layout_tab)
-            self.tab_widget.addTab(tab, criteria_names[i])
         
         alternatives_layout.addWidget(self.tab_widget)
         alternatives_group.setLayout(alternatives_layout)
@@ -109,60 +182,157 @@ class AHPTab(QWidget):
         self.result_label.setAlignment(Qt.AlignCenter)
         self.result_label.setStyleSheet("font-size: 14px; font-weight: bold;")
         
+        layout.addLayout(count_layout)
         layout.addWidget(criteria_group)
         layout.addWidget(alternatives_group)
         layout.addWidget(self.calculate_btn)
         layout.addWidget(self.result_label)
         
         self.setLayout(layout)
+        self.rebuild_tables()
+    
+    def add_paste_shortcut(self, table, crit_index):
+        # Ctrl+V pada tabel menempel ke tabel itu; tabel yang terakhir dipilih
+        # menjadi tujuan tombol tempel/impor
+        table.itemSelectionChanged.connect(lambda: setattr(self, 'last_target', crit_index))
+        shortcut = QShortcut(QKeySequence.Paste, table)
+        shortcut.setContext(Qt.WidgetShortcut)
+        shortcut.activated.connect(lambda: self.paste_clipboard(crit_index))
+    
+    def rebuild_tables(self):
+        # Susun ulang tabel alternatif bila jumlah kriteria berubah, lalu isi semua tabel dari array
+        while len(self.alternative_tables) > len(self.criteria_names):
+            self.alternative_tables.pop()
+            self.tab_widget.removeTab(self.tab_widget.count() - 1)
+        for k in range(len(self.alternative_tables), len(self.criteria_names)):
+            table = QTableWidget()
+            table.itemChanged.connect(lambda item, k=k: self.cell_changed(k, item))
+            self.add_paste_shortcut(table, k)
+            self.alternative_tables.append(table)
+            self.tab_widget.addTab(table, self.criteria_names[k])
+        
+        self.fill_table(self.criteria_table, self.criteria_matrix, self.criteria_names)
+        for k, table in enumerate(self.alternative_tables):
+            self.tab_widget.setTabText(k, self.criteria_names[k])
+            self.fill_table(table, self.alternative_matrices[k], self.alternative_names)
+    
+    def fill_table(self, table, matrix, names):
+        table.blockSignals(True)
+        table.setRowCount(len(names))
+        table.setColumnCount(len(names))
+        table.setHorizontalHeaderLabels(names)
+        table.setVerticalHeaderLabels(names)
+        for i in range(len(names)):
+            for j in range(len(names)):
+                table.setItem(i, j, QTableWidgetItem(format_fraction(matrix[i, j])))
+        table.blockSignals(False)
+    
+    def matrix_for(self, crit_index):
+        return self.criteria_matrix if crit_index is None else self.alternative_matrices[crit_index]
+    
+    def table_for(self, crit_index):
+        return self.criteria_table if crit_index is None else self.alternative_tables[crit_index]
+    
+    def cell_changed(self, crit_index, item):
+        matrix = self.matrix_for(crit_index)
+        try:
+            matrix[item.row(), item.column()] = parse_fraction(item.text())
+        except (ValueError, ZeroDivisionError):
+            QMessageBox.warning(self, "Peringatan", f"Nilai tidak valid: {item.text()}")
+            table = self.table_for(crit_index)
+            table.blockSignals(True)
+            item.setText(format_fraction(matrix[item.row(), item.column()]))
+            table.blockSignals(False)
+    
+    def update_counts(self):
+        criteria_count = self.criteria_spin.value()
+        alternative_count = self.alternative_spin.value()
+        self.stored_criteria_names += [f"Kriteria {i+1}" for i in range(
+            len(self.stored_criteria_names), criteria_count)]
+        self.criteria_names = self.stored_criteria_names[:criteria_count]
+        self.alternative_names = [alternative_label(i) for i in range(alternative_count)]
+        if criteria_count > len(self.stored_criteria):
+            self.stored_criteria = resize_block(self.stored_criteria, criteria_count)
+        self.criteria_matrix = self.stored_criteria[:criteria_count, :criteria_count]
+        alternatives = resize_block(self.stored_alternatives, alternative_count)
+        missing = criteria_count - len(alternatives)
+        if missing > 0:
+            alternatives = np.concatenate(
+                [alternatives, resize_block(np.full((missing, 0, 0), np.nan), alternative_count)])
+        self.stored_alternatives = alternatives
+        self.alternative_matrices = alternatives[:criteria_count]
+        self.rebuild_tables()
+    
+    def set_data(self, criteria_matrix, alternative_matrices, criteria_names=None):
+        # Ganti seluruh data sekaligus (dipakai saat membuka proyek)
+        # File versi lama menyimpan sel kosong sebagai 0
+        criteria_matrix = np.array(criteria_matrix, dtype=float)
+        alternative_matrices = np.array(alternative_matrices, dtype=float)
+        criteria_matrix[criteria_matrix == 0] = np.nan
+        alternative_matrices[alternative_matrices == 0] = np.nan
+        criteria_count = criteria_matrix.shape[0]
+        alternative_count = alternative_matrices.shape[-1]
+        if alternative_matrices.shape != (criteria_count, alternative_count, alternative_count):
+            raise ValueError("Ukuran matriks alternatif tidak sesuai dengan jumlah kriteria")
+        self.criteria_names = list(criteria_names) if criteria_names else (
+            DEFAULT_CRITERIA + [f"Kriteria {i+1}" for i in range(3, criteria_count)])[:criteria_count]
+        self.alternative_names = [alternative_label(i) for i in range(alternative_count)]
+        self.stored_criteria = self.criteria_matrix = criteria_matrix
+        self.stored_criteria_names = list(self.criteria_names)
+        self.stored_alternatives = self.alternative_matrices = alternative_matrices
+        for spin, value in ((self.criteria_spin, criteria_count), (self.alternative_spin, alternative_count)):
+            spin.blockSignals(True)
+            spin.setValue(value)
+            spin.blockSignals(False)
+        self.rebuild_tables()
+    
+    def current_target(self):
+        # Tabel tujuan tempel/impor: tabel kriteria atau tab alternatif yang sedang aktif
+        if self.last_target is None or self.last_target >= len(self.alternative_tables):
+            return None
+        return self.tab_widget.currentIndex()
+    
+    def paste_clipboard(self, crit_index=False):
+        if crit_index is False:
+            crit_index = self.current_target()
+        self.ingest_text(crit_index, QApplication.clipboard().text())
+    
+    def import_csv(self):
+        crit_index = self.current_target()
+        file_name, _ = QFileDialog.getOpenFileName(self, "Impor Matriks CSV", "", 
+                                                   "CSV Files (*.csv);;All Files (*)")
+        if file_name:
+            try:
+                with open(file_name, 'r') as file:
+                    self.ingest_text(crit_index, file.read(), at_origin=True, csv=True)
+            except OSError as e:
+                QMessageBox.critical(self, "Error", f"Gagal membaca file:\n{str(e)}")
+    
+    def ingest_text(self, crit_index, text, at_origin=False, csv=False):
+        # Tempel blok mulai dari sel aktif (atau sel kiri atas untuk impor CSV)
+        rows = split_block(text, csv)
+        if not rows:
+            return
+        try:
+            values = parse_cells(rows)
+        except (ValueError, ZeroDivisionError) as e:
+            QMessageBox.critical(self, "Error", f"Data tidak valid:\n{str(e)}")
+            return
+        table = self.table_for(crit_index)
+        matrix = self.matrix_for(crit_index)
+        row, col = (0, 0) if at_origin else (max(table.currentRow(), 0), max(table.currentColumn(), 0))
+        block = values[:matrix.shape[0] - row, :matrix.shape[1] - col]
+        matrix[row:row + block.shape[0], col:col + block.shape[1]] = block
+        
+        table.blockSignals(True)
+        for i, j in np.ndindex(block.shape):
+            table.item(row + i, col + j).setText(format_fraction(block[i, j]))
+        table.blockSignals(False)
     
     def calculate_ahp(self):
         try:
-            # Baca matriks kriteria
-            criteria_matrix = np.zeros((3, 3))
-            for i in range(3):
-                for j in range(3):
-                    item = self.criteria_table.item(i, j)
-                    if item and item.text():
-                        val = item.text()
-                        if '/' in val:
-                            numerator, denominator = val.split('/')
-                            criteria_matrix[i, j] = float(numerator) / float(denominator)
-                        else:
-                            criteria_matrix[i, j] = float(val)
-                    else:
-                        criteria_matrix[i, j] = 1.0  # Default jika kosong
-            
-            # Baca matriks alternatif
-            alternative_matrices = []
-            for table in self.alternative_tables:
-                matrix = np.zeros((3, 3))
-                for i in range(3):
-                    for j in range(3):
-                        item = table.item(i, j)
-                        if item and item.text():
-                            val = item.text()
-                            if '/' in val:
-                                numerator, denominator = val.split('/')
-                                matrix[i, j] = float(numerator) / float(denominator)
-                            else:
-                                matrix[i, j] = float(val)
-                        else:
-                            if i == j:
-                                matrix[i, j] = 1.0  # Default diagonal
-                            else:
-                                # Jika kosong dan bukan diagonal, asumsikan kebalikan dari simetris
-                                if j < i and table.item(j, i) and table.item(j, i).text():
-                                    sym_val = table.item(j, i).text()
-                                    if '/' in sym_val:
-                                        numerator, denominator = sym_val.split('/')
-                                        matrix[i, j] = float(denominator) / float(numerator)
-                                    else:
-                                        matrix[i, j] = 1.0 / float(sym_val)
-                                else:
-                                    matrix[i, j] = 1.0  # Default jika tidak ada nilai
-                
-                alternative_matrices.append(matrix)
+            criteria_matrix = complete_matrices(self.criteria_matrix)
+            alternative_matrices = complete_matrices(self.alternative_matrices)
             
             # Hitung AHP
             criteria_weights, alternative_weights, final_scores = AHPCalculator.calculate_ahp(criteria_matrix, alternative_matrices)
@@ -170,22 +340,22 @@ class AHPTab(QWidget):
             # Tampilkan hasil
             result_text = "Hasil Perhitungan AHP:\n\n"
             result_text += "Bobot Kriteria:\n"
-            for i, weight in enumerate(criteria_weights):
-                result_text += f"- Kriteria {i+1}: {weight:.4f}\n"
+            for name, weight in zip(self.criteria_names, criteria_weights):
+                result_text += f"- {name}: {weight:.4f}\n"
             
             result_text += "\nBobot Alternatif per Kriteria:\n"
-            for i, weights in enumerate(alternative_weights):
-                result_text += f"Kriteria {i+1}:\n"
-                for j, weight in enumerate(weights):
-                    result_text += f"- Lokasi {chr(65+j)}: {weight:.4f}\n"
+            for name, weights in zip(self.criteria_names, alternative_weights):
+                result_text += f"{name}:\n"
+                for alt_name, weight in zip(self.alternative_names, weights):
+                    result_text += f"- {alt_name}: {weight:.4f}\n"
             
             result_text += "\nSkor Akhir:\n"
-            for i, score in enumerate(final_scores):
-                result_text += f"- Lokasi {chr(65+i)}: {score:.4f}\n"
+            for alt_name, score in zip(self.alternative_names, final_scores):
+                result_text += f"- {alt_name}: {score:.4f}\n"
             
             # Tentukan pemenang
             winner_index = np.argmax(final_scores)
-            result_text += f"\nLokasi Terbaik: Lokasi {chr(65+winner_index)} dengan skor {final_scores[winner_index]:.4f}"
+            result_text += f"\nLokasi Terbaik: {self.alternative_names[winner_index]} dengan skor {final_scores[winner_index]:.4f}"
             
             self.result_label.setText(result_text)
             
@@ -287,22 +457,8 @@ class MainWindow(QMainWindow):
                 with open(file_name, 'r') as file:
                     data = json.load(file)
                 
-                # Load criteria matrix
-                criteria_matrix = data['criteria_matrix']
-                for i in range(3):
-                    for j in range(3):
-                        item = QTableWidgetItem(str(criteria_matrix[i][j]))
-                        self.ahp_tab.criteria_table.setItem(i, j, item)
-                
-                # Load alternative matrices
-                alternative_matrices = data['alternative_matrices']
-                for k in range(3):
-                    matrix = alternative_matrices[k]
-                    table = self.ahp_tab.alternative_tables[k]
-                    for i in range(3):
-                        for j in range(3):
-                            item = QTableWidgetItem(str(matrix[i][j]))
-                            table.setItem(i, j, item)
+                self.ahp_tab.set_data(data['criteria_matrix'], data['alternative_matrices'],
+                                      data.get('criteria_names'))
                 
                 self.current_file = file_name
                 QMessageBox.information(self, "Sukses", "Proyek berhasil dimuat!")
@@ -328,46 +484,11 @@ class MainWindow(QMainWindow):
     
     def _save_to_file(self, file_name):
         try:
-            # Simpan kriteria
-            criteria_matrix = []
-            for i in range(3):
-                row = []
-                for j in range(3):
-                    item = self.ahp_tab.criteria_table.item(i, j)
-                    if item and item.text():
-                        val = item.text()
-                        if '/' in val:
-                            numerator, denominator = val.split('/')
-                            row.append(float(numerator) / float(denominator))
-                        else:
-                            row.append(float(val))
-                    else:
-                        row.append(1.0 if i == j else 0.0)
-                criteria_matrix.append(row)
-            
-            # Simpan alternatif
-            alternative_matrices = []
-            for table in self.ahp_tab.alternative_tables:
-                matrix = []
-                for i in range(3):
-                    row = []
-                    for j in range(3):
-                        item = table.item(i, j)
-                        if item and item.text():
-                            val = item.text()
-                            if '/' in val:
-                                numerator, denominator = val.split('/')
-                                row.append(float(numerator) / float(denominator))
-                            else:
-                                row.append(float(val))
-                        else:
-                            row.append(1.0 if i == j else 0.0)
-                    matrix.append(row)
-                alternative_matrices.append(matrix)
-            
+            # Data diambil langsung dari array, sel kosong dilengkapi seperti saat perhitungan
             data = {
-                'criteria_matrix': criteria_matrix,
-                'alternative_matrices': alternative_matrices
+                'criteria_names': self.ahp_tab.criteria_names,
+                'criteria_matrix': complete_matrices(self.ahp_tab.criteria_matrix).tolist(),
+                'alternative_matrices': complete_matrices(self.ahp_tab.alternative_matrices).tolist()
             }
             
             with open(file_name, 'w') as file:
@@ -0,0 +1,98 @@
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Tabel Random Index (RI) hasil simulasi Monte-Carlo untuk matriks berukuran besar.
+# RI(n) = (rata-rata lambda_max matriks resiprokal acak - n) / (n - 1)
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "random_index.json")
+DEFAULT_MAX_N = 500
+DEFAULT_SAMPLES = 500
+DEFAULT_SEED = 2024
+
+# Jumlah maksimum elemen matriks yang diproses sekaligus (membatasi pemakaian memori)
+CHUNK_ELEMENTS = 4_000_000
+
+SAATY_SCALE = np.array([1/9, 1/8, 1/7, 1/6, 1/5, 1/4, 1/3, 1/2, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+_table = None
+
+def _simulate(task):
+    # Rata-rata lambda_max untuk satu ukuran n; dijalankan di proses pekerja
+    from ahp_engine import AHPCalculator
+
+    n, samples, seed = task
+    rng = np.random.default_rng(seed)
+    iu = np.triu_indices(n, 1)
+    chunk = max(1, CHUNK_ELEMENTS // (n * n))
+    total = 0.0
+    for start in range(0, samples, chunk):
+        size = min(chunk, samples - start)
+        upper = rng.choice(SAATY_SCALE, size=(size, len(iu[0])))
+        matrices = np.ones((size, n, n))
+        matrices[:, iu[0], iu[1]] = upper
+        matrices[:, iu[1], iu[0]] = 1 / upper
+        weights = np.full((size, n), 1 / n)
+        _, lambda_max = AHPCalculator.power_iteration(matrices, weights)
+        total += lambda_max.sum()
+    return float((total / samples - n) / (n - 1))
+
+def generate_random_index(sizes, samples=DEFAULT_SAMPLES, seed=DEFAULT_SEED, workers=None):
+    # Setiap ukuran n memperoleh seed turunan sendiri sehingga hasil dapat diulang
+    # berapa pun jumlah proses yang dipakai
+    sizes = [int(n) for n in sizes]
+    seeds = [np.random.SeedSequence([seed, n]) for n in sizes]
+    tasks = [(n, samples, s) for n, s in zip(sizes, seeds)]
+    if workers == 1 or len(tasks) == 1:
+        values = [_simulate(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            values = list(executor.map(_simulate, tasks))
+    return dict(zip(sizes, values))
+
+def load_random_index():
+    global _table
+    if _table is None:
+        _table = {}
+        if os.path.exists(CACHE_FILE):
+            with open(CACHE_FILE, 'r') as f:
+                data = json.load(f)
+            _table = {int(n): value for n, value in data['values'].items()}
+    return _table
+
+def save_random_index(values, samples=DEFAULT_SAMPLES, seed=DEFAULT_SEED):
+    global _table
+    _table = {int(n): round(value, 6) for n, value in values.items()}
+    data = {
+        'samples': samples,
+        'seed': seed,
+        'values': {str(n): value for n, value in sorted(_table.items())}
+    }
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(data, f, indent=1)
+
+def random_index(n):
+    # Hanya membaca tabel tersimpan (dikirim bersama paket sampai DEFAULT_MAX_N);
+    # tabel diperluas secara eksplisit lewat: python random_index.py --max-n N
+    table = load_random_index()
+    if n not in table:
+        raise ValueError(f"Random Index untuk n={n} tidak ada di {os.path.basename(CACHE_FILE)}; "
+                         f"bangkitkan dengan: python random_index.py --max-n {n}")
+    return table[n]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bangkitkan tabel Random Index AHP")
+    parser.add_argument("--min-n", type=int, default=11)
+    parser.add_argument("--max-n", type=int, default=DEFAULT_MAX_N)
+    parser.add_argument("--samples", type=int, default=DEFAULT_SAMPLES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    # Ukuran besar dijadwalkan lebih dulu agar beban antar proses seimbang
+    sizes = range(args.max_n, args.min_n - 1, -1)
+    values = generate_random_index(sizes, args.samples, args.seed, args.workers)
+    save_random_index(values, args.samples, args.seed)
+    print(f"{len(values)} nilai RI disimpan ke {CACHE_FILE}")
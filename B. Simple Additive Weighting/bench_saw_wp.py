@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from saw1 import SAW
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "E. Weighted Product"))
+from wp1 import WP
+
+# Benchmark skor untuk banyak vektor bobot: loop Python per vektor bobot (normalisasi
+# ulang + jumlah/prod per baris) vs kernel bersama (normalisasi sekali + satu matmul)
+SIZES = [10_000, 100_000]
+CRITERIA = 10
+WEIGHT_VECTORS = 500
+
+def loop_saw(matrix, weight_matrix, benefit):
+    scores = []
+    for weights in weight_matrix:
+        normalized = np.where(benefit, matrix / matrix.max(axis=0), matrix.min(axis=0) / matrix)
+        scores.append((normalized * (weights / weights.sum())).sum(axis=1))
+    return np.column_stack(scores)
+
+def loop_wp(matrix, weight_matrix, benefit):
+    scores = []
+    for weights in weight_matrix:
+        exponent = np.where(benefit, 1, -1) * weights / weights.sum()
+        vector_s = np.prod(matrix ** exponent, axis=1)
+        scores.append(vector_s / vector_s.sum())
+    return np.column_stack(scores)
+
+def timed(function, *args):
+    t0 = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - t0
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    rng = np.random.default_rng(0)
+    weight_matrix = rng.uniform(1, 5, (WEIGHT_VECTORS, CRITERIA))
+    benefit = np.arange(CRITERIA) % 3 != 0
+
+    print(f"SAW/WP {CRITERIA} kriteria, {WEIGHT_VECTORS} vektor bobot")
+    for m in sizes:
+        matrix = rng.uniform(1, 100, (m, CRITERIA))
+        expected_saw, t_loop_saw = timed(loop_saw, matrix, weight_matrix, benefit)
+        expected_wp, t_loop_wp = timed(loop_wp, matrix, weight_matrix, benefit)
+        for dtype, rtol in ((np.float64, 1e-10), (np.float32, 1e-4)):
+            saw, t_saw = timed(lambda: SAW(matrix, benefit, dtype).score(weight_matrix))
+            wp, t_wp = timed(lambda: WP(matrix, benefit, dtype).preference(weight_matrix))
+            assert np.allclose(saw, expected_saw, rtol=rtol, atol=0)
+            assert np.allclose(wp, expected_wp, rtol=rtol * 10, atol=0)
+            name = np.dtype(dtype).name
+            print(f"  m={m:7,d} {name:7s}  SAW loop {t_loop_saw:6.2f} s kernel {t_saw:6.3f} s x{t_loop_saw / t_saw:6.1f}"
+                  f"   WP loop {t_loop_wp:6.2f} s kernel {t_wp:6.3f} s x{t_loop_wp / t_wp:6.1f}")
+
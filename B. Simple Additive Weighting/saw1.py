@@ -1 +1,60 @@
+import numpy as np
 
+# Kernel agregasi terbobot bersama untuk SAW (B) dan WP (E, di ruang log): matriks
+# ternormalisasi m x k dikalikan dengan W vektor bobot sekaligus (k x W).
+
+def normalize_weights(weights, dtype=np.float64):
+    # Satu vektor (k) atau tumpukan vektor bobot (W x k), setiap baris berjumlah 1
+    weights = np.asarray(weights, dtype=dtype)
+    return weights / weights.sum(axis=-1, keepdims=True)
+
+def aggregate(values, weights):
+    # values m x k, weights k -> skor m; weights W x k -> skor m x W (satu matmul)
+    return values @ weights.T
+
+def normalize(matrix, benefit, dtype=np.float64):
+    # Normalisasi SAW: benefit x / maks kolom, cost min kolom / x
+    matrix = np.asarray(matrix, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    normalized = np.where(benefit, matrix / matrix.max(axis=0), matrix.min(axis=0) / matrix)
+    return normalized.astype(dtype)
+
+def rank(scores):
+    # Peringkat (1 = terbaik) per kolom skor; untuk skor m x W hasilnya m x W
+    order = np.argsort(-scores, axis=0, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(scores) + 1).reshape(
+        (-1,) + (1,) * (scores.ndim - 1)), axis=0)
+    return ranks
+
+class SAW:
+    # Normalisasi dihitung sekali; setiap pemanggilan score hanya satu matmul,
+    # berapa pun jumlah vektor bobotnya. dtype=np.float32 menghemat memori dan
+    # mempercepat matmul untuk m x W besar.
+    def __init__(self, matrix, benefit, dtype=np.float64):
+        self.dtype = dtype
+        self.normalized = normalize(matrix, benefit, dtype)
+
+    def score(self, weights):
+        return aggregate(self.normalized, normalize_weights(weights, self.dtype))
+
+    def best(self, weights):
+        # Indeks alternatif terbaik untuk setiap vektor bobot
+        return np.argmax(self.score(weights), axis=0)
+
+def saw(matrix, weights, benefit):
+    scores = SAW(matrix, benefit).score(weights)
+    return scores, rank(scores)
+
+if __name__ == "__main__":
+    import sys
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python saw1.py <matriks.csv> <bobot,...> <benefit: 1,0,...>")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    scores, ranks = saw(data.to_numpy(dtype=float), weights, benefit)
+    for index in np.argsort(ranks, kind='stable'):
+        print(f"{ranks[index]:3d}. Alternatif {index + 1}: {scores[index]:.4f}")
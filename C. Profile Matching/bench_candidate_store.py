@@ -0,0 +1,108 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from candidate_store import CandidateStore
+from profile_matching import ProfileMatching, ranking
+
+# Benchmark penyimpanan kandidat: list berisi dict per kandidat + DataFrame baru setiap
+# proses vs CandidateStore (kolom int16, nama terinternalisasi, frame dipakai ulang).
+# Diukur memori per kandidat (tracemalloc), waktu impor massal, dan latensi peringkat ulang.
+CANDIDATES = 1_000_000
+KRITERIA = ["Akademik", "Ekonomi", "Kepribadian"]
+TARGET = [4, 4, 3]
+CORE = [True, True, False]
+APPEND_SAMPLE = 200_000
+
+def measured(function):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - t0
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+def rerank_list(kandidat_list, engine):
+    df = pd.DataFrame(kandidat_list)
+    _, _, total = engine.evaluate(df[KRITERIA].to_numpy())
+    df["Total Skor"] = total
+    df = df.sort_values(by="Total Skor", ascending=False, kind="stable")
+    df["Ranking"] = range(1, len(df) + 1)
+    return df
+
+def rerank_store(store, engine):
+    _, _, total = engine.evaluate(store.matrix)
+    order, ranks = ranking(total)
+    return store.frame().assign(**{"Total Skor": total, "Ranking": ranks}).iloc[order]
+
+def best_time(function, repeats=3):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - t0)
+    return result, min(times)
+
+if __name__ == "__main__":
+    m = int(sys.argv[1]) if len(sys.argv) > 1 else CANDIDATES
+    rng = np.random.default_rng(0)
+    scores = rng.integers(1, 6, (m, len(KRITERIA)))
+    names = np.array([f"Kandidat {i}" for i in range(m)], dtype=object)
+    engine = ProfileMatching(TARGET, CORE)
+
+    def build_list():
+        return [{"Nama": name, **dict(zip(KRITERIA, map(int, row)))} for name, row in zip(names, scores)]
+    kandidat_list, t_list, list_bytes = measured(build_list)
+
+    def build_store():
+        store = CandidateStore(KRITERIA)
+        store.extend(names, scores)
+        return store
+    store, t_store, store_bytes = measured(build_store)
+
+    print(f"{m:,} kandidat, {len(KRITERIA)} kriteria (nama unik)")
+    print(f"  memori   list dict {list_bytes / m:6.1f} B/kandidat   store {store_bytes / m:6.1f} B/kandidat"
+          f" (kolom {store.nbytes / m:.0f} B + tabel nama)")
+
+    # Nama berulang: hanya kode int32 per kandidat, tabel nama kecil
+    repeated = names[rng.integers(0, 1000, m)]
+    def build_repeated():
+        repeated_store = CandidateStore(KRITERIA)
+        repeated_store.extend(repeated, scores)
+        return repeated_store
+    _, _, repeated_bytes = measured(build_repeated)
+    print(f"  memori   store dengan 1000 nama berulang {repeated_bytes / m:6.1f} B/kandidat")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "kandidat.csv")
+        pd.DataFrame({"Nama": names, **dict(zip(KRITERIA, scores.T))}).to_csv(path, index=False)
+        imported = CandidateStore(KRITERIA)
+        _, t_import = best_time(lambda: (imported.clear(), imported.import_file(path)), repeats=1)
+        assert np.array_equal(imported.matrix, scores)
+    print(f"  bangun   list dict {t_list:6.2f} s   store.extend {t_store:6.2f} s   impor CSV {t_import:6.2f} s")
+
+    expected, t_rerank_list = best_time(lambda: rerank_list(kandidat_list, engine))
+    result, t_rerank_store = best_time(lambda: rerank_store(store, engine))
+    assert np.array_equal(result["Ranking"].to_numpy(), expected["Ranking"].to_numpy())
+    assert np.array_equal(result["Nama"].astype(str).to_numpy(), expected["Nama"].to_numpy())
+    print(f"  peringkat ulang   list dict {t_rerank_list:6.3f} s   store {t_rerank_store:6.3f} s"
+          f"   x{t_rerank_list / t_rerank_store:5.1f}")
+
+    sample = min(APPEND_SAMPLE, m)
+    t0 = time.perf_counter()
+    appended = CandidateStore(KRITERIA)
+    for name, row in zip(names[:sample], scores[:sample].tolist()):
+        appended.append(name, row)
+    t_append = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    growing = []
+    for name, row in zip(names[:sample], scores[:sample].tolist()):
+        growing.append({"Nama": name, **dict(zip(KRITERIA, row))})
+    t_dict = time.perf_counter() - t0
+    print(f"  tambah satu per satu   list dict {t_dict / sample * 1e6:5.2f} us   store {t_append / sample * 1e6:5.2f} us")
@@ -0,0 +1,137 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Kapasitas awal; kapasitas berlipat dua saat penuh sehingga penambahan satu per satu
+# tetap O(1) teramortisasi
+INITIAL_CAPACITY = 1024
+
+class CandidateStore:
+    # Penyimpanan kandidat kolumnar: nilai kriteria dalam satu blok integer berurutan
+    # kolom (order='F', setiap kolom kriteria bersebelahan di memori, matriks m x k
+    # tersedia tanpa salinan) dan nama sebagai kode int32 ke tabel nama unik.
+    # DataFrame dasar dibuat sekali dan dipakai ulang sampai data berubah.
+    # limits (opsional): rentang nilai yang diterima, mis. skala penilaian 1..5;
+    # tanpa limits seluruh rentang dtype diterima.
+    def __init__(self, criteria, dtype=np.int16, capacity=INITIAL_CAPACITY, limits=None):
+        self.criteria = list(criteria)
+        self.dtype = np.dtype(dtype)
+        info = np.iinfo(self.dtype)
+        self.limits = (int(info.min), int(info.max)) if limits is None else (int(limits[0]), int(limits[1]))
+        if not info.min <= self.limits[0] <= self.limits[1] <= info.max:
+            raise ValueError("Rentang nilai kriteria tidak sesuai dengan tipe data")
+        self.size = 0
+        self.scores = np.empty((capacity, len(self.criteria)), dtype=self.dtype, order='F')
+        self.codes = np.empty(capacity, dtype=np.int32)
+        self.names = []
+        self._name_codes = {}
+        self._frame = None
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def matrix(self):
+        return self.scores[:self.size]
+
+    def column(self, criterion):
+        return self.scores[:self.size, self.criteria.index(criterion)]
+
+    @property
+    def nbytes(self):
+        # Memori kolom yang terpakai (tanpa tabel nama)
+        return self.size * (self.scores.shape[1] * self.dtype.itemsize + self.codes.itemsize)
+
+    def _reserve(self, extra):
+        needed = self.size + extra
+        if needed <= len(self.codes):
+            return
+        capacity = max(needed, 2 * len(self.codes))
+        scores = np.empty((capacity, len(self.criteria)), dtype=self.dtype, order='F')
+        scores[:self.size] = self.scores[:self.size]
+        codes = np.empty(capacity, dtype=np.int32)
+        codes[:self.size] = self.codes[:self.size]
+        self.scores, self.codes = scores, codes
+
+    def _checked(self, values):
+        values = np.asarray(values)
+        if values.size and not np.issubdtype(values.dtype, np.integer):
+            if not np.all(np.isfinite(values)) or not np.all(values == np.round(values)):
+                raise ValueError("Nilai kriteria harus bilangan bulat")
+        low, high = self.limits
+        if values.size and (values.min() < low or values.max() > high):
+            raise ValueError(f"Nilai kriteria harus di antara {low} dan {high}")
+        return values.astype(self.dtype)
+
+    def _intern_one(self, name):
+        code = self._name_codes.get(name)
+        if code is None:
+            code = self._name_codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def _intern(self, names):
+        codes, uniques = pd.factorize(np.asarray(names, dtype=object))
+        if (codes < 0).any():
+            raise ValueError("Nama kandidat tidak boleh kosong")
+        lookup = np.fromiter((self._intern_one(str(name)) for name in uniques), dtype=np.int32,
+                             count=len(uniques))
+        return lookup[codes]
+
+    def append(self, name, values):
+        # Jalur cepat untuk satu kandidat dari form: pemeriksaan dengan Python biasa
+        if not name:
+            raise ValueError("Nama kandidat tidak boleh kosong")
+        if len(values) != len(self.criteria):
+            raise ValueError(f"Jumlah nilai harus {len(self.criteria)}")
+        low, high = self.limits
+        if not all(isinstance(value, (int, np.integer)) and low <= value <= high for value in values):
+            raise ValueError(f"Nilai kriteria harus bilangan bulat di antara {low} dan {high}")
+        self._reserve(1)
+        self.scores[self.size] = values
+        self.codes[self.size] = self._intern_one(name)
+        self.size += 1
+        self._frame = None
+
+    def extend(self, names, values):
+        values = self._checked(values).reshape(-1, len(self.criteria))
+        if len(values) != len(names):
+            raise ValueError("Jumlah nama dan baris nilai tidak sama")
+        codes = self._intern(names)
+        self._reserve(len(values))
+        self.scores[self.size:self.size + len(values)] = values
+        self.codes[self.size:self.size + len(values)] = codes
+        self.size += len(values)
+        self._frame = None
+
+    def import_file(self, path, name_column="Nama"):
+        # Impor massal dari CSV atau Excel dengan kolom nama dan semua kriteria
+        columns = [name_column] + self.criteria
+        if os.path.splitext(path)[1].lower() in ('.xlsx', '.xls'):
+            frame = pd.read_excel(path)
+        else:
+            frame = pd.read_csv(path, usecols=lambda column: column in columns)
+        missing = [column for column in columns if column not in frame.columns]
+        if missing:
+            raise ValueError(f"Kolom tidak ditemukan: {', '.join(missing)}")
+        self.extend(frame[name_column].to_numpy(), frame[self.criteria].to_numpy())
+        return len(frame)
+
+    def clear(self):
+        # Tabel nama ikut dikosongkan agar frame() tidak membawa kategori lama
+        self.size = 0
+        self.names = []
+        self._name_codes = {}
+        self._frame = None
+
+    def frame(self):
+        # DataFrame dasar (Nama kategorikal + kolom kriteria); dibuat ulang hanya bila
+        # data berubah sejak pemanggilan terakhir
+        if self._frame is None:
+            names = pd.Categorical.from_codes(self.codes[:self.size], categories=self.names)
+            data = {"Nama": names}
+            for index, criterion in enumerate(self.criteria):
+                data[criterion] = self.scores[:self.size, index]
+            self._frame = pd.DataFrame(data)
+        return self._frame
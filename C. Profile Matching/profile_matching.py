@@ -0,0 +1,79 @@
+import numpy as np
+
+# Tabel bobot GAP (nilai kandidat - profil target) standar Profile Matching:
+#   0 -> 5, +1 -> 4.5, -1 -> 4, +2 -> 3.5, -2 -> 3, +3 -> 2.5, -3 -> 2, +4 -> 1.5, -4 -> 1
+# GAP_WEIGHTS[gap + GAP_OFFSET]; GAP di luar -4..4 memakai bobot ujung tabel.
+GAP_OFFSET = 4
+GAP_WEIGHTS = np.array([1, 2, 3, 4, 5, 4.5, 3.5, 2.5, 1.5])
+
+# Skala nilai kriteria kandidat dan profil target. Tabel GAP hanya membedakan selisih
+# -4..4, tepat untuk skala 1..5; nilai mentah (mis. tahun pengalaman) harus dipetakan
+# ke skala ini lebih dulu agar GAP tidak terpotong.
+SCALE = (1, 5)
+
+# Persentase core factor; secondary factor = 1 - CORE_FACTOR
+CORE_FACTOR = 0.6
+
+def gap_weights(gaps, table=GAP_WEIGHTS, offset=GAP_OFFSET):
+    # Pemetaan GAP -> bobot untuk seluruh array sekaligus lewat indeks tabel
+    index = np.clip(np.asarray(gaps, dtype=np.int64) + offset, 0, len(table) - 1)
+    return table[index]
+
+class ProfileMatching:
+    # target: profil ideal per kriteria. core: True untuk core factor, False untuk
+    # secondary factor. aspects (opsional): indeks aspek setiap kriteria, dengan
+    # aspect_weights sebagai persentase aspek pada nilai total.
+    #   NCF/NSF per aspek = rata-rata bobot GAP kriteria core/secondary aspek tersebut
+    #   nilai aspek       = core_factor * NCF + (1 - core_factor) * NSF
+    #   total             = jumlah persentase aspek * nilai aspek
+    # Rata-rata per aspek dikerjakan sebagai satu perkalian matriks m x k dengan k x 2 aspek.
+    def __init__(self, target, core, core_factor=CORE_FACTOR, aspects=None, aspect_weights=None,
+                 table=GAP_WEIGHTS, offset=GAP_OFFSET):
+        self.target = np.asarray(target, dtype=np.int64)
+        core = np.asarray(core, dtype=bool)
+        if len(core) != len(self.target):
+            raise ValueError("Jumlah kriteria core/secondary harus sama dengan profil target")
+        if not 0 <= core_factor <= 1:
+            raise ValueError("Persentase core factor harus di antara 0 dan 1")
+        aspects = np.zeros(len(core), dtype=np.int64) if aspects is None else np.asarray(aspects)
+        count = aspects.max() + 1
+        self.aspect_weights = (np.full(count, 1 / count) if aspect_weights is None
+                               else np.asarray(aspect_weights, dtype=float))
+        if len(self.aspect_weights) != count:
+            raise ValueError("Jumlah persentase aspek tidak sesuai")
+
+        member = aspects[:, None] == np.arange(count)
+        core_member = member & core[:, None]
+        secondary_member = member & ~core[:, None]
+        core_count = core_member.sum(axis=0)
+        secondary_count = secondary_member.sum(axis=0)
+        # Aspek tanpa kriteria secondary (atau core) hanya memakai faktor yang ada
+        core_share = np.where(secondary_count == 0, 1.0, np.where(core_count == 0, 0.0, core_factor))
+        # Kolom 0..A-1: rata-rata core per aspek, kolom A..2A-1: rata-rata secondary
+        self.means = np.hstack([core_member / np.maximum(core_count, 1),
+                                secondary_member / np.maximum(secondary_count, 1)])
+        self.core_share = core_share
+        self.core_factor = core_factor
+        self.table = np.asarray(table, dtype=float)
+        self.offset = offset
+
+    def weights(self, scores):
+        return gap_weights(np.asarray(scores) - self.target, self.table, self.offset)
+
+    def evaluate(self, scores):
+        # Mengembalikan NCF (m x aspek), NSF (m x aspek) dan total (m)
+        factors = self.weights(scores) @ self.means
+        count = len(self.aspect_weights)
+        ncf, nsf = factors[:, :count], factors[:, count:]
+        aspect_score = self.core_share * ncf + (1 - self.core_share) * nsf
+        return ncf, nsf, aspect_score @ self.aspect_weights
+
+    def total(self, scores):
+        return self.evaluate(scores)[2]
+
+def ranking(total):
+    # Urutan indeks dari total terbesar dan peringkat (1 = terbaik) per kandidat
+    order = np.argsort(-total, kind='stable')
+    ranks = np.empty(len(total), dtype=np.int64)
+    ranks[order] = np.arange(1, len(total) + 1)
+    return order, ranks
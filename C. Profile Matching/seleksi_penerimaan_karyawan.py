@@ -1,6 +1,19 @@
+import os
 import sys
-import pandas as pd
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QTableWidget, QTableWidgetItem, QFileDialog, QLineEdit, QHBoxLayout
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QPushButton, QLabel, QFileDialog, QLineEdit, QHBoxLayout, QSpinBox, QMessageBox, QProgressBar
+
+# Tabel hasil virtual (result_view.py) dan ekspor (result_export.py) ada di folder induk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from result_export import ExportThread, export_format
+from result_view import ResultView
+from candidate_store import CandidateStore
+from profile_matching import CORE_FACTOR, SCALE, ProfileMatching, ranking
+
+# Kriteria, profil target awal dan pembagian core (True) / secondary (False) factor.
+# Nilai kandidat dan target memakai skala SCALE (1..5)
+KRITERIA = ["Pengalaman", "Kemampuan", "Kepribadian"]
+TARGET = [3, 4, 3]
+CORE = [True, True, False]
 
 class KaryawanApp(QWidget):
     def __init__(self):
@@ -22,27 +35,49 @@ class KaryawanApp(QWidget):
         form_layout.addWidget(self.nama_input)
         
         self.pengalaman_input = QLineEdit()
-        self.pengalaman_input.setPlaceholderText("Pengalaman Kerja (tahun)")
+        self.pengalaman_input.setPlaceholderText(f"Pengalaman Kerja ({SCALE[0]}-{SCALE[1]})")
         form_layout.addWidget(self.pengalaman_input)
         
         self.kemampuan_input = QLineEdit()
-        self.kemampuan_input.setPlaceholderText("Kemampuan")
+        self.kemampuan_input.setPlaceholderText(f"Kemampuan ({SCALE[0]}-{SCALE[1]})")
         form_layout.addWidget(self.kemampuan_input)
         
         self.kepribadian_input = QLineEdit()
-        self.kepribadian_input.setPlaceholderText("Kepribadian")
+        self.kepribadian_input.setPlaceholderText(f"Kepribadian ({SCALE[0]}-{SCALE[1]})")
         form_layout.addWidget(self.kepribadian_input)
         
         self.btn_tambah = QPushButton("Tambah Kandidat")
         self.btn_tambah.clicked.connect(self.tambah_kandidat)
         form_layout.addWidget(self.btn_tambah)
         
+        self.btn_impor = QPushButton("Impor CSV/Excel")
+        self.btn_impor.clicked.connect(self.impor_kandidat)
+        form_layout.addWidget(self.btn_impor)
+        
         layout.addLayout(form_layout)
         
+        profil_layout = QHBoxLayout()
+        profil_layout.addWidget(QLabel("Profil Target:"))
+        self.target_inputs = []
+        for kriteria, target in zip(KRITERIA, TARGET):
+            spin = QSpinBox()
+            spin.setRange(*SCALE)
+            spin.setValue(target)
+            spin.setPrefix(f"{kriteria}: ")
+            profil_layout.addWidget(spin)
+            self.target_inputs.append(spin)
+        self.core_input = QSpinBox()
+        self.core_input.setRange(0, 100)
+        self.core_input.setValue(int(CORE_FACTOR * 100))
+        self.core_input.setPrefix("Core Factor: ")
+        self.core_input.setSuffix("%")
+        profil_layout.addWidget(self.core_input)
+        layout.addLayout(profil_layout)
+        
         self.label_hasil = QLabel("Hasil Seleksi Karyawan:")
         layout.addWidget(self.label_hasil)
         
-        self.table = QTableWidget()
+        self.table = ResultView()
         layout.addWidget(self.table)
         
         self.btn_proses = QPushButton("Proses Seleksi")
@@ -53,9 +88,13 @@ class KaryawanApp(QWidget):
         self.btn_simpan.clicked.connect(self.simpan_excel)
         layout.addWidget(self.btn_simpan)
         
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+        
         self.setLayout(layout)
         
-        self.kandidat_list = []
+        self.kandidat = CandidateStore(KRITERIA, limits=SCALE)
     
     def tambah_kandidat(self):
         nama = self.nama_input.text()
@@ -64,47 +103,79 @@ class KaryawanApp(QWidget):
         kepribadian = self.kepribadian_input.text()
         
         if nama and pengalaman and kemampuan and kepribadian:
-            self.kandidat_list.append({
-                "Nama": nama,
-                "Pengalaman": int(pengalaman),
-                "Kemampuan": int(kemampuan),
-                "Kepribadian": int(kepribadian)
-            })
+            try:
+                self.kandidat.append(nama, [int(pengalaman), int(kemampuan), int(kepribadian)])
+            except ValueError as e:
+                QMessageBox.warning(self, "Data Tidak Valid", str(e))
+                return
         
         self.nama_input.clear()
         self.pengalaman_input.clear()
         self.kemampuan_input.clear()
         self.kepribadian_input.clear()
     
+    def impor_kandidat(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Impor Kandidat", "", "Data Files (*.csv *.xlsx *.xls);;All Files (*)")
+        if file_name:
+            try:
+                jumlah = self.kandidat.import_file(file_name)
+            except Exception as e:
+                QMessageBox.critical(self, "Error", f"Gagal mengimpor file: {str(e)}")
+                return
+            self.label.setText(f"Masukkan Data Kandidat: ({len(self.kandidat)} kandidat, {jumlah} diimpor)")
+    
     def proses_seleksi(self):
-        if not self.kandidat_list:
+        if not len(self.kandidat):
             return
         
-        df = pd.DataFrame(self.kandidat_list)
-        df["Total Skor"] = df[["Pengalaman", "Kemampuan", "Kepribadian"]].mean(axis=1)
-        df = df.sort_values(by="Total Skor", ascending=False)
-        df["Ranking"] = range(1, len(df) + 1)
+        engine = ProfileMatching([spin.value() for spin in self.target_inputs], CORE,
+                                 self.core_input.value() / 100)
+        ncf, nsf, total = engine.evaluate(self.kandidat.matrix)
+        order, ranks = ranking(total)
+        # Frame dasar dipakai ulang antar proses; kolom hasil ditambahkan pada salinan malas
+        df = self.kandidat.frame().assign(NCF=ncf[:, 0], NSF=nsf[:, 0], **{"Total Skor": total, "Ranking": ranks})
+        df = df.iloc[order]
         
         self.tampilkan_hasil(df)
     
     def tampilkan_hasil(self, df):
-        self.table.setRowCount(len(df))
-        self.table.setColumnCount(len(df.columns))
-        self.table.setHorizontalHeaderLabels(df.columns)
-        
-        for row_idx, row_data in df.iterrows():
-            for col_idx, value in enumerate(row_data):
-                self.table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+        self.table.set_frame(df)
     
     def simpan_excel(self):
+        model = self.table.model
+        if model.frame is None:
+            QMessageBox.warning(self, "Error", "Belum ada hasil seleksi untuk disimpan!")
+            return
         options = QFileDialog.Options()
-        file_name, _ = QFileDialog.getSaveFileName(self, "Simpan File", "", "Excel Files (*.xlsx);;All Files (*)", options=options)
+        file_name, _ = QFileDialog.getSaveFileName(self, "Simpan File", "", "Excel Files (*.xlsx);;CSV Files (*.csv);;Parquet Files (*.parquet);;All Files (*)", options=options)
         if file_name:
-            data = []
-            for row in range(self.table.rowCount()):
-                data.append([self.table.item(row, col).text() for col in range(self.table.columnCount())])
-            df = pd.DataFrame(data, columns=[self.table.horizontalHeaderItem(i).text() for i in range(self.table.columnCount())])
-            df.to_excel(file_name, index=False)
+            # Tanpa ekstensi disimpan sebagai Excel; ekstensi lain yang tidak dikenal ditolak
+            if not os.path.splitext(file_name)[1]:
+                file_name += ".xlsx"
+            try:
+                export_format(file_name)
+            except ValueError as e:
+                QMessageBox.warning(self, "Error", str(e))
+                return
+            # Ekspor langsung dari array kolom tabel hasil, sesuai urutan dan filter yang tampil
+            self.ekspor = ExportThread(file_name, model.headers, model.arrays, model.view, self)
+            self.ekspor.progress.connect(self.progress_bar.setValue)
+            self.ekspor.saved.connect(self.ekspor_selesai)
+            self.ekspor.failed.connect(self.ekspor_gagal)
+            self.btn_simpan.setEnabled(False)
+            self.progress_bar.setValue(0)
+            self.progress_bar.show()
+            self.ekspor.start()
+    
+    def ekspor_selesai(self, file_name):
+        self.btn_simpan.setEnabled(True)
+        self.progress_bar.hide()
+        QMessageBox.information(self, "Sukses", f"Hasil disimpan ke {file_name}")
+    
+    def ekspor_gagal(self, pesan):
+        self.btn_simpan.setEnabled(True)
+        self.progress_bar.hide()
+        QMessageBox.critical(self, "Error", f"Gagal menyimpan file: {pesan}")
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
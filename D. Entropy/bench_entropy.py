@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from entropy1 import (EntropyAggregate, aggregate, entropy_weights, entropy_weights_parallel,
+                      entropy_weights_streaming, read_chunks)
+
+# Pemeriksaan dan benchmark bobot entropy: dua lintasan di memori (acuan) vs agregat
+# satu lintasan yang digabung secara streaming, dalam urutan acak, dan lewat proses paralel
+ROWS = 4_000_000
+CRITERIA = 8
+PARTITIONS = 8
+# Toleransi relatif; bobot = d_j / jumlah d dengan d_j = 1 - e_j kecil, sehingga galat
+# pembulatan e_j (termasuk pada acuan dua lintasan) diperbesar sekitar 1 / d_j
+TOLERANCE = 1e-10
+
+def timed(func):
+    t0 = time.perf_counter()
+    result = func()
+    return time.perf_counter() - t0, result
+
+def tree_merge(partials):
+    # Gabung berpasangan seperti reduce pada map-reduce
+    while len(partials) > 1:
+        partials = [partials[i] + partials[i + 1] if i + 1 < len(partials) else partials[i]
+                    for i in range(0, len(partials), 2)]
+    return partials[0]
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    rng = np.random.default_rng(0)
+    matrix = rng.gamma(np.linspace(0.5, 5, CRITERIA), 10, (rows, CRITERIA))
+    matrix[rng.random(matrix.shape) < 0.01] = 0
+
+    directory = tempfile.mkdtemp()
+    parts = np.array_split(matrix, PARTITIONS)
+    files = [os.path.join(directory, f"partisi_{i}.npy") for i in range(PARTITIONS)]
+    for path, part in zip(files, parts):
+        np.save(path, part)
+
+    t_ref, reference = timed(lambda: entropy_weights(matrix))
+    t_stream, streaming = timed(lambda: entropy_weights_streaming(read_chunks(matrix)))
+    partials = [EntropyAggregate.from_chunk(chunk) for chunk in read_chunks(matrix, 100_003)]
+    shuffled = [partials[i] for i in rng.permutation(len(partials))]
+    t_tree, tree = timed(lambda: tree_merge(shuffled).weights())
+    t_files, from_files = timed(lambda: tree_merge([aggregate(path) for path in files]).weights())
+    t_parallel, parallel = timed(lambda: entropy_weights_parallel(files))
+
+    print(f"Bobot entropy, {rows:,d} baris x {CRITERIA} kriteria, {PARTITIONS} partisi")
+    for name, elapsed, weights in [("dua lintasan (acuan)", t_ref, reference),
+                                   ("streaming satu lintasan", t_stream, streaming),
+                                   ("gabung pohon, urutan acak", t_tree, tree),
+                                   ("per file lalu digabung", t_files, from_files),
+                                   ("proses paralel", t_parallel, parallel)]:
+        error = (np.abs(weights - reference) / reference).max()
+        assert error < TOLERANCE, f"{name}: selisih {error:.2e}"
+        print(f"  {name:28s} {elapsed:6.2f} s  selisih relatif maks {error:.1e}")
+
+    for path in files:
+        os.remove(path)
+    os.rmdir(directory)
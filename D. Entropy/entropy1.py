@@ -0,0 +1,105 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+# Pembaca potongan baris bersama di folder induk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from chunk_reader import CHUNK_ROWS, read_chunks
+
+def xlogx(values):
+    # x ln x dengan 0 ln 0 = 0 (ln 1 = 0 dipakai untuk x = 0)
+    return values * np.log(np.where(values > 0, values, 1))
+
+def entropy_weights(matrix):
+    # Metode entropy dua lintasan (acuan): p_ij = x_ij / jumlah kolom,
+    # e_j = -1/ln(m) * jumlah p_ij ln p_ij, d_j = 1 - e_j, w_j = d_j / jumlah d
+    matrix = np.asarray(matrix, dtype=float)
+    p = matrix / matrix.sum(axis=0)
+    entropy = -xlogx(p).sum(axis=0) / np.log(len(matrix))
+    divergence = 1 - entropy
+    return divergence / divergence.sum()
+
+class EntropyAggregate:
+    # Agregat parsial per kriteria yang cukup untuk menghitung bobot entropy:
+    #   T_j = jumlah x_ij,  L_j = jumlah x_ij ln x_ij (0 ln 0 = 0),  n = jumlah baris
+    # Karena jumlah p_ij = 1, jumlah p_ij ln p_ij = L_j / T_j - ln T_j, sehingga
+    # matriks tidak perlu disimpan. Penggabungan hanyalah penjumlahan (asosiatif
+    # dan komutatif), jadi agregat dari partisi/proses mana pun dapat digabung
+    # dalam urutan apa pun.
+    def __init__(self, criteria, total=None, x_log_x=None, count=0):
+        self.total = np.zeros(criteria) if total is None else np.asarray(total, dtype=float)
+        self.x_log_x = np.zeros(criteria) if x_log_x is None else np.asarray(x_log_x, dtype=float)
+        self.count = count
+
+    @classmethod
+    def from_chunk(cls, chunk):
+        chunk = np.asarray(chunk, dtype=float)
+        return cls(chunk.shape[1]).update(chunk)
+
+    def update(self, chunk):
+        chunk = np.asarray(chunk, dtype=float)
+        if (chunk < 0).any():
+            raise ValueError("Metode entropy membutuhkan nilai tidak negatif")
+        self.total += chunk.sum(axis=0)
+        self.x_log_x += xlogx(chunk).sum(axis=0)
+        self.count += len(chunk)
+        return self
+
+    def merge(self, other):
+        if len(self.total) != len(other.total):
+            raise ValueError("Jumlah kriteria agregat tidak sama")
+        return EntropyAggregate(len(self.total), self.total + other.total,
+                                self.x_log_x + other.x_log_x, self.count + other.count)
+
+    __add__ = merge
+
+    def entropy(self):
+        p_log_p = self.x_log_x / self.total - np.log(self.total)
+        return -p_log_p / np.log(self.count)
+
+    def weights(self):
+        divergence = 1 - self.entropy()
+        return divergence / divergence.sum()
+
+def aggregate(source, chunk_rows=CHUNK_ROWS):
+    # Satu lintasan atas satu sumber data; juga dipakai sebagai fungsi worker
+    result = None
+    for chunk in read_chunks(source, chunk_rows):
+        partial = EntropyAggregate.from_chunk(chunk)
+        result = partial if result is None else result.merge(partial)
+    if result is None:
+        raise ValueError(f"Sumber data kosong: {source}")
+    return result
+
+def merge_all(partials):
+    # Gabungkan agregat parsial; tanpa satu pun agregat tidak ada matriks untuk dihitung
+    partials = iter(partials)
+    first = next(partials, None)
+    if first is None:
+        raise ValueError("Matriks kosong: tidak ada potongan baris untuk dihitung")
+    return reduce(EntropyAggregate.merge, partials, first)
+
+def entropy_weights_streaming(chunks):
+    # Bobot dari iterable potongan baris tanpa menyimpan matriks
+    return merge_all(map(EntropyAggregate.from_chunk, chunks)).weights()
+
+def entropy_weights_parallel(sources, workers=None):
+    # Map-reduce: setiap file/partisi diagregasi oleh proses terpisah lalu digabung
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = list(executor.map(aggregate, sources))
+    return merge_all(partials).weights()
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Penggunaan: python entropy1.py <data1.csv|.npy> [data2 ...]")
+        sys.exit(1)
+    sources = sys.argv[1:]
+    if len(sources) == 1:
+        weights = aggregate(sources[0]).weights()
+    else:
+        weights = entropy_weights_parallel(sources, min(len(sources), os.cpu_count() or 1))
+    for j, weight in enumerate(weights):
+        print(f"Kriteria {j + 1}: {weight:.6f}")
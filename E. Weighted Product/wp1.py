@@ -1 +1,54 @@
+import os
+import sys
 
+import numpy as np
+
+# Kernel agregasi bersama ada di saw1.py (folder B)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "B. Simple Additive Weighting"))
+from saw1 import aggregate, normalize_weights, rank
+
+class WP:
+    # Weighted Product di ruang log: S_i = prod x_ij ^ w_j (w_j negatif untuk cost)
+    # menjadi ln S_i = sum w_j ln x_ij, yaitu matmul yang sama dengan SAW atas ln X.
+    # Tidak ada prod per baris; V dinormalisasi dari ln S sehingga exp tidak overflow.
+    def __init__(self, matrix, benefit, dtype=np.float64):
+        matrix = np.asarray(matrix, dtype=float)
+        if (matrix <= 0).any():
+            raise ValueError("Metode WP membutuhkan nilai positif")
+        self.dtype = dtype
+        self.log_matrix = np.log(matrix).astype(dtype)
+        self.sign = np.where(np.asarray(benefit, dtype=bool), 1, -1).astype(dtype)
+
+    def log_score(self, weights):
+        # ln S untuk satu vektor bobot (m) atau banyak vektor bobot (m x W)
+        return aggregate(self.log_matrix, normalize_weights(weights, self.dtype) * self.sign)
+
+    def score(self, weights):
+        return np.exp(self.log_score(weights))
+
+    def preference(self, weights):
+        # V_i = S_i / sum S, dihitung stabil dari ln S (pengurangan maksimum)
+        log_s = self.log_score(weights)
+        relative = np.exp(log_s - log_s.max(axis=0))
+        return relative / relative.sum(axis=0)
+
+    def best(self, weights):
+        return np.argmax(self.log_score(weights), axis=0)
+
+def wp(matrix, weights, benefit):
+    engine = WP(matrix, benefit)
+    vector_v = engine.preference(weights)
+    return engine.score(weights), vector_v, rank(vector_v)
+
+if __name__ == "__main__":
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python wp1.py <matriks.csv> <bobot,...> <benefit: 1,0,...>")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    vector_s, vector_v, ranks = wp(data.to_numpy(dtype=float), weights, benefit)
+    for index in np.argsort(ranks, kind='stable'):
+        print(f"{ranks[index]:3d}. Alternatif {index + 1}: S = {vector_s[index]:.4f}, V = {vector_v[index]:.4f}")
@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from topsis1 import CHUNK_ROWS, topsis, topsis_chunked
+
+# Benchmark TOPSIS bertahap (file .npy dibaca per potongan lewat mmap) vs TOPSIS
+# biasa yang memuat seluruh matriks. Memori puncak diukur dengan tracemalloc
+# (alokasi NumPy); halaman memmap tidak dihitung karena dikelola page cache OS.
+ROWS = [1_000_000, 4_000_000, 10_000_000]
+COLUMNS = 8
+TOP_K = 10
+
+def write_matrix(path, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    matrix = np.lib.format.open_memmap(path, mode='w+', dtype=float, shape=(rows, COLUMNS))
+    for start in range(0, rows, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, rows)
+        matrix[start:stop] = rng.uniform(1, 100, (stop - start, COLUMNS))
+    matrix.flush()
+
+def measure(func):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20, result
+
+def in_memory(path, weights, benefit):
+    closeness = topsis(np.load(path), weights, benefit)
+    return closeness, np.argsort(-closeness, kind='stable')[:TOP_K]
+
+if __name__ == "__main__":
+    rows_list = [int(arg) for arg in sys.argv[1:]] or ROWS
+    weights = np.linspace(1, 2, COLUMNS) / np.linspace(1, 2, COLUMNS).sum()
+    benefit = np.arange(COLUMNS) % 3 != 0
+    directory = tempfile.mkdtemp()
+    matrix_file = os.path.join(directory, "matriks.npy")
+    output_file = os.path.join(directory, "preferensi.npy")
+
+    print(f"TOPSIS {COLUMNS} kriteria, potongan {CHUNK_ROWS} baris")
+    for rows in rows_list:
+        write_matrix(matrix_file, rows)
+        t_mem, peak_mem, (expected, expected_top) = measure(lambda: in_memory(matrix_file, weights, benefit))
+        t_chunk, peak_chunk, (_, top) = measure(
+            lambda: topsis_chunked(matrix_file, weights, benefit, out=output_file, top_k=TOP_K))
+        closeness = np.load(output_file, mmap_mode='r')
+        assert np.allclose(closeness, expected, rtol=0, atol=1e-12)
+        assert np.array_equal(top, expected_top)
+        size = os.path.getsize(matrix_file) / 2**20
+        print(f"  baris={rows:11,d} ({size:7.0f} MB)  memori penuh {t_mem:6.2f} s puncak {peak_mem:7.0f} MB   "
+              f"bertahap {t_chunk:6.2f} s puncak {peak_chunk:5.0f} MB")
+        del closeness, expected
+
+    os.remove(matrix_file)
+    os.remove(output_file)
+    os.rmdir(directory)
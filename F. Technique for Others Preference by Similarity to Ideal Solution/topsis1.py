@@ -1 +1,127 @@
+import os
+import sys
 
+import numpy as np
+
+# Pembaca potongan baris (array, .npy mmap, CSV) bersama di folder induk
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from chunk_reader import read_chunks
+
+# Jumlah baris yang diproses per potongan; memori puncak ~ CHUNK_ROWS x kolom x 8 byte x 3
+CHUNK_ROWS = 262144
+
+def topsis(matrix, weights, benefit):
+    # TOPSIS biasa dengan seluruh matriks di memori (acuan untuk versi bertahap)
+    matrix = np.asarray(matrix, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    weighted = matrix / np.sqrt((matrix ** 2).sum(axis=0)) * weights
+    ideal = np.where(benefit, weighted.max(axis=0), weighted.min(axis=0))
+    anti_ideal = np.where(benefit, weighted.min(axis=0), weighted.max(axis=0))
+    distance_ideal = np.sqrt(((weighted - ideal) ** 2).sum(axis=1))
+    distance_anti = np.sqrt(((weighted - anti_ideal) ** 2).sum(axis=1))
+    return distance_anti / (distance_ideal + distance_anti)
+
+class ChunkedTOPSIS:
+    # TOPSIS dua tahap untuk matriks yang tidak muat di memori.
+    # Tahap 1 mengumpulkan jumlah kuadrat, maksimum dan minimum per kolom; karena
+    # normalisasi vektor hanya membagi setiap kolom dengan konstanta positif, solusi
+    # ideal/anti-ideal terbobot = (maks/min kolom) x bobot / norma kolom.
+    # Tahap 2 menghitung jarak dan nilai preferensi per potongan.
+    def __init__(self, weights, benefit, chunk_rows=CHUNK_ROWS):
+        self.weights = np.asarray(weights, dtype=float)
+        self.benefit = np.asarray(benefit, dtype=bool)
+        self.chunk_rows = chunk_rows
+        self.reset()
+
+    def reset(self):
+        # Kosongkan akumulator tahap 1
+        self.rows = 0
+        self.sum_squares = np.zeros(len(self.weights))
+        self.column_max = np.full(len(self.weights), -np.inf)
+        self.column_min = np.full(len(self.weights), np.inf)
+
+    @classmethod
+    def from_statistics(cls, weights, benefit, rows, sum_squares, column_max, column_min):
+        # Tahap 1 dari statistik kolom yang sudah dihitung di tempat lain
+        engine = cls(weights, benefit)
+        engine.rows = rows
+        engine.sum_squares = np.asarray(sum_squares, dtype=float)
+        engine.column_max = np.asarray(column_max, dtype=float)
+        engine.column_min = np.asarray(column_min, dtype=float)
+        engine.finalize()
+        return engine
+
+    def accumulate(self, chunk):
+        # Tahap 1 untuk satu potongan; dapat dipanggil berulang dalam urutan apa pun
+        self.rows += len(chunk)
+        self.sum_squares += np.einsum('ij,ij->j', chunk, chunk)
+        np.maximum(self.column_max, chunk.max(axis=0), out=self.column_max)
+        np.minimum(self.column_min, chunk.min(axis=0), out=self.column_min)
+
+    def finalize(self):
+        self.scale = self.weights / np.sqrt(self.sum_squares)
+        best = np.where(self.benefit, self.column_max, self.column_min)
+        worst = np.where(self.benefit, self.column_min, self.column_max)
+        self.ideal = best * self.scale
+        self.anti_ideal = worst * self.scale
+
+    def closeness(self, chunk):
+        # Tahap 2 untuk satu potongan
+        weighted = chunk * self.scale
+        diff = weighted - self.ideal
+        distance_ideal = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        np.subtract(weighted, self.anti_ideal, out=diff)
+        distance_anti = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        return distance_anti / (distance_ideal + distance_anti)
+
+    def run(self, source, out=None, top_k=None):
+        # source: array/memmap, path .npy atau .csv. out: array atau path .npy untuk
+        # nilai preferensi (dibuat sebagai memmap agar tidak perlu muat di memori).
+        # top_k: kembalikan juga indeks k alternatif terbaik, urut menurun.
+        # Setiap run mulai dari akumulator kosong, jadi instance dapat dipakai ulang.
+        self.reset()
+        for chunk in read_chunks(source, self.chunk_rows):
+            self.accumulate(chunk)
+        self.finalize()
+
+        if out is None:
+            out = np.empty(self.rows)
+        elif isinstance(out, str):
+            out = np.lib.format.open_memmap(out, mode='w+', dtype=float, shape=(self.rows,))
+        best_index = np.empty(0, dtype=np.int64)
+        best_value = np.empty(0)
+        start = 0
+        for chunk in read_chunks(source, self.chunk_rows):
+            values = self.closeness(chunk)
+            out[start:start + len(values)] = values
+            if top_k:
+                # Gabungkan kandidat terbaik sejauh ini dengan k terbaik potongan ini
+                local = np.argpartition(-values, min(top_k, len(values)) - 1)[:top_k]
+                best_index = np.concatenate([best_index, local + start])
+                best_value = np.concatenate([best_value, values[local]])
+                keep = np.argsort(-best_value, kind='stable')[:top_k]
+                best_index, best_value = best_index[keep], best_value[keep]
+            start += len(values)
+        if isinstance(out, np.memmap):
+            out.flush()
+        if top_k:
+            return out, best_index
+        return out
+
+def topsis_chunked(source, weights, benefit, chunk_rows=CHUNK_ROWS, out=None, top_k=None):
+    return ChunkedTOPSIS(weights, benefit, chunk_rows).run(source, out, top_k)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        print("Penggunaan: python topsis1.py <matriks.npy|.csv> <bobot,...> <benefit: 1,0,...> [k]")
+        sys.exit(1)
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    top_k = int(sys.argv[4]) if len(sys.argv) > 4 else 10
+    output = os.path.splitext(sys.argv[1])[0] + "_preferensi.npy"
+    _, ranking = topsis_chunked(sys.argv[1], weights, benefit, out=output, top_k=top_k)
+    print(f"Nilai preferensi disimpan ke {output}")
+    values = np.load(output, mmap_mode='r')
+    for rank, index in enumerate(ranking, 1):
+        print(f"{rank:3d}. Alternatif {index + 1}: {values[index]:.6f}")
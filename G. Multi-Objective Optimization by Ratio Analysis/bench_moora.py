@@ -0,0 +1,59 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from moora import RatioSums, moora_scores, rank
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "P. MOOSRA"))
+from moosra import moosra_scores
+
+# Benchmark MOORA + MOOSRA pada matriks yang sama: masing-masing menormalisasi sendiri
+# vs satu RatioSums bersama (norma kolom dan jumlah benefit/cost dihitung sekali).
+# Pengurutan peringkat dicatat terpisah karena memang berbeda untuk setiap metode.
+SIZES = [1_000_000, 4_000_000]
+CRITERIA = 10
+REPEATS = 3
+
+def naive(matrix, weights, benefit):
+    # Cara biasa: bentuk matriks ternormalisasi terbobot, lalu jumlahkan per baris
+    weighted = matrix / np.sqrt((matrix ** 2).sum(axis=0)) * weights
+    return weighted[:, benefit].sum(axis=1), weighted[:, ~benefit].sum(axis=1)
+
+def best_time(function):
+    times = []
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - t0)
+    return result, min(times)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 5, CRITERIA)
+    weights /= weights.sum()
+    benefit = np.arange(CRITERIA) % 3 != 0
+
+    print(f"MOORA/MOOSRA {CRITERIA} kriteria (waktu terbaik dari {REPEATS})")
+    for m in sizes:
+        matrix = rng.uniform(1, 100, (m, CRITERIA))
+        benefit_sum, cost_sum = naive(matrix, weights, benefit)
+
+        _, t_naive_both = best_time(lambda: (np.subtract(*naive(matrix, weights, benefit)),
+                                             np.divide(*naive(matrix, weights, benefit))))
+        _, t_moora = best_time(lambda: moora_scores(RatioSums(matrix, weights, benefit)))
+        _, t_moosra = best_time(lambda: moosra_scores(RatioSums(matrix, weights, benefit)))
+
+        def shared():
+            sums = RatioSums(matrix, weights, benefit)
+            return moora_scores(sums), moosra_scores(sums)
+        (moora_result, moosra_result), t_shared = best_time(shared)
+        _, t_rank = best_time(lambda: rank(moora_result))
+
+        assert np.allclose(moora_result, benefit_sum - cost_sum, rtol=1e-10, atol=1e-12)
+        assert np.allclose(moosra_result, benefit_sum / cost_sum, rtol=1e-10, atol=0)
+        print(f"  m={m:9,d}  naif keduanya {t_naive_both:5.2f} s   MOORA {t_moora:5.2f} s   MOOSRA {t_moosra:5.2f} s"
+              f"   bersama {t_shared:5.2f} s ({t_shared / max(t_moora, t_moosra):4.2f}x satu metode)"
+              f"   + peringkat {t_rank:5.2f} s per metode")
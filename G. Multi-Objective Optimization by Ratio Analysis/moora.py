@@ -1 +1,74 @@
+import os
+import sys
 
+import numpy as np
+
+# Peringkat memakai helper bersama di saw1.py (folder B)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "B. Simple Additive Weighting"))
+from saw1 import rank
+
+# Lapisan normalisasi vektor bersama untuk MOORA (folder G) dan MOOSRA (folder P).
+# x*_ij = x_ij / sqrt(jumlah x_ij^2); kedua metode hanya memakai jumlah terbobot
+# kriteria benefit dan cost, jadi keduanya dihitung sebagai satu perkalian
+# matriks m x k dengan k x 2 (bobot / norma kolom) tanpa membentuk matriks ternormalisasi.
+
+class RatioSums:
+    # Norma kolom dan jumlah benefit/cost dihitung sekali saat pertama dibutuhkan,
+    # lalu dipakai ulang oleh MOORA (selisih) dan MOOSRA (rasio). norms dapat diberikan
+    # bila norma kolom sudah dihitung di tempat lain.
+    def __init__(self, matrix, weights, benefit, dtype=np.float64, norms=None):
+        self.matrix = np.asarray(matrix, dtype=dtype)
+        self.weights = np.asarray(weights, dtype=dtype)
+        self.benefit = np.asarray(benefit, dtype=bool)
+        self._norms = norms
+        self._sums = None
+
+    @property
+    def norms(self):
+        if self._norms is None:
+            self._norms = np.sqrt(np.einsum('ij,ij->j', self.matrix, self.matrix))
+        return self._norms
+
+    @property
+    def normalized(self):
+        return self.matrix / self.norms
+
+    def sums(self):
+        # Kolom 0: jumlah terbobot kriteria benefit, kolom 1: kriteria cost
+        if self._sums is None:
+            scaled = self.weights / self.norms
+            coefficients = np.column_stack((np.where(self.benefit, scaled, 0),
+                                            np.where(self.benefit, 0, scaled)))
+            self._sums = self.matrix @ coefficients
+        return self._sums
+
+    @property
+    def benefit_sum(self):
+        return self.sums()[:, 0]
+
+    @property
+    def cost_sum(self):
+        return self.sums()[:, 1]
+
+def moora_scores(sums):
+    # y_i = jumlah benefit - jumlah cost
+    return sums.benefit_sum - sums.cost_sum
+
+def moora(matrix, weights, benefit, sums=None):
+    if sums is None:
+        sums = RatioSums(matrix, weights, benefit)
+    scores = moora_scores(sums)
+    return scores, rank(scores)
+
+if __name__ == "__main__":
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python moora.py <matriks.csv> <bobot,...> <benefit: 1,0,...>")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    scores, ranks = moora(data.to_numpy(dtype=float), weights, benefit)
+    for index in np.argsort(ranks, kind='stable'):
+        print(f"{ranks[index]:3d}. Alternatif {index + 1}: {scores[index]:.4f}")
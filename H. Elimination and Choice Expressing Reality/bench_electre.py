@@ -0,0 +1,83 @@
+import subprocess
+import sys
+
+import numpy as np
+
+from electre1 import ELECTRE, electre, electre_dense
+
+# Benchmark ELECTRE I bertile: waktu, throughput pasangan dan memori puncak
+# dibandingkan kebutuhan tensor m x m x k pada versi naif. Setiap ukuran dijalankan
+# di proses terpisah agar puncak RSS (VmHWM) tidak saling mempengaruhi.
+SIZES = [10_000, 20_000, 50_000]
+CRITERIA = 8
+# Ukuran kecil yang dibandingkan dengan versi naif: satu alternatif, batas byte
+# matriks bit, dan batas tile (tile_size = 8)
+CHECK_SIZES = [1, 2, 7, 9, 30, 100]
+
+PROBE = """
+import sys, time
+import numpy as np
+from electre1 import ELECTRE, kernel, outranking_counts, strongly_connected_components
+
+def rss_mb(field):
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field):
+                return int(line.split()[1]) / 1024
+
+m, criteria, dtype = int(sys.argv[1]), int(sys.argv[2]), np.dtype(sys.argv[3])
+rng = np.random.default_rng(0)
+matrix = rng.uniform(1, 100, (m, criteria))
+engine = ELECTRE(matrix, rng.uniform(1, 5, criteria), np.arange(criteria) % 4 != 0, dtype=dtype)
+base = rss_mb("VmRSS:")
+
+t0 = time.perf_counter()
+d_threshold = engine.discordance_mean()
+t1 = time.perf_counter()
+packed = engine.outranking(d_threshold=d_threshold)
+t2 = time.perf_counter()
+components = strongly_connected_components(packed, m)
+t3 = time.perf_counter()
+members = kernel(packed, m, components)
+t4 = time.perf_counter()
+outranking_counts(packed, m)
+t5 = time.perf_counter()
+print(t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4, len(components), len(members),
+      packed.nbytes / 2**20, rss_mb("VmHWM:") - base)
+"""
+
+def check(m, criteria=CRITERIA):
+    # Relasi bertile harus sama dengan tensor naif pada ambang default (rata-rata)
+    rng = np.random.default_rng(m)
+    matrix = rng.integers(1, 6, (m, criteria)).astype(float)
+    weights = rng.uniform(1, 5, criteria)
+    benefit = np.arange(criteria) % 4 != 0
+    engine = ELECTRE(matrix, weights, benefit, tile_size=8)
+    packed = engine.outranking()
+    expected = electre_dense(matrix, weights, benefit, engine.c_threshold, engine.d_threshold)
+    assert np.array_equal(np.unpackbits(packed, axis=1, count=m).astype(bool), expected)
+    result = electre(matrix, weights, benefit)
+    assert np.array_equal(result['outranking'], np.packbits(expected, axis=1))
+    assert len(result['kernel']) >= 1
+
+if __name__ == "__main__":
+    for m in CHECK_SIZES:
+        check(m)
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"ELECTRE I, {CRITERIA} kriteria")
+    for m in sizes:
+        for dtype in ("float64", "float32"):
+            out = subprocess.run([sys.executable, "-c", PROBE, str(m), str(CRITERIA), dtype],
+                                 capture_output=True, text=True, check=True)
+            values = out.stdout.split()
+            t_mean, t_rel, t_scc, t_kernel, t_count = map(float, values[:5])
+            components, members = int(values[5]), int(values[6])
+            packed_mb, peak_mb = float(values[7]), float(values[8])
+            pairs = m * m
+            dense_mb = pairs * CRITERIA * 8 / 2**20
+            print(f"  m={m:6d} {dtype:7s} ambang D {t_mean:6.1f} s  "
+                  f"outranking {t_rel:6.1f} s ({pairs / t_rel / 1e6:5.1f} juta pasangan/s)  "
+                  f"SCC {t_scc:5.1f} s ({components} komponen)  kernel {t_kernel:5.2f} s "
+                  f"({members} alternatif)  derajat {t_count:4.1f} s")
+            print(f"           matriks bit {packed_mb:7.1f} MB  tambahan RSS puncak {peak_mb:7.1f} MB  "
+                  f"(tensor naif m x m x k: {dense_mb:9.0f} MB)")
@@ -1 +1,261 @@
+import numpy as np
 
+# Ukuran sisi tile pasangan alternatif (harus kelipatan 8 agar hasil setiap tile
+# dapat langsung ditulis ke matriks bit); 128 x 128 float64 = 128 KB per array
+TILE_SIZE = 128
+
+# Jumlah bit bernilai 1 untuk setiap byte
+POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+def weighted_normalized(matrix, weights, benefit):
+    # Normalisasi vektor lalu dikali bobot; kolom cost dinegasikan sehingga pada
+    # semua kriteria nilai lebih besar berarti lebih baik (jarak tidak berubah)
+    matrix = np.asarray(matrix, dtype=float)
+    values = matrix / np.sqrt((matrix ** 2).sum(axis=0)) * np.asarray(weights, dtype=float)
+    return np.where(np.asarray(benefit, dtype=bool), values, -values)
+
+def concordance_discordance(values_a, values_b, weights, dtype=np.float64, concordance=True):
+    # Indeks untuk semua pasangan satu tile dalam DUA arah sekaligus, dihitung
+    # kriteria demi kriteria tanpa tensor a x b x k (diff = v_b - v_a):
+    #   C(a, b) = jumlah bobot dengan diff <= 0,  C(b, a) = jumlah bobot dengan diff >= 0
+    #   D(a, b) = maks(0, maks diff) / maks |diff|,  D(b, a) = maks(0, -min diff) / maks |diff|
+    # Hasil arah (b, a) berbentuk a x b (belum ditransposisi). Dengan concordance=False
+    # hanya discordance yang dihitung.
+    shape = (len(values_a), len(values_b))
+    highest = np.full(shape, -np.inf, dtype=dtype)
+    lowest = np.full(shape, np.inf, dtype=dtype)
+    diff = np.empty(shape, dtype=dtype)
+    if concordance:
+        forward = np.zeros(shape, dtype=dtype)
+        backward = np.zeros(shape, dtype=dtype)
+        mask = np.empty(shape, dtype=bool)
+        term = np.empty(shape, dtype=dtype)
+    for j, weight in enumerate(weights):
+        np.subtract(values_b[None, :, j], values_a[:, j, None], out=diff)
+        np.maximum(highest, diff, out=highest)
+        np.minimum(lowest, diff, out=lowest)
+        if concordance:
+            # mask x bobot lalu dijumlah; jauh lebih cepat daripada np.add(..., where=mask)
+            np.less_equal(diff, 0, out=mask)
+            np.multiply(mask, weight, out=term)
+            forward += term
+            np.greater_equal(diff, 0, out=mask)
+            np.multiply(mask, weight, out=term)
+            backward += term
+    np.negative(lowest, out=lowest)
+    denominator = np.maximum(highest, lowest)
+    positive = denominator > 0
+    discordance_forward = np.divide(np.maximum(highest, 0, out=highest), denominator,
+                                    out=np.zeros(shape, dtype=dtype), where=positive)
+    discordance_backward = np.divide(np.maximum(lowest, 0, out=lowest), denominator,
+                                     out=np.zeros(shape, dtype=dtype), where=positive)
+    if concordance:
+        return forward, discordance_forward, backward, discordance_backward
+    return discordance_forward, discordance_backward
+
+class ELECTRE:
+    # ELECTRE I bertile: indeks concordance/discordance tidak pernah disimpan utuh,
+    # hanya relasi outranking (a S b jika C >= c_threshold dan D <= d_threshold)
+    # yang disimpan sebagai matriks bit m x ceil(m/8). Hanya tile di atas diagonal
+    # yang dihitung; setiap tile sekaligus menghasilkan tile transposnya.
+    def __init__(self, matrix, weights, benefit, tile_size=TILE_SIZE, dtype=np.float64):
+        if tile_size % 8:
+            raise ValueError("tile_size harus kelipatan 8")
+        weights = np.asarray(weights, dtype=float)
+        weights = weights / weights.sum()
+        self.weights = weights.astype(dtype)
+        self.values = weighted_normalized(matrix, weights, benefit).astype(dtype)
+        self.m = len(self.values)
+        self.tile_size = tile_size
+        self.dtype = dtype
+
+    def tiles(self):
+        # Pasangan blok (a, b) dengan b >= a
+        size = self.tile_size
+        for a0 in range(0, self.m, size):
+            for b0 in range(a0, self.m, size):
+                yield a0, min(a0 + size, self.m), b0, min(b0 + size, self.m)
+
+    def tile(self, a0, a1, b0, b1, concordance=True):
+        return concordance_discordance(self.values[a0:a1], self.values[b0:b1], self.weights,
+                                       self.dtype, concordance)
+
+    def concordance_mean(self):
+        # Rata-rata C(a, b) untuk a != b tanpa membentuk pasangan: per kriteria,
+        # jumlah pasangan v_a >= v_b dihitung dari posisi setiap nilai pada kolom terurut
+        m = self.m
+        if m < 2:
+            # Satu alternatif: tidak ada pasangan a != b
+            return 0.0
+        total = 0.0
+        for j, weight in enumerate(self.weights):
+            column = self.values[:, j]
+            at_most = np.searchsorted(np.sort(column), column, side='right')
+            total += float(weight) * (at_most.sum() - m)
+        return total / (m * (m - 1))
+
+    def discordance_mean(self):
+        # Rata-rata D(a, b) untuk a != b (D(a, a) = 0); butuh satu lintasan tile.
+        # Tile diagonal sudah memuat kedua arah sehingga hanya dijumlah sekali.
+        if self.m < 2:
+            return 0.0
+        total = 0.0
+        for a0, a1, b0, b1 in self.tiles():
+            forward, backward = self.tile(a0, a1, b0, b1, concordance=False)
+            total += float(forward.sum(dtype=np.float64))
+            if a0 != b0:
+                total += float(backward.sum(dtype=np.float64))
+        return total / (self.m * (self.m - 1))
+
+    def outranking(self, c_threshold=None, d_threshold=None):
+        # Relasi outranking sebagai matriks bit (np.packbits, urutan bit besar);
+        # ambang default = rata-rata indeks seperti pada ELECTRE I klasik
+        self.c_threshold = self.concordance_mean() if c_threshold is None else c_threshold
+        self.d_threshold = self.discordance_mean() if d_threshold is None else d_threshold
+        packed = np.zeros((self.m, (self.m + 7) // 8), dtype=np.uint8)
+        for a0, a1, b0, b1 in self.tiles():
+            forward_c, forward_d, backward_c, backward_d = self.tile(a0, a1, b0, b1)
+            forward = (forward_c >= self.c_threshold) & (forward_d <= self.d_threshold)
+            if a0 == b0:
+                # Alternatif tidak outrank dirinya sendiri
+                np.fill_diagonal(forward, False)
+            else:
+                backward = (backward_c >= self.c_threshold) & (backward_d <= self.d_threshold)
+                packed[b0:b1, a0 // 8:(a1 + 7) // 8] = np.packbits(backward.T, axis=1)
+            packed[a0:a1, b0 // 8:(b1 + 7) // 8] = np.packbits(forward, axis=1)
+        return packed
+
+def set_bit(bits, node):
+    bits[node >> 3] |= np.uint8(0x80 >> (node & 7))
+
+def clear_bits(bits, nodes):
+    np.bitwise_and.at(bits, nodes >> 3, (~(0x80 >> (nodes & 7)) & 0xFF).astype(np.uint8))
+
+def nodes_of(bits, m):
+    return np.flatnonzero(np.unpackbits(bits, count=m))
+
+def strongly_connected_components(packed, m):
+    # Tarjan iteratif langsung pada matriks bit: tetangga yang belum dikunjungi
+    # dicari dengan AND baris terhadap bitset "belum dikunjungi", sehingga total
+    # kerja O(m^2 / 8) byte. Komponen dikembalikan dalam urutan topologis terbalik
+    # (komponen tujuan lebih dulu).
+    index = np.full(m, -1, dtype=np.int64)
+    low = np.zeros(m, dtype=np.int64)
+    unvisited = np.packbits(np.ones(m, dtype=bool))
+    on_stack = np.zeros_like(unvisited)
+    stack = []
+    components = []
+    counter = 0
+
+    def visit(node):
+        nonlocal counter
+        index[node] = low[node] = counter
+        counter += 1
+        stack.append(node)
+        set_bit(on_stack, node)
+        clear_bits(unvisited, np.array([node]))
+
+    for root in range(m):
+        if index[root] >= 0:
+            continue
+        visit(root)
+        path = [root]
+        while path:
+            node = path[-1]
+            candidates = packed[node] & unvisited
+            nonzero = np.flatnonzero(candidates)
+            if nonzero.size:
+                byte = int(nonzero[0])
+                child = byte * 8 + 8 - int(candidates[byte]).bit_length()
+                visit(child)
+                path.append(child)
+                continue
+
+            # Semua anak selesai: lowlink dari sisi ke node yang masih di stack
+            back = nodes_of(packed[node] & on_stack, m)
+            if back.size:
+                low[node] = min(low[node], index[back].min())
+            if low[node] == index[node]:
+                position = len(stack) - 1
+                while stack[position] != node:
+                    position -= 1
+                component = np.array(stack[position:], dtype=np.int64)
+                del stack[position:]
+                clear_bits(on_stack, component)
+                components.append(component)
+            path.pop()
+            if path:
+                low[path[-1]] = min(low[path[-1]], low[node])
+    return components
+
+def kernel(packed, m, components=None):
+    # Kernel ELECTRE I pada graf kondensasi (siklus digabung menjadi satu simpul):
+    # dalam urutan topologis, komponen masuk kernel jika tidak di-outrank oleh
+    # komponen kernel mana pun. Pada DAG kernel ini tunggal.
+    if components is None:
+        components = strongly_connected_components(packed, m)
+    covered = np.zeros((m + 7) // 8, dtype=np.uint8)
+    members = []
+    for component in reversed(components):
+        if (covered[component >> 3] & (0x80 >> (component & 7))).any():
+            continue
+        members.append(component)
+        covered |= np.bitwise_or.reduce(packed[component], axis=0)
+    return np.sort(np.concatenate(members)) if members else np.empty(0, dtype=np.int64)
+
+def outranking_counts(packed, m, block_rows=1024):
+    # Jumlah alternatif yang di-outrank (out-degree) dan yang meng-outrank (in-degree),
+    # per blok baris agar array sementara tetap kecil
+    outgoing = np.empty(m, dtype=np.int64)
+    incoming = np.zeros(m, dtype=np.int64)
+    for start in range(0, m, block_rows):
+        block = packed[start:start + block_rows]
+        outgoing[start:start + len(block)] = POPCOUNT[block].sum(axis=1, dtype=np.int64)
+        incoming += np.unpackbits(block, axis=1, count=m).sum(axis=0, dtype=np.int64)
+    return outgoing, incoming
+
+def electre(matrix, weights, benefit, c_threshold=None, d_threshold=None, **options):
+    # Hasil lengkap: matriks bit outranking, kernel dan jumlah outranking
+    engine = ELECTRE(matrix, weights, benefit, **options)
+    packed = engine.outranking(c_threshold, d_threshold)
+    outgoing, incoming = outranking_counts(packed, engine.m)
+    return {
+        'outranking': packed,
+        'kernel': kernel(packed, engine.m),
+        'outgoing': outgoing,
+        'incoming': incoming,
+        'c_threshold': engine.c_threshold,
+        'd_threshold': engine.d_threshold
+    }
+
+def electre_dense(matrix, weights, benefit, c_threshold, d_threshold):
+    # Versi naif dengan tensor m x m x k (acuan untuk m kecil)
+    weights = np.asarray(weights, dtype=float)
+    weights = weights / weights.sum()
+    values = weighted_normalized(matrix, weights, benefit)
+    diff = values[None, :, :] - values[:, None, :]
+    concordance = np.zeros(diff.shape[:2])
+    for j, weight in enumerate(weights):
+        concordance += weight * (diff[:, :, j] <= 0)
+    numerator = np.maximum(diff.max(axis=2), 0)
+    denominator = np.abs(diff).max(axis=2)
+    discordance = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+    outranks = (concordance >= c_threshold) & (discordance <= d_threshold)
+    np.fill_diagonal(outranks, False)
+    return outranks
+
+if __name__ == "__main__":
+    import sys
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python electre1.py <matriks.csv> <bobot,...> <benefit: 1,0,...>")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    result = electre(data.to_numpy(dtype=float), weights, benefit)
+    print(f"Ambang concordance {result['c_threshold']:.4f}, discordance {result['d_threshold']:.4f}")
+    print(f"Kernel ({len(result['kernel'])} alternatif):")
+    for index in result['kernel']:
+        print(f"  Alternatif {index + 1}: meng-outrank {result['outgoing'][index]}, "
+              f"di-outrank {result['incoming'][index]}")
@@ -0,0 +1,64 @@
+import sys
+import time
+
+import numpy as np
+from scipy.stats import rankdata
+
+from orste import ORESTE, besson_rank
+
+# Benchmark skala ORESTE pada data ordinal (banyak nilai sama): implementasi naif dengan
+# sort Python dan penanganan nilai sama per kolom vs mesin tervektorisasi
+SIZES = [10_000, 100_000, 1_000_000]
+CRITERIA = 6
+LEVELS = 5
+NAIVE_LIMIT = 100_000
+
+def naive_besson(values, descending=False):
+    order = sorted(range(len(values)), key=lambda i: -values[i] if descending else values[i])
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+def naive_oreste(matrix, weights, benefit, alpha=0.5, power=3):
+    m, k = len(matrix), len(weights)
+    criteria = naive_besson(list(weights), descending=True)
+    distance = []
+    for j in range(k):
+        column = naive_besson([row[j] for row in matrix], descending=benefit[j])
+        distance.append([(alpha * r ** power + (1 - alpha) * criteria[j] ** power) ** (1 / power) for r in column])
+    flat = [distance[j][i] for i in range(m) for j in range(k)]
+    global_ranks = naive_besson(flat)
+    return [sum(global_ranks[i * k:(i + 1) * k]) for i in range(m)]
+
+def timed(function, *args):
+    t0 = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - t0
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    rng = np.random.default_rng(0)
+    weights = rng.integers(1, 4, CRITERIA).astype(float)
+    benefit = np.arange(CRITERIA) % 3 != 0
+
+    sample = rng.integers(1, LEVELS + 1, (1000, CRITERIA))
+    assert np.array_equal(besson_rank(sample, axis=0), rankdata(sample, axis=0))
+    assert np.array_equal(besson_rank(sample, axis=1, descending=True), rankdata(-sample, axis=1))
+
+    print(f"ORESTE {CRITERIA} kriteria, skala ordinal 1..{LEVELS}")
+    for m in sizes:
+        matrix = rng.integers(1, LEVELS + 1, (m, CRITERIA)).astype(float)
+        engine, t_engine = timed(ORESTE, matrix, weights, benefit)
+        line = f"  m={m:9,d}  vektor {t_engine:6.2f} s"
+        if m <= NAIVE_LIMIT:
+            expected, t_naive = timed(naive_oreste, matrix.tolist(), weights.tolist(), benefit.tolist())
+            assert np.allclose(engine.scores, expected, rtol=1e-12, atol=0)
+            line += f"   naif {t_naive:6.2f} s   x{t_naive / t_engine:5.1f}"
+        print(line)
@@ -1 +1,70 @@
+import numpy as np
 
+# Parameter proyeksi ORESTE: bobot rangking alternatif (alpha) dan pangkat jarak (R)
+ALPHA = 0.5
+POWER = 3
+
+def besson_rank(values, axis=0, descending=False):
+    # Rangking Besson (rata-rata untuk nilai sama, 1 = urutan pertama) untuk semua
+    # deret di sepanjang axis sekaligus, seperti scipy.stats.rankdata(method='average')
+    values = np.asarray(values, dtype=float)
+    moved = np.moveaxis(values, axis, -1)
+    keys = moved.reshape(-1, moved.shape[-1])
+    if descending:
+        keys = -keys
+    n = keys.shape[1]
+    order = np.argsort(keys, axis=1, kind='stable')
+    ordered = np.take_along_axis(keys, order, axis=1)
+
+    # Awal dan akhir setiap kelompok nilai sama pada deret terurut
+    start = np.ones(keys.shape, dtype=bool)
+    start[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    end = np.ones(keys.shape, dtype=bool)
+    end[:, :-1] = start[:, 1:]
+    positions = np.arange(n)
+    first = np.maximum.accumulate(np.where(start, positions, 0), axis=1)
+    last = np.minimum.accumulate(np.where(end, positions, n - 1)[:, ::-1], axis=1)[:, ::-1]
+
+    ranks = np.empty(keys.shape)
+    np.put_along_axis(ranks, order, (first + last) / 2 + 1, axis=1)
+    return np.moveaxis(ranks.reshape(moved.shape), -1, axis)
+
+class ORESTE:
+    # 1. Rangking Besson alternatif per kriteria (benefit: nilai besar = 1) dan
+    #    rangking Besson kriteria dari bobot (bobot besar = 1)
+    # 2. Jarak proyeksi d_ij = (alpha r_ij^R + (1 - alpha) r_j^R)^(1/R)
+    # 3. Rangking Besson global atas seluruh m x k jarak (jarak kecil = 1)
+    # 4. Skor alternatif = jumlah rangking global; skor kecil = lebih baik
+    def __init__(self, matrix, weights, benefit, alpha=ALPHA, power=POWER):
+        matrix = np.asarray(matrix, dtype=float)
+        if not 0 <= alpha <= 1:
+            raise ValueError("Nilai alpha harus di antara 0 dan 1")
+        signed = np.where(np.asarray(benefit, dtype=bool), matrix, -matrix)
+        self.alternative_ranks = besson_rank(signed, axis=0, descending=True)
+        self.criteria_ranks = besson_rank(weights, descending=True)
+        self.distance = (alpha * self.alternative_ranks ** power
+                         + (1 - alpha) * self.criteria_ranks ** power) ** (1 / power)
+        self.global_ranks = besson_rank(self.distance.ravel()).reshape(self.distance.shape)
+        self.scores = self.global_ranks.sum(axis=1)
+
+    def ranking(self):
+        # Rangking akhir (Besson) dari jumlah rangking global
+        return besson_rank(self.scores)
+
+def oreste(matrix, weights, benefit, alpha=ALPHA, power=POWER):
+    engine = ORESTE(matrix, weights, benefit, alpha, power)
+    return engine.scores, engine.ranking()
+
+if __name__ == "__main__":
+    import sys
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python orste.py <matriks.csv> <bobot,...> <benefit: 1,0,...> [alpha]")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    alpha = float(sys.argv[4]) if len(sys.argv) > 4 else ALPHA
+    scores, ranks = oreste(data.to_numpy(dtype=float), weights, benefit, alpha)
+    for index in np.argsort(ranks, kind='stable'):
+        print(f"{ranks[index]:5.1f}. Alternatif {index + 1}: {scores[index]:.1f}")
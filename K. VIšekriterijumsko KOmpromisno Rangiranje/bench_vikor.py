@@ -0,0 +1,56 @@
+import sys
+import time
+
+import numpy as np
+
+from vikor import VIKOR
+
+# Benchmark sapuan v: cara naif (hitung ulang S, R, Q dan argsort penuh untuk setiap v)
+# vs VIKOR.sweep (S dan R sekali, Q sebagai satu broadcast, argpartition dua teratas)
+SIZES = [100_000, 1_000_000, 4_000_000]
+CRITERIA = 8
+V_VALUES = np.linspace(0, 1, 101)
+
+def naive_sweep(matrix, weights, benefit, v_values):
+    first, second, advantage, stability = [], [], [], []
+    for v in v_values:
+        best = np.where(benefit, matrix.max(axis=0), matrix.min(axis=0))
+        worst = np.where(benefit, matrix.min(axis=0), matrix.max(axis=0))
+        regret = (best - matrix) / (best - worst) * weights
+        S = regret.sum(axis=1)
+        R = regret.max(axis=1)
+        Q = v * (S - S.min()) / (S.max() - S.min()) + (1 - v) * (R - R.min()) / (R.max() - R.min())
+        order = np.argsort(Q, kind='stable')
+        first.append(order[0])
+        second.append(order[1])
+        advantage.append(Q[order[1]] - Q[order[0]] >= 1 / (len(matrix) - 1))
+        stability.append(order[0] in (np.argsort(S, kind='stable')[0], np.argsort(R, kind='stable')[0]))
+    return np.array(first), np.array(second), np.array(advantage), np.array(stability)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 5, CRITERIA)
+    weights /= weights.sum()
+    benefit = np.arange(CRITERIA) % 3 != 0
+
+    print(f"VIKOR {CRITERIA} kriteria, {len(V_VALUES)} nilai v")
+    for m in sizes:
+        matrix = rng.uniform(1, 100, (m, CRITERIA))
+        t0 = time.perf_counter()
+        expected = naive_sweep(matrix, weights, benefit, V_VALUES)
+        t_naive = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        engine = VIKOR(matrix, weights, benefit)
+        t_setup = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        result = engine.sweep(V_VALUES)
+        t_sweep = time.perf_counter() - t0
+
+        assert np.array_equal(result['first'], expected[0])
+        assert np.array_equal(result['second'], expected[1])
+        assert np.array_equal(result['advantage'], expected[2])
+        assert np.array_equal(result['stability'], expected[3])
+        print(f"  m={m:9,d}  naif {t_naive:7.2f} s   S/R {t_setup:5.2f} s + sapuan {t_sweep:5.2f} s   "
+              f"x{t_naive / (t_setup + t_sweep):5.1f}")
@@ -1 +1,137 @@
+import numpy as np
 
+# Batas elemen matriks Q (jumlah v x jumlah alternatif) yang dibentuk sekaligus
+BLOCK_ELEMENTS = 1 << 24
+
+def scaled(values):
+    # (x - min) / (max - min); bila semua nilai sama hasilnya 0
+    low, high = values.min(), values.max()
+    if high == low:
+        return np.zeros_like(values)
+    return (values - low) / (high - low)
+
+class VIKOR:
+    # S (utilitas grup) dan R (penyesalan individu) dihitung sekali di konstruktor;
+    # Q untuk banyak nilai v hanyalah kombinasi linear S dan R yang sudah diskalakan:
+    #   Q(v) = v * (S - S*) / (S- - S*) + (1 - v) * (R - R*) / (R- - R*)
+    def __init__(self, matrix, weights, benefit):
+        matrix = np.asarray(matrix, dtype=float)
+        weights = np.asarray(weights, dtype=float)
+        benefit = np.asarray(benefit, dtype=bool)
+        if len(matrix) == 0:
+            raise ValueError("Matriks keputusan tidak memiliki alternatif")
+        best = np.where(benefit, matrix.max(axis=0), matrix.min(axis=0))
+        worst = np.where(benefit, matrix.min(axis=0), matrix.max(axis=0))
+        spread = best - worst
+        spread[spread == 0] = 1
+        self._set_regret((best - matrix) / spread * weights)
+
+    @classmethod
+    def from_regret(cls, regret):
+        # Dari matriks penyesalan terbobot w_j (f*_j - f_ij) / (f*_j - f-_j) yang sudah ada
+        engine = cls.__new__(cls)
+        engine._set_regret(np.asarray(regret, dtype=float))
+        return engine
+
+    def _set_regret(self, regret):
+        self.m = len(regret)
+        if self.m == 0:
+            raise ValueError("Matriks keputusan tidak memiliki alternatif")
+        self.S = regret.sum(axis=1)
+        self.R = regret.max(axis=1)
+        self.scaled_S = scaled(self.S)
+        self.scaled_R = scaled(self.R)
+        # Syarat 1 (acceptable advantage): Q(a2) - Q(a1) >= DQ; satu alternatif
+        # selalu menjadi satu-satunya solusi kompromi
+        self.DQ = 1 / (self.m - 1) if self.m > 1 else 0.0
+
+    def Q(self, v):
+        # v skalar -> vektor m; v array -> matriks len(v) x m
+        v = np.asarray(v, dtype=float)[..., None]
+        return v * self.scaled_S + (1 - v) * self.scaled_R
+
+    def sweep(self, v_values, block_elements=BLOCK_ELEMENTS):
+        # Evaluasi banyak v sekaligus. Untuk setiap v hanya dua alternatif terbaik
+        # yang dicari (argpartition, O(m)) tanpa mengurutkan seluruh Q.
+        v_values = np.atleast_1d(np.asarray(v_values, dtype=float))
+        count = len(v_values)
+        if self.m == 1:
+            zeros = np.zeros(count, dtype=np.int64)
+            q = self.Q(v_values)[:, 0]
+            return {'v': v_values, 'first': zeros, 'second': zeros, 'q_first': q, 'q_second': q,
+                    'advantage': np.ones(count, dtype=bool), 'stability': np.ones(count, dtype=bool),
+                    'compromise_size': np.ones(count, dtype=np.int64)}
+        first = np.empty(count, dtype=np.int64)
+        second = np.empty(count, dtype=np.int64)
+        q_first = np.empty(count)
+        q_second = np.empty(count)
+        close = np.empty(count, dtype=np.int64)
+        block = max(1, block_elements // self.m)
+        rows = np.arange(min(block, count))[:, None]
+        for start in range(0, count, block):
+            stop = min(start + block, count)
+            q = self.Q(v_values[start:stop])
+            top = np.argpartition(q, 1, axis=1)[:, :2]
+            top_q = q[rows[:stop - start], top]
+            swap = top_q[:, 1] < top_q[:, 0]
+            top[swap] = top[swap, ::-1]
+            top_q[swap] = top_q[swap, ::-1]
+            first[start:stop], second[start:stop] = top[:, 0], top[:, 1]
+            q_first[start:stop], q_second[start:stop] = top_q[:, 0], top_q[:, 1]
+            # Ukuran himpunan kompromi jika syarat 1 gagal: semua Q - Q(a1) < DQ
+            close[start:stop] = (q - top_q[:, :1] < self.DQ).sum(axis=1)
+
+        # Syarat 2 (acceptable stability): a1 juga terbaik menurut S atau R
+        stability = (self.S[first] == self.S.min()) | (self.R[first] == self.R.min())
+        return {
+            'v': v_values,
+            'first': first,
+            'second': second,
+            'q_first': q_first,
+            'q_second': q_second,
+            'advantage': q_second - q_first >= self.DQ,
+            'stability': stability,
+            'compromise_size': np.where(q_second - q_first >= self.DQ,
+                                        np.where(stability, 1, 2), close)
+        }
+
+    def compromise(self, v):
+        # Himpunan solusi kompromi untuk satu v, terurut menurut Q:
+        #   kedua syarat terpenuhi   -> {a1}
+        #   hanya syarat 2 gagal     -> {a1, a2}
+        #   syarat 1 gagal           -> {a1, ..., aM} dengan Q(aM) - Q(a1) < DQ
+        result = self.sweep([v])
+        first, second = result['first'][0], result['second'][0]
+        if result['advantage'][0]:
+            return [int(first)] if result['stability'][0] else [int(first), int(second)]
+        q = self.Q(v)
+        members = np.flatnonzero(q - result['q_first'][0] < self.DQ)
+        return members[np.argsort(q[members], kind='stable')].tolist()
+
+    def ranking(self, v=0.5):
+        # Urutan lengkap menurut Q (hanya bila memang diperlukan, O(m log m))
+        return np.argsort(self.Q(v), kind='stable')
+
+def vikor(matrix, weights, benefit, v=0.5):
+    engine = VIKOR(matrix, weights, benefit)
+    return engine.S, engine.R, engine.Q(v), engine.compromise(v)
+
+if __name__ == "__main__":
+    import sys
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python vikor.py <matriks.csv> <bobot,...> <benefit: 1,0,...> [v]")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    engine = VIKOR(data.to_numpy(dtype=float), weights, benefit)
+    if len(sys.argv) > 4:
+        v_values = [float(sys.argv[4])]
+    else:
+        v_values = np.linspace(0, 1, 11)
+    for v in v_values:
+        members = engine.compromise(v)
+        names = ", ".join(f"A{index + 1}" for index in members[:10])
+        more = f" (+{len(members) - 10} lainnya)" if len(members) > 10 else ""
+        print(f"v={v:.2f}  solusi kompromi: {names}{more}")
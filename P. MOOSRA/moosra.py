@@ -0,0 +1,34 @@
+import os
+import sys
+
+import numpy as np
+
+# Normalisasi vektor dan jumlah benefit/cost dipakai bersama dengan MOORA (folder G)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "G. Multi-Objective Optimization by Ratio Analysis"))
+from moora import RatioSums, rank
+
+def moosra_scores(sums):
+    # v_i = jumlah benefit / jumlah cost
+    cost_sum = sums.cost_sum
+    if (cost_sum <= 0).any():
+        raise ValueError("Metode MOOSRA membutuhkan kriteria cost dengan nilai positif")
+    return sums.benefit_sum / cost_sum
+
+def moosra(matrix, weights, benefit, sums=None):
+    if sums is None:
+        sums = RatioSums(matrix, weights, benefit)
+    scores = moosra_scores(sums)
+    return scores, rank(scores)
+
+if __name__ == "__main__":
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python moosra.py <matriks.csv> <bobot,...> <benefit: 1,0,...>")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    scores, ranks = moosra(data.to_numpy(dtype=float), weights, benefit)
+    for index in np.argsort(ranks, kind='stable'):
+        print(f"{ranks[index]:3d}. Alternatif {index + 1}: {scores[index]:.4f}")
@@ -0,0 +1,65 @@
+import sys
+import time
+
+import numpy as np
+
+from waspas import WASPAS
+
+# Benchmark sapuan lambda: loop per lambda (hitung ulang WSM/WPM) vs blend outer-product
+# dari vektor WSM/WPM yang dihitung sekali vs amplop atas analitik (tanpa matriks m x L)
+SIZES = [100_000, 1_000_000]
+CRITERIA = 8
+NAIVE_LAMBDAS = 101
+WIDE_LAMBDAS = 10_001
+BLEND_ELEMENTS = 1 << 22
+
+def naive_top(matrix, weights, benefit, lambdas):
+    top = []
+    for lam in lambdas:
+        normalized = np.where(benefit, matrix / matrix.max(axis=0), matrix.min(axis=0) / matrix)
+        wsm = (normalized * weights).sum(axis=1)
+        wpm = np.prod(normalized ** weights, axis=1)
+        top.append(np.argmax(lam * wsm + (1 - lam) * wpm))
+    return np.array(top)
+
+def blend_top(engine, lambdas):
+    # Blend dipotong per blok lambda agar matriks m x L tidak pernah utuh di memori
+    chunk = max(1, BLEND_ELEMENTS // len(engine.wsm))
+    return np.concatenate([engine.blend(lambdas[start:start + chunk]).argmax(axis=0)
+                           for start in range(0, len(lambdas), chunk)])
+
+def timed(function, *args):
+    t0 = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - t0
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 5, CRITERIA)
+    weights /= weights.sum()
+    benefit = np.arange(CRITERIA) % 3 != 0
+    coarse = np.linspace(0, 1, NAIVE_LAMBDAS)
+    wide = np.linspace(0, 1, WIDE_LAMBDAS)
+
+    print(f"WASPAS {CRITERIA} kriteria")
+    for m in sizes:
+        # Dua faktor laten yang berlawanan membuat peringkat 1 berganti beberapa kali
+        latent = rng.uniform(0, 1, (m, 1))
+        matrix = rng.uniform(1, 100, (m, CRITERIA)) * np.where(np.arange(CRITERIA) % 2, latent, 1 - latent) + 1
+
+        expected, t_naive = timed(naive_top, matrix, weights, benefit, coarse)
+        engine, t_setup = timed(WASPAS, matrix, weights, benefit)
+        dense, t_blend = timed(blend_top, engine, wide)
+        _, t_envelope = timed(engine.envelope)
+        top, t_top = timed(engine.top, wide)
+
+        assert np.array_equal(engine.top(coarse), expected)
+        assert np.array_equal(top, dense)
+        points, winners = engine.breakpoints()
+        for point, before, after in zip(points, winners[:-1], winners[1:]):
+            scores = engine.blend([point - 1e-9, point + 1e-9])
+            assert scores[:, 0].argmax() == before and scores[:, 1].argmax() == after
+        print(f"  m={m:9,d}  loop {NAIVE_LAMBDAS} lambda {t_naive:6.2f} s   WSM/WPM {t_setup:5.2f} s"
+              f"   blend {WIDE_LAMBDAS} lambda {t_blend:6.2f} s   amplop {t_envelope * 1e3:6.1f} ms"
+              f" + {WIDE_LAMBDAS} lambda {t_top * 1e3:5.2f} ms   {len(points)} titik perubahan")
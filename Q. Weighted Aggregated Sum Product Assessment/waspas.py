@@ -0,0 +1,110 @@
+import os
+import sys
+
+import numpy as np
+
+# WSM memakai SAW (folder B) dan WPM memakai WP (folder E) atas matriks ternormalisasi yang sama
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "B. Simple Additive Weighting"))
+sys.path.insert(0, os.path.join(ROOT, "E. Weighted Product"))
+from saw1 import SAW, rank
+from wp1 import WP
+
+def pareto_front(at_zero, at_one):
+    # Alternatif yang tidak didominasi di kedua ujung (lambda = 0 dan 1). Alternatif
+    # yang kalah dari satu alternatif lain di kedua ujung kalah di seluruh [0, 1],
+    # jadi hanya front ini yang bisa menjadi peringkat 1. Hasil terurut Q(0) menurun
+    # dan Q(1) menaik (kemiringan naik tegas).
+    order = np.lexsort((np.arange(len(at_zero)), -at_one, -at_zero))
+    running = np.maximum.accumulate(at_one[order])
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = at_one[order[1:]] > running[:-1]
+    return order[keep]
+
+def upper_envelope(intercept, slope, candidates):
+    # Amplop atas garis Q_i(lambda) = intercept_i + slope_i * lambda pada [0, 1].
+    # candidates terurut kemiringan naik; hasil: pemenang dan lambda awal segmennya.
+    hull, starts = [], []
+    for i in candidates:
+        start = 0.0
+        while hull:
+            j = hull[-1]
+            start = (intercept[j] - intercept[i]) / (slope[i] - slope[j])
+            if start > starts[-1]:
+                break
+            hull.pop()
+            starts.pop()
+            start = 0.0
+        if start < 1:
+            hull.append(i)
+            starts.append(start)
+    return np.array(hull, dtype=np.int64), np.array(starts)
+
+class WASPAS:
+    # Q(lambda) = lambda * WSM + (1 - lambda) * WPM. Vektor WSM dan WPM dihitung sekali,
+    # grid lambda menjadi satu blend outer-product, dan titik perubahan peringkat 1
+    # dihitung analitik dari amplop atas garis-garis Q_i(lambda).
+    def __init__(self, matrix, weights, benefit, dtype=np.float64):
+        saw = SAW(matrix, benefit, dtype)
+        self.wsm = saw.score(weights)
+        # WPM = prod r_ij ^ w_j atas matriks yang sudah ternormalisasi (semua sudah benefit)
+        benefit_all = np.ones(saw.normalized.shape[1], dtype=bool)
+        self.wpm = WP(saw.normalized, benefit_all, dtype).score(weights)
+        self._envelope = None
+
+    @classmethod
+    def from_scores(cls, wsm, wpm):
+        # Dari vektor WSM dan WPM yang sudah dihitung di tempat lain
+        engine = cls.__new__(cls)
+        engine.wsm = np.asarray(wsm)
+        engine.wpm = np.asarray(wpm)
+        engine._envelope = None
+        return engine
+
+    def score(self, lam=0.5):
+        return lam * self.wsm + (1 - lam) * self.wpm
+
+    def blend(self, lambdas):
+        # Skor m x L untuk seluruh grid lambda: WPM + (WSM - WPM) (x) lambda
+        lambdas = np.asarray(lambdas, dtype=self.wsm.dtype)
+        return self.wpm[:, None] + np.multiply.outer(self.wsm - self.wpm, lambdas)
+
+    def envelope(self):
+        if self._envelope is None:
+            slope = self.wsm - self.wpm
+            candidates = pareto_front(self.wpm, self.wsm)
+            self._envelope = upper_envelope(self.wpm, slope, candidates)
+        return self._envelope
+
+    def breakpoints(self):
+        # Nilai lambda tempat peringkat 1 berganti, beserta pemenang tiap segmen
+        winners, starts = self.envelope()
+        return starts[1:], winners
+
+    def top(self, lambdas):
+        # Alternatif peringkat 1 untuk setiap lambda tanpa membentuk matriks m x L
+        winners, starts = self.envelope()
+        return winners[np.searchsorted(starts, lambdas, side='right') - 1]
+
+def waspas(matrix, weights, benefit, lam=0.5):
+    scores = WASPAS(matrix, weights, benefit).score(lam)
+    return scores, rank(scores)
+
+if __name__ == "__main__":
+    import pandas as pd
+    if len(sys.argv) < 4:
+        print("Penggunaan: python waspas.py <matriks.csv> <bobot,...> <benefit: 1,0,...> [lambda]")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    weights = [float(w) for w in sys.argv[2].split(',')]
+    benefit = [flag.strip() == '1' for flag in sys.argv[3].split(',')]
+    lam = float(sys.argv[4]) if len(sys.argv) > 4 else 0.5
+    engine = WASPAS(data.to_numpy(dtype=float), weights, benefit)
+    scores = engine.score(lam)
+    ranks = rank(scores)
+    for index in np.argsort(ranks, kind='stable'):
+        print(f"{ranks[index]:3d}. Alternatif {index + 1}: {scores[index]:.4f}")
+    points, winners = engine.breakpoints()
+    print("Peringkat 1 per rentang lambda:")
+    for start, end, winner in zip(np.r_[0, points], np.r_[points, 1], winners):
+        print(f"  [{start:.4f}, {end:.4f}]: Alternatif {winner + 1}")
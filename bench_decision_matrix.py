@@ -0,0 +1,76 @@
+import sys
+import time
+
+import numpy as np
+
+from decision_matrix import METHODS, DecisionMatrix, compare
+from moora import moora
+from moosra import moosra
+from orste import ORESTE
+from saw1 import rank, saw
+from topsis1 import topsis
+from vikor import VIKOR
+from waspas import waspas
+from wp1 import wp
+
+# Benchmark perbandingan banyak metode pada satu matriks: setiap metode menghitung
+# statistik/normalisasinya sendiri vs satu DecisionMatrix bersama. counts membuktikan
+# setiap statistik hanya dihitung sekali per perbandingan. ORESTE hanya memakai
+# rangking (tidak berbagi statistik) dan mendominasi waktu, jadi juga dicatat tanpa ORESTE.
+SIZES = [100_000, 1_000_000]
+CRITERIA = 8
+REPEATS = 3
+
+def independent(matrix, weights, benefit, skip=()):
+    methods = {
+        'SAW (B)': lambda: saw(matrix, weights, benefit)[1],
+        'WP (E)': lambda: wp(matrix, weights, benefit)[2],
+        'TOPSIS (F)': lambda: rank(topsis(matrix, weights, benefit)),
+        'MOORA (G)': lambda: moora(matrix, weights, benefit)[1],
+        'ORESTE (I)': lambda: rank(-ORESTE(matrix, weights, benefit).scores),
+        'VIKOR (K)': lambda: rank(-VIKOR(matrix, weights, benefit).Q(0.5)),
+        'MOOSRA (P)': lambda: moosra(matrix, weights, benefit)[1],
+        'WASPAS (Q)': lambda: waspas(matrix, weights, benefit)[1],
+    }
+    return {name: method() for name, method in methods.items() if name not in skip}
+
+def best_time(function):
+    times = []
+    for _ in range(REPEATS):
+        t0 = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - t0)
+    return result, min(times)
+
+def shared(matrix, weights, benefit, skip=()):
+    context = DecisionMatrix(matrix, benefit)
+    methods = [name for name in METHODS if name not in skip]
+    return context, compare(context, weights, methods)
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 5, CRITERIA)
+    weights /= weights.sum()
+    benefit = np.arange(CRITERIA) % 3 != 0
+
+    print(f"Perbandingan {CRITERIA} kriteria, 8 metode")
+    for m in sizes:
+        matrix = rng.uniform(1, 100, (m, CRITERIA))
+        expected, t_independent = best_time(lambda: independent(matrix, weights, benefit))
+        (context, table), t_shared = best_time(lambda: shared(matrix, weights, benefit))
+        _, t_independent_fast = best_time(lambda: independent(matrix, weights, benefit, ['ORESTE (I)']))
+        _, t_shared_fast = best_time(lambda: shared(matrix, weights, benefit, ['ORESTE (I)']))
+
+        for name, ranks in expected.items():
+            assert np.array_equal(table[name].to_numpy(), ranks), name
+        assert set(context.counts.values()) == {1}, context.counts
+        print(f"  m={m:9,d}  masing-masing {t_independent:6.2f} s   konteks bersama {t_shared:6.2f} s"
+              f"   x{t_independent / t_shared:4.2f}   tanpa ORESTE {t_independent_fast:5.2f} s vs"
+              f" {t_shared_fast:5.2f} s   x{t_independent_fast / t_shared_fast:4.2f}")
+    print("  Perhitungan per perbandingan:", dict(context.counts))
+
+    # Tanpa bobot: bobot entropy dari statistik yang sama
+    context = DecisionMatrix(matrix[:1000], benefit)
+    compare(context)
+    assert set(context.counts.values()) == {1}, context.counts
@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from decision_matrix import METHODS
+from parallel_runner import SharedArray, _attach, run_parallel, run_pickled, run_sequential
+
+# Benchmark pengiriman matriks ke worker: pickle per metode vs shared memory sekali.
+# Bagian pertama hanya mengukur biaya kirim (tugas kosong), bagian kedua semua metode.
+# Di mesin dengan satu CPU, worker > 1 tidak dapat lebih cepat dari sekuensial. Setiap
+# worker menyimpan konteks sendiri (beberapa salinan m x k), jadi m dibatasi oleh RAM.
+SIZES = [500_000, 2_000_000]
+CRITERIA = 8
+
+def touch_pickled(matrix):
+    return float(matrix[-1, -1])
+
+def touch_shared(descriptor):
+    return float(_attach(descriptor)[-1, -1])
+
+def dispatch_only(matrix, workers):
+    tasks = len(METHODS)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        executor.submit(int).result()
+        t0 = time.perf_counter()
+        list(executor.map(touch_pickled, [matrix] * tasks))
+        t_pickled = time.perf_counter() - t0
+    # Blok dibuat sebelum pool agar worker memakai resource tracker yang sama
+    t0 = time.perf_counter()
+    shared = SharedArray(matrix.shape, matrix.dtype, matrix)
+    t_copy = time.perf_counter() - t0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        executor.submit(int).result()
+        t0 = time.perf_counter()
+        list(executor.map(touch_shared, [shared.descriptor] * tasks))
+        t_shared = t_copy + time.perf_counter() - t0
+    shared.close()
+    return t_pickled, t_shared
+
+def timed(function, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, cpus})
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(1, 5, CRITERIA)
+    weights /= weights.sum()
+    benefit = np.arange(CRITERIA) % 3 != 0
+
+    print(f"{len(METHODS)} metode, {CRITERIA} kriteria, {cpus} CPU")
+    for m in sizes:
+        matrix = rng.uniform(1, 100, (m, CRITERIA))
+        print(f"  m={m:9,d} ({matrix.nbytes / 2**20:.0f} MB)")
+        for workers in worker_counts:
+            t_pickled, t_shared = dispatch_only(matrix, workers)
+            print(f"    kirim saja, {workers} worker: pickle {t_pickled:6.3f} s   shared memory {t_shared:6.3f} s")
+
+        expected, t_sequential = timed(run_sequential, matrix, weights, benefit)
+        print(f"    sekuensial           {t_sequential:6.2f} s")
+        for workers in worker_counts:
+            pickled, t_pickled = timed(run_pickled, matrix, weights, benefit, workers=workers)
+            shared, t_shared = timed(run_parallel, matrix, weights, benefit, workers=workers)
+            assert pickled.equals(expected) and shared.equals(expected)
+            print(f"    {workers} worker: pickle {t_pickled:6.2f} s   shared memory {t_shared:6.2f} s"
+                  f"   x{t_sequential / t_shared:4.2f} terhadap sekuensial")
@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from result_export import export_columns
+from result_view import column_values
+
+# Benchmark ekspor hasil seleksi: jalur sebelumnya (DataFrame hasil -> to_excel/to_csv)
+# vs export_columns (potongan baris langsung dari array kolom, xlsxwriter constant_memory).
+# Setiap kasus dijalankan di proses baru; puncak RSS diukur dari VmHWM setelah penanda
+# puncak direset (/proc/self/clear_refs), jadi angkanya hanya memori tambahan ekspor.
+SIZES = [100_000, 500_000]
+KRITERIA = ["Akademik", "Ekonomi", "Kepribadian"]
+CASES = ["to_excel", "stream_excel", "to_csv", "stream_csv"]
+
+def result_frame(m):
+    rng = np.random.default_rng(0)
+    scores = rng.integers(1, 6, (m, len(KRITERIA))).astype(np.int16)
+    names = pd.Categorical.from_codes(np.arange(m), categories=[f"Kandidat {i}" for i in range(m)])
+    total = rng.random(m) * 5
+    order = np.argsort(-total, kind='stable')
+    ranks = np.empty(m, dtype=np.int64)
+    ranks[order] = np.arange(1, m + 1)
+    frame = pd.DataFrame({"Nama": names, **dict(zip(KRITERIA, scores.T)),
+                          "Total Skor": total, "Ranking": ranks})
+    return frame.iloc[order]
+
+def memory_kb(field):
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith(field):
+                return int(line.split()[1])
+
+def run_case(case, m, path):
+    df = result_frame(m)
+    headers = list(df.columns)
+    arrays = [column_values(df[column]) for column in df.columns]
+    baseline = memory_kb('VmRSS')
+    with open('/proc/self/clear_refs', 'w') as refs:
+        refs.write('5')
+    t0 = time.perf_counter()
+    if case == "to_excel":
+        df.to_excel(path, index=False)
+    elif case == "to_csv":
+        df.to_csv(path, index=False)
+    else:
+        export_columns(path, headers, arrays)
+    elapsed = time.perf_counter() - t0
+    print(elapsed, (memory_kb('VmHWM') - baseline) / 1024)
+
+def check(m, folder):
+    # Isi file hasil streaming harus sama dengan DataFrame hasil
+    df = result_frame(m).reset_index(drop=True)
+    df["Nama"] = df["Nama"].astype(str)
+    for extension, reader in (('.csv', lambda path: pd.read_csv(path, float_precision='round_trip')),
+                              ('.xlsx', pd.read_excel)):
+        path = os.path.join(folder, "cek" + extension)
+        export_columns(path, list(df.columns), [column_values(df[column]) for column in df.columns])
+        loaded = reader(path)
+        assert list(loaded.columns) == list(df.columns)
+        assert (loaded["Nama"].to_numpy() == df["Nama"].to_numpy()).all()
+        for column in df.columns[1:]:
+            assert np.allclose(loaded[column].to_numpy(), df[column].to_numpy(), rtol=1e-14, atol=0)
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--case"]:
+        run_case(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+        sys.exit()
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    with tempfile.TemporaryDirectory() as folder:
+        check(2_000, folder)
+        print("Ekspor hasil: waktu dan puncak memori tambahan")
+        for m in sizes:
+            print(f"  m={m:9,d}")
+            for case in CASES:
+                path = os.path.join(folder, case + ('.xlsx' if case.endswith('excel') else '.csv'))
+                output = subprocess.run([sys.executable, __file__, "--case", case, str(m), path],
+                                        capture_output=True, text=True, check=True).stdout.split()
+                elapsed, peak = map(float, output)
+                size = os.path.getsize(path) / 2**20
+                print(f"    {case:13s} {elapsed:7.2f} s   puncak RSS +{peak:7.1f} MB   file {size:6.1f} MB")
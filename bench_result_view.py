@@ -0,0 +1,81 @@
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+from PyQt5.QtCore import Qt
+
+from result_view import ResultView
+
+# Benchmark tabel hasil: QTableWidget lama (satu QTableWidgetItem per sel lewat iterrows)
+# vs ResultView (model virtual di atas array kolom). Diukur waktu tampil, urut ulang dan
+# filter. QTableWidget hanya diukur sampai LEGACY_LIMIT baris karena waktunya linear
+# dan memakan banyak memori per sel.
+SIZES = [20_000, 100_000, 1_000_000]
+LEGACY_LIMIT = 100_000
+KRITERIA = ["Akademik", "Ekonomi", "Kepribadian"]
+
+def result_frame(m, rng):
+    scores = rng.integers(1, 6, (m, len(KRITERIA)))
+    names = pd.Categorical.from_codes(np.arange(m), categories=[f"Kandidat {i}" for i in range(m)])
+    total = rng.random(m) * 5
+    order = np.argsort(-total, kind='stable')
+    ranks = np.empty(m, dtype=np.int64)
+    ranks[order] = np.arange(1, m + 1)
+    frame = pd.DataFrame({"Nama": names, **dict(zip(KRITERIA, scores.T)),
+                          "Total Skor": total, "Ranking": ranks})
+    return frame.iloc[order]
+
+def legacy_fill(table, df):
+    # Sama dengan tampilkan_hasil lama
+    df = df.reset_index(drop=True)
+    table.setRowCount(len(df))
+    table.setColumnCount(len(df.columns))
+    table.setHorizontalHeaderLabels(df.columns)
+    for row_idx, row_data in df.iterrows():
+        for col_idx, value in enumerate(row_data):
+            table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
+
+def timed(app, function, *args):
+    t0 = time.perf_counter()
+    function(*args)
+    app.processEvents()
+    return time.perf_counter() - t0
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    app = QApplication(sys.argv[:1])
+    rng = np.random.default_rng(0)
+    view = ResultView()
+    view.resize(800, 600)
+    view.show()
+    model = view.model
+    total_column = len(KRITERIA) + 1
+
+    print("Tabel hasil: QTableWidget lama vs ResultView")
+    for m in sizes:
+        df = result_frame(m, rng)
+        t_show = timed(app, view.set_frame, df)
+        t_sort = timed(app, model.sort, total_column, Qt.AscendingOrder)
+        shown = model.visible_frame()["Total Skor"].to_numpy()
+        assert np.all(shown[:-1] <= shown[1:])
+        t_resort = timed(app, model.sort, 0, Qt.DescendingOrder)
+        t_filter_number = timed(app, model.set_filter, 1, ">= 4")
+        assert (model.visible_frame()["Akademik"] >= 4).all()
+        t_filter_text = timed(app, model.set_filter, 0, "kandidat 12")
+        assert model.visible_frame()["Nama"].astype(str).str.contains("Kandidat 12").all()
+        line = (f"  m={m:9,d}  ResultView tampil {t_show * 1e3:7.1f} ms  urut {t_sort * 1e3:7.1f} ms"
+                f"  urut nama {t_resort * 1e3:7.1f} ms  filter angka {t_filter_number * 1e3:6.1f} ms"
+                f"  filter teks {t_filter_text * 1e3:6.1f} ms")
+        if m <= LEGACY_LIMIT:
+            table = QTableWidget()
+            t_legacy = timed(app, legacy_fill, table, df)
+            t_legacy_sort = timed(app, table.sortItems, total_column, Qt.AscendingOrder)
+            table.deleteLater()
+            line += f"\n{'':14}QTableWidget tampil {t_legacy:7.2f} s  urut {t_legacy_sort:6.2f} s   x{t_legacy / t_show:6.0f}"
+        print(line)
+        view.clear()
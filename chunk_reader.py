@@ -0,0 +1,18 @@
+import numpy as np
+
+# Pembaca potongan baris bersama untuk metode yang memproses matriks besar secara
+# bertahap (TOPSIS, Entropy); memori per potongan ~ CHUNK_ROWS x kolom x 8 byte
+CHUNK_ROWS = 262144
+
+def read_chunks(source, chunk_rows=CHUNK_ROWS):
+    # Potongan baris dari array, file .npy (mmap) atau CSV numerik dengan header
+    if isinstance(source, str):
+        if source.endswith('.npy'):
+            source = np.load(source, mmap_mode='r')
+        else:
+            import pandas as pd
+            for frame in pd.read_csv(source, chunksize=chunk_rows):
+                yield frame.to_numpy(dtype=float)
+            return
+    for start in range(0, len(source), chunk_rows):
+        yield np.asarray(source[start:start + chunk_rows], dtype=float)
@@ -0,0 +1,200 @@
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+
+# Konteks matriks keputusan bersama untuk membandingkan banyak metode (B-S) pada data
+# yang sama. Statistik kolom dan matriks ternormalisasi dihitung malas (saat pertama
+# diminta) lalu disimpan, dan setiap perhitungan dicatat di counts sehingga dapat
+# dibuktikan bahwa tidak ada yang dihitung dua kali dalam satu perbandingan.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for folder in ("B. Simple Additive Weighting",
+               "D. Entropy",
+               "E. Weighted Product",
+               "F. Technique for Others Preference by Similarity to Ideal Solution",
+               "G. Multi-Objective Optimization by Ratio Analysis",
+               "I. Organization, Rangement Et Synthese De Donnes Relationnelles",
+               "K. VIšekriterijumsko KOmpromisno Rangiranje",
+               "P. MOOSRA",
+               "Q. Weighted Aggregated Sum Product Assessment"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
+
+from entropy1 import EntropyAggregate, xlogx
+from moora import RatioSums, moora_scores
+from moosra import moosra_scores
+from orste import ORESTE
+from saw1 import aggregate, normalize_weights, rank
+from topsis1 import ChunkedTOPSIS
+from vikor import VIKOR
+from waspas import WASPAS
+
+class DecisionMatrix:
+    def __init__(self, matrix, benefit, dtype=np.float64):
+        self.matrix = np.asarray(matrix, dtype=dtype)
+        self.benefit = np.asarray(benefit, dtype=bool)
+        if self.matrix.ndim != 2 or self.matrix.shape[1] != len(self.benefit):
+            raise ValueError("Jumlah kolom matriks harus sama dengan jumlah kriteria")
+        self.counts = Counter()
+        self._cache = {}
+
+    @property
+    def m(self):
+        return len(self.matrix)
+
+    def memo(self, name, compute, key=None):
+        # Hitung sekali per (name, key); key membedakan hasil yang bergantung pada bobot
+        cache_key = (name, key)
+        if cache_key not in self._cache:
+            self.counts[name] += 1
+            self._cache[cache_key] = compute()
+        return self._cache[cache_key]
+
+    # Statistik kolom
+    @property
+    def column_max(self):
+        return self.memo('column_max', lambda: self.matrix.max(axis=0))
+
+    @property
+    def column_min(self):
+        return self.memo('column_min', lambda: self.matrix.min(axis=0))
+
+    @property
+    def column_sum(self):
+        return self.memo('column_sum', lambda: self.matrix.sum(axis=0))
+
+    @property
+    def column_mean(self):
+        return self.memo('column_mean', lambda: self.column_sum / self.m)
+
+    @property
+    def column_sum_squares(self):
+        return self.memo('column_sum_squares', lambda: np.einsum('ij,ij->j', self.matrix, self.matrix))
+
+    @property
+    def column_norm(self):
+        return self.memo('column_norm', lambda: np.sqrt(self.column_sum_squares))
+
+    @property
+    def best(self):
+        return self.memo('best', lambda: np.where(self.benefit, self.column_max, self.column_min))
+
+    @property
+    def worst(self):
+        return self.memo('worst', lambda: np.where(self.benefit, self.column_min, self.column_max))
+
+    # Matriks ternormalisasi
+    @property
+    def linear(self):
+        # SAW/WASPAS: benefit x / maks, cost min / x
+        return self.memo('linear', lambda: np.where(self.benefit, self.matrix / self.column_max,
+                                                    self.column_min / self.matrix))
+
+    @property
+    def log_linear(self):
+        # WP/WASPAS: ln dari normalisasi linear; preferensi WP sama dengan WP atas x mentah
+        return self.memo('log_linear', lambda: np.log(self.linear))
+
+    @property
+    def vector(self):
+        # TOPSIS/MOORA: x / norma kolom
+        return self.memo('vector', lambda: self.matrix / self.column_norm)
+
+    @property
+    def min_max(self):
+        # VIKOR/MABAC: (x - terburuk) / (terbaik - terburuk), 1 = terbaik
+        def compute():
+            spread = self.best - self.worst
+            spread[spread == 0] = 1
+            return (self.matrix - self.worst) / spread
+        return self.memo('min_max', compute)
+
+    @property
+    def proportion(self):
+        # Entropy/PSI: x / jumlah kolom
+        return self.memo('proportion', lambda: self.matrix / self.column_sum)
+
+    # Hasil yang bergantung pada bobot
+    def weighted_sum(self, view, weights):
+        # Jumlah terbobot satu matriks ternormalisasi; dipakai bersama oleh SAW/WASPAS
+        # (linear) dan WP/WASPAS (log_linear)
+        weights = normalize_weights(weights)
+        return self.memo(f'{view} @ bobot', lambda: aggregate(getattr(self, view), weights),
+                         weights.tobytes())
+
+    def ratio_sums(self, weights):
+        # Jumlah benefit/cost MOORA dan MOOSRA dengan norma kolom dari konteks
+        weights = np.asarray(weights, dtype=float)
+        return self.memo('ratio_sums', lambda: RatioSums(self.matrix, weights, self.benefit,
+                                                         norms=self.column_norm),
+                         weights.tobytes())
+
+    def entropy_weights(self):
+        # Bobot objektif metode entropy dari jumlah kolom dan jumlah x ln x
+        def compute():
+            x_log_x = xlogx(self.matrix).sum(axis=0)
+            return EntropyAggregate(len(self.benefit), self.column_sum, x_log_x, self.m).weights()
+        return self.memo('entropy_weights', compute)
+
+# Setiap metode: (konteks, bobot) -> peringkat (1 = terbaik)
+def saw_rank(context, weights):
+    return rank(context.weighted_sum('linear', weights))
+
+def wp_rank(context, weights):
+    return rank(context.weighted_sum('log_linear', weights))
+
+def topsis_rank(context, weights):
+    engine = ChunkedTOPSIS.from_statistics(weights, context.benefit, context.m, context.column_sum_squares,
+                                           context.column_max, context.column_min)
+    return rank(engine.closeness(context.matrix))
+
+def moora_rank(context, weights):
+    return rank(moora_scores(context.ratio_sums(weights)))
+
+def moosra_rank(context, weights):
+    return rank(moosra_scores(context.ratio_sums(weights)))
+
+def oreste_rank(context, weights):
+    return rank(-ORESTE(context.matrix, weights, context.benefit).scores)
+
+def vikor_rank(context, weights, v=0.5):
+    regret = (1 - context.min_max) * normalize_weights(weights)
+    return rank(-VIKOR.from_regret(regret).Q(v))
+
+def waspas_rank(context, weights, lam=0.5):
+    wsm = context.weighted_sum('linear', weights)
+    wpm = np.exp(context.weighted_sum('log_linear', weights))
+    return rank(WASPAS.from_scores(wsm, wpm).score(lam))
+
+METHODS = {
+    'SAW (B)': saw_rank,
+    'WP (E)': wp_rank,
+    'TOPSIS (F)': topsis_rank,
+    'MOORA (G)': moora_rank,
+    'ORESTE (I)': oreste_rank,
+    'VIKOR (K)': vikor_rank,
+    'MOOSRA (P)': moosra_rank,
+    'WASPAS (Q)': waspas_rank,
+}
+
+def compare(context, weights=None, methods=None):
+    # Tabel peringkat semua metode pada satu konteks; tanpa bobot dipakai bobot entropy
+    import pandas as pd
+    if weights is None:
+        weights = context.entropy_weights()
+    methods = METHODS if methods is None else {name: METHODS[name] for name in methods}
+    return pd.DataFrame({name: method(context, weights) for name, method in methods.items()})
+
+if __name__ == "__main__":
+    import pandas as pd
+    if len(sys.argv) < 3:
+        print("Penggunaan: python decision_matrix.py <matriks.csv> <benefit: 1,0,...> [bobot,...]")
+        sys.exit(1)
+    data = pd.read_csv(sys.argv[1])
+    benefit = [flag.strip() == '1' for flag in sys.argv[2].split(',')]
+    weights = [float(w) for w in sys.argv[3].split(',')] if len(sys.argv) > 3 else None
+    context = DecisionMatrix(data.to_numpy(dtype=float), benefit)
+    table = compare(context, weights)
+    table.index = [f"Alternatif {i + 1}" for i in range(len(table))]
+    print(table.to_string())
+    print("Perhitungan:", dict(context.counts))
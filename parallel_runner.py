@@ -0,0 +1,114 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from decision_matrix import METHODS, DecisionMatrix, compare
+
+# Menjalankan banyak metode paralel atas satu matriks keputusan besar. Matriks disalin
+# sekali ke shared memory; worker hanya menerima nama blok, bentuk dan dtype, lalu
+# membuat array di atas buffer yang sama (tanpa salinan, tanpa pickle matriks).
+# Peringkat ditulis langsung ke blok shared memory hasil (metode x m).
+
+# Blok yang sudah ditempel dan konteks per proses worker; metode yang jatuh ke worker
+# yang sama berbagi statistik. Semuanya hilang saat pool ditutup.
+_attached = {}
+_contexts = {}
+
+def _attach(descriptor):
+    name, shape, dtype = descriptor
+    if name not in _attached:
+        block = shared_memory.SharedMemory(name=name)
+        _attached[name] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+    return _attached[name][1]
+
+def _context(matrix_descriptor, benefit):
+    name = matrix_descriptor[0]
+    if name not in _contexts:
+        _contexts[name] = DecisionMatrix(_attach(matrix_descriptor), benefit)
+    return _contexts[name]
+
+def _run_shared(matrix_descriptor, ranks_descriptor, row, benefit, weights, name):
+    context = _context(matrix_descriptor, benefit)
+    _attach(ranks_descriptor)[row] = METHODS[name](context, weights)
+    return name
+
+def _run_pickled(matrix, benefit, weights, name):
+    # Pembanding: matriks dikirim (pickle) ke worker untuk setiap metode
+    return METHODS[name](DecisionMatrix(matrix, benefit), weights)
+
+class SharedArray:
+    # Salinan array di shared memory; descriptor cukup untuk menempel dari proses lain
+    def __init__(self, shape, dtype, source=None):
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        self.block = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.block.buf)
+        if source is not None:
+            self.array[...] = source
+        self.descriptor = (self.block.name, tuple(shape), dtype.str)
+
+    def close(self):
+        del self.array
+        self.block.close()
+        self.block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def run_parallel(matrix, weights, benefit, methods=None, workers=None):
+    # Tabel peringkat (kolom = metode) dari semua metode yang dijalankan paralel
+    import pandas as pd
+    matrix = np.asarray(matrix, dtype=float)
+    benefit = np.asarray(benefit, dtype=bool)
+    weights = np.asarray(weights, dtype=float)
+    names = list(METHODS if methods is None else methods)
+    for name in names:
+        if name not in METHODS:
+            raise ValueError(f"Metode tidak dikenal: {name}")
+
+    with SharedArray(matrix.shape, matrix.dtype, matrix) as shared_matrix, \
+            SharedArray((len(names), len(matrix)), np.int64) as shared_ranks:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_shared, shared_matrix.descriptor, shared_ranks.descriptor,
+                                       row, benefit, weights, name)
+                       for row, name in enumerate(names)]
+            for future in futures:
+                future.result()
+        return pd.DataFrame(shared_ranks.array.T.copy(), columns=names)
+
+def run_pickled(matrix, weights, benefit, methods=None, workers=None):
+    import pandas as pd
+    matrix = np.asarray(matrix, dtype=float)
+    names = list(METHODS if methods is None else methods)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_run_pickled, [matrix] * len(names), [benefit] * len(names),
+                               [weights] * len(names), names)
+        return pd.DataFrame(dict(zip(names, results)))
+
+def run_sequential(matrix, weights, benefit, methods=None):
+    return compare(DecisionMatrix(matrix, benefit), weights, methods)
+
+if __name__ == "__main__":
+    import sys
+    import pandas as pd
+    if len(sys.argv) < 3:
+        print("Penggunaan: python parallel_runner.py <matriks.csv|.npy> <benefit: 1,0,...> [bobot,...] [worker]")
+        sys.exit(1)
+    if sys.argv[1].endswith('.npy'):
+        matrix = np.load(sys.argv[1])
+    else:
+        matrix = pd.read_csv(sys.argv[1]).to_numpy(dtype=float)
+    benefit = [flag.strip() == '1' for flag in sys.argv[2].split(',')]
+    if len(sys.argv) > 3:
+        weights = [float(w) for w in sys.argv[3].split(',')]
+    else:
+        weights = DecisionMatrix(matrix, benefit).entropy_weights()
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else os.cpu_count()
+    table = run_parallel(matrix, weights, benefit, workers=workers)
+    table.index = [f"Alternatif {i + 1}" for i in range(len(table))]
+    print(table.head(50).to_string())
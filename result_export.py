@@ -0,0 +1,134 @@
+import os
+
+import numpy as np
+import pandas as pd
+import xlsxwriter
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# Baris per potongan tulis: memori ekspor sebanding dengan CHUNK_ROWS x kolom, bukan seluruh hasil
+CHUNK_ROWS = 50_000
+# Batas baris satu lembar Excel (termasuk header); sisa baris berlanjut ke lembar berikutnya
+EXCEL_MAX_ROWS = 1_048_576
+FORMATS = {'.xlsx': 'excel', '.csv': 'csv', '.parquet': 'parquet'}
+
+def export_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMATS:
+        raise ValueError(f"Format file tidak didukung: {extension or path} (gunakan {', '.join(FORMATS)})")
+    return FORMATS[extension]
+
+def prepare(arrays):
+    # Kolom kategorikal disimpan sebagai (kategori objek, kode) agar potongan cukup
+    # mengambil kategori lewat kode; kategori dikonversi sekali per ekspor
+    prepared = []
+    for values in arrays:
+        if isinstance(values, pd.Categorical):
+            categories = np.append(np.asarray(values.categories, dtype=object), None)
+            prepared.append((categories, values.codes))
+        else:
+            prepared.append((None, np.asarray(values)))
+    return prepared
+
+def chunks(prepared, rows, chunk_rows=CHUNK_ROWS):
+    # Potongan baris rows[start:start + chunk_rows] per kolom; minimal satu potongan
+    # (mungkin kosong) agar header tetap ditulis
+    for start in range(0, max(len(rows), 1), chunk_rows):
+        index = rows[start:start + chunk_rows]
+        # Kode -1 (nilai kosong) menunjuk ke None di ujung kategori
+        yield start + len(index), [values[index] if categories is None else categories[values[index]]
+                                   for categories, values in prepared]
+
+def blank_missing(values):
+    # NaN ditulis sebagai sel kosong (seperti to_excel), bukan sel galat #NUM!
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        if missing.any():
+            values = values.astype(object)
+            values[missing] = None
+    return values
+
+def write_csv(path, headers, prepared, rows, progress, chunk_rows=CHUNK_ROWS):
+    with open(path, 'w', newline='', encoding='utf-8') as handle:
+        for done, chunk in chunks(prepared, rows, chunk_rows):
+            pd.DataFrame(dict(zip(headers, chunk))).to_csv(handle, header=handle.tell() == 0, index=False)
+            progress(done, len(rows))
+
+def write_excel(path, headers, prepared, rows, progress, chunk_rows=CHUNK_ROWS):
+    # constant_memory: setiap baris langsung ditulis ke file sementara, bukan disimpan
+    # di memori sampai workbook ditutup (baris harus ditulis berurutan)
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True, 'nan_inf_to_errors': True})
+    try:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, headers)
+        line = 1
+        for done, chunk in chunks(prepared, rows, chunk_rows):
+            for row in zip(*[blank_missing(values).tolist() for values in chunk]):
+                if line == EXCEL_MAX_ROWS:
+                    sheet = workbook.add_worksheet()
+                    sheet.write_row(0, 0, headers)
+                    line = 1
+                sheet.write_row(line, 0, row)
+                line += 1
+            progress(done, len(rows))
+    finally:
+        workbook.close()
+
+def write_parquet(path, headers, prepared, rows, progress, chunk_rows=CHUNK_ROWS):
+    # pyarrow opsional (tidak ada di requirement.txt); tanpa paket ini hanya Parquet yang ditolak
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Ekspor Parquet membutuhkan paket pyarrow")
+    writer = None
+    try:
+        # Satu row group per potongan
+        for done, chunk in chunks(prepared, rows, chunk_rows):
+            table = pa.table(dict(zip(headers, chunk)))
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            progress(done, len(rows))
+    finally:
+        if writer is not None:
+            writer.close()
+
+WRITERS = {'excel': write_excel, 'csv': write_csv, 'parquet': write_parquet}
+
+def export_columns(path, headers, arrays, rows=None, progress=None, chunk_rows=CHUNK_ROWS):
+    # Tulis kolom hasil (array NumPy atau Categorical) langsung ke file sesuai ekstensi.
+    # rows: indeks baris yang diekspor dan urutannya (mis. urutan/filter tabel hasil).
+    writer = WRITERS[export_format(path)]
+    if len(headers) != len(arrays):
+        raise ValueError("Jumlah header dan kolom tidak sama")
+    rows = np.arange(len(arrays[0]) if arrays else 0) if rows is None else np.asarray(rows)
+    writer(path, [str(header) for header in headers], prepare(arrays), rows,
+           progress or (lambda done, total: None), chunk_rows)
+    return len(rows)
+
+class ExportThread(QThread):
+    # Ekspor di thread latar agar GUI tetap responsif. progress dalam persen; saved
+    # membawa path file, failed membawa pesan kesalahan.
+    progress = pyqtSignal(int)
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path, headers, arrays, rows=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.headers = list(headers)
+        self.arrays = list(arrays)
+        self.rows = rows
+
+    def run(self):
+        try:
+            export_columns(self.path, self.headers, self.arrays, self.rows, self.report)
+        except Exception as e:
+            # Batas thread: kesalahan apa pun (termasuk FileCreateError xlsxwriter yang
+            # bukan OSError) dilaporkan lewat failed, bukan menghentikan aplikasi
+            self.failed.emit(str(e))
+            return
+        self.saved.emit(self.path)
+
+    def report(self, done, total):
+        self.progress.emit(int(100 * done / max(total, 1)))
@@ -0,0 +1,215 @@
+import numpy as np
+import pandas as pd
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableView, QLineEdit, QComboBox, QLabel, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# Jumlah baris yang diberikan ke view setiap kali view meminta baris tambahan
+FETCH_ROWS = 10000
+
+def column_values(series):
+    # Kategorikal tetap sebagai kode + kategori, kolom lain sebagai array NumPy
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.array
+    return series.to_numpy()
+
+def is_numeric(values):
+    return not isinstance(values, pd.Categorical) and values.dtype.kind in 'biuf'
+
+def sort_key(values):
+    # Kunci urut numerik untuk satu kolom: angka apa adanya, kategori/teks diganti
+    # dengan peringkat kategorinya (diurutkan sekali, bukan per baris)
+    if isinstance(values, pd.Categorical):
+        order = np.argsort(np.asarray(values.categories, dtype=str), kind='stable')
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        return np.where(values.codes < 0, -1, rank[values.codes])
+    if is_numeric(values):
+        return values
+    codes, _ = pd.factorize(values, sort=True)
+    return codes
+
+def parse_filter(text):
+    # "teks" -> cocok sebagian; ">= 4", "<3", "=5", "!=2" -> perbandingan angka
+    text = text.strip()
+    for operator in ('>=', '<=', '!=', '>', '<', '='):
+        if text.startswith(operator):
+            try:
+                return operator, float(text[len(operator):])
+            except ValueError:
+                break
+    return 'contains', text.lower()
+
+class FrameModel(QAbstractTableModel):
+    # Model tabel hasil langsung di atas array kolom DataFrame. Tidak ada objek per sel:
+    # data() membaca array[view[row]]. Urut dan filter hanya mengganti array indeks
+    # view (argsort/mask NumPy); baris diberikan ke view bertahap (fetchMore).
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.set_frame(None)
+
+    def set_frame(self, df):
+        self.beginResetModel()
+        self.frame = df
+        if df is None:
+            self.headers, self.arrays = [], []
+        else:
+            self.headers = [str(column) for column in df.columns]
+            self.arrays = [column_values(df[column]) for column in df.columns]
+        self.keys = {}
+        self.labels = {}
+        self.mask = None
+        self.sort_column, self.sort_order = None, Qt.AscendingOrder
+        self.view = np.arange(0 if df is None else len(df))
+        self.loaded = min(FETCH_ROWS, len(self.view))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.view)
+
+    def fetchMore(self, parent=QModelIndex()):
+        extra = min(FETCH_ROWS, len(self.view) - self.loaded)
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + extra - 1)
+        self.loaded += extra
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        values = self.arrays[index.column()]
+        if role == Qt.DisplayRole:
+            value = values[self.view[index.row()]]
+            if isinstance(value, (float, np.floating)):
+                return f"{value:g}"
+            return str(value)
+        if role == Qt.TextAlignmentRole and is_numeric(values):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def _key(self, column):
+        if column not in self.keys:
+            self.keys[column] = sort_key(self.arrays[column])
+        return self.keys[column]
+
+    def _labels(self, column):
+        # Label unik huruf kecil + kode per baris, dihitung sekali per kolom
+        if column not in self.labels:
+            values = self.arrays[column]
+            if isinstance(values, pd.Categorical):
+                codes, uniques = values.codes, values.categories
+            else:
+                codes, uniques = pd.factorize(values)
+            self.labels[column] = codes, pd.Index(uniques).astype(str).str.lower()
+        return self.labels[column]
+
+    def _rebuild(self):
+        rows = np.arange(len(self.frame)) if self.mask is None else np.flatnonzero(self.mask)
+        if self.sort_column is not None:
+            key = self._key(self.sort_column)[rows]
+            if self.sort_order == Qt.DescendingOrder:
+                # Urut menurun yang tetap stabil untuk nilai sama
+                key = -key.astype(np.float64) if key.dtype.kind == 'f' else -key.astype(np.int64)
+            rows = rows[np.argsort(key, kind='stable')]
+        self.beginResetModel()
+        self.view = rows
+        self.loaded = min(FETCH_ROWS, len(rows))
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if self.frame is None or not 0 <= column < len(self.headers):
+            return
+        self.sort_column, self.sort_order = column, order
+        self._rebuild()
+
+    def set_filter(self, column, text):
+        # Filter satu kolom; teks kosong menghapus filter
+        if self.frame is None:
+            return
+        self.mask = None if not text.strip() else self.filter_mask(column, text)
+        self._rebuild()
+
+    def filter_mask(self, column, text):
+        values = self.arrays[column]
+        operator, operand = parse_filter(text)
+        if operator == 'contains':
+            # Cocokkan label unik sekali, lalu petakan ke baris lewat kode
+            codes, labels = self._labels(column)
+            matches = np.asarray(labels.str.contains(operand, regex=False), dtype=bool)
+            return np.where(codes < 0, False, matches[np.maximum(codes, 0)])
+        if not is_numeric(values):
+            raise ValueError(f"Kolom {self.headers[column]} bukan angka")
+        comparisons = {'>=': np.greater_equal, '<=': np.less_equal, '!=': np.not_equal,
+                       '>': np.greater, '<': np.less, '=': np.equal}
+        return comparisons[operator](values, operand)
+
+    def visible_frame(self):
+        # DataFrame sesuai urutan dan filter yang sedang ditampilkan
+        if self.frame is None:
+            return None
+        return self.frame.iloc[self.view]
+
+class ResultView(QWidget):
+    # QTableView + baris filter; pengganti QTableWidget untuk tabel hasil besar
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Filter:"))
+        self.filter_column = QComboBox()
+        filter_layout.addWidget(self.filter_column)
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("teks, atau >= 4, < 3, = 5")
+        self.filter_input.returnPressed.connect(self.apply_filter)
+        filter_layout.addWidget(self.filter_input)
+        self.count_label = QLabel()
+        filter_layout.addWidget(self.count_label)
+        layout.addLayout(filter_layout)
+
+        self.model = FrameModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        # Tinggi baris seragam: view tidak perlu mengukur setiap baris
+        self.table.verticalHeader().setDefaultSectionSize(self.table.verticalHeader().minimumSectionSize() + 6)
+        layout.addWidget(self.table)
+
+    def set_frame(self, df):
+        self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.model.set_frame(df)
+        self.filter_column.clear()
+        self.filter_column.addItems(self.model.headers)
+        self.filter_input.clear()
+        self.update_count()
+
+    def clear(self):
+        self.set_frame(None)
+
+    def apply_filter(self):
+        try:
+            self.model.set_filter(self.filter_column.currentIndex(), self.filter_input.text())
+        except ValueError as e:
+            self.count_label.setText(str(e))
+            return
+        self.update_count()
+
+    def update_count(self):
+        total = 0 if self.model.frame is None else len(self.model.frame)
+        self.count_label.setText(f"{len(self.model.view):,} dari {total:,} baris")
+
+    def visible_frame(self):
+        return self.model.visible_frame()